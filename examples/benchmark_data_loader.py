@@ -0,0 +1,82 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+This example compares the throughput (batches/sec) of the transports
+available to the multiprocessing data loader.
+"""
+from itertools import islice
+
+import numpy as np
+
+from gluonts.dataset.common import ListDataset
+from gluonts.dataset.field_names import FieldName
+from gluonts.dataset.loader import TRANSPORTS, TrainDataLoader
+from gluonts.mx.batchify import batchify
+from gluonts.support.util import Timer
+from gluonts.transform import ExpectedNumInstanceSampler, InstanceSplitter
+
+num_series = 1_000
+series_length = 2_000
+batch_size = 256
+past_length = 500
+future_length = 100
+num_batches = 200
+
+
+def make_data_loader(transport: str, num_workers: int):
+    dataset = ListDataset(
+        [
+            {
+                FieldName.START: "2020-01-01",
+                FieldName.TARGET: np.random.normal(size=series_length),
+            }
+            for _ in range(num_series)
+        ],
+        freq="H",
+    )
+    transformation = InstanceSplitter(
+        target_field=FieldName.TARGET,
+        is_pad_field=FieldName.IS_PAD,
+        start_field=FieldName.START,
+        forecast_start_field=FieldName.FORECAST_START,
+        instance_sampler=ExpectedNumInstanceSampler(
+            num_instances=1.0, min_future=future_length
+        ),
+        past_length=past_length,
+        future_length=future_length,
+    )
+    return TrainDataLoader(
+        dataset,
+        transform=transformation,
+        batch_size=batch_size,
+        stack_fn=batchify,
+        num_workers=num_workers,
+        transport=transport,
+    )
+
+
+if __name__ == "__main__":
+    for num_workers in [1, 2, 4]:
+        for transport in TRANSPORTS:
+            data_loader = make_data_loader(transport, num_workers)
+            # the first batches include the worker start-up
+            for _ in islice(data_loader, 5):
+                pass
+            with Timer() as timer:
+                for _ in islice(data_loader, num_batches):
+                    pass
+            print(
+                f"num_workers={num_workers} transport={transport}: "
+                f"{num_batches / timer.interval:.1f} batches/sec"
+            )
@@ -0,0 +1,83 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+This example measures the time DeepAR takes to draw sample paths for
+different prediction lengths. Since each decoding step has constant cost,
+the time per step should stay roughly the same as the horizon grows.
+"""
+import mxnet as mx
+
+from gluonts.model.deepar._network import DeepARPredictionNetwork
+from gluonts.mx.distribution import StudentTOutput
+from gluonts.support.util import Timer
+from gluonts.time_feature import get_lags_for_frequency
+
+batch_size = 32
+num_parallel_samples = 100
+context_length = 168
+num_time_features = 4
+num_repetitions = 3
+
+
+def make_inputs(history_length: int, prediction_length: int):
+    return [
+        mx.nd.zeros((batch_size, 1)),
+        mx.nd.ones((batch_size, 1)),
+        mx.nd.random.normal(
+            shape=(batch_size, history_length, num_time_features)
+        ),
+        mx.nd.random.normal(shape=(batch_size, history_length)),
+        mx.nd.ones((batch_size, history_length)),
+        mx.nd.random.normal(
+            shape=(batch_size, prediction_length, num_time_features)
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    lags_seq = get_lags_for_frequency("H")
+    history_length = context_length + max(lags_seq)
+
+    for prediction_length in [24, 168, 720]:
+        network = DeepARPredictionNetwork(
+            num_parallel_samples=num_parallel_samples,
+            num_layers=2,
+            num_cells=40,
+            cell_type="lstm",
+            history_length=history_length,
+            context_length=context_length,
+            prediction_length=prediction_length,
+            distr_output=StudentTOutput(),
+            dropout_rate=0.0,
+            cardinality=[1],
+            embedding_dimension=[1],
+            lags_seq=lags_seq,
+        )
+        network.initialize()
+        network.hybridize()
+
+        inputs = make_inputs(history_length, prediction_length)
+        # the first call includes building the graph
+        network(*inputs).wait_to_read()
+
+        with Timer() as timer:
+            for _ in range(num_repetitions):
+                network(*inputs).wait_to_read()
+        seconds = timer.interval / num_repetitions
+
+        print(
+            f"prediction_length={prediction_length}: "
+            f"{seconds:.2f} sec/batch, "
+            f"{1000 * seconds / prediction_length:.2f} ms/step"
+        )
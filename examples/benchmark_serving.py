@@ -0,0 +1,111 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+This example compares the latency and throughput of the Flask/gunicorn
+scoring service with the ASGI one, for many concurrent small requests.
+
+The ASGI service requires `uvicorn`.
+"""
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import Process
+from pathlib import Path
+
+import numpy as np
+import requests
+
+from gluonts.model.trivial.mean import MeanPredictor
+from gluonts.shell.env import ServeEnv
+from gluonts.shell.serve import Settings, make_asgi_app, run_asgi_app
+from gluonts.testutil.shell import ServerFacade, free_port, temporary_server
+
+num_requests = 1_000
+concurrency = 32
+series_per_request = 2
+series_length = 500
+
+
+@contextmanager
+def temporary_asgi_server(env, settings):
+    app = make_asgi_app(env, None, settings)
+    process = Process(target=run_asgi_app, args=(app, settings))
+    process.start()
+
+    endpoint = ServerFacade(
+        f"http://{settings.sagemaker_server_address}:"
+        f"{settings.sagemaker_server_port}"
+    )
+    for _ in range(50):
+        if endpoint.ping():
+            break
+        time.sleep(0.2)
+    else:
+        raise TimeoutError("Failed to start the ASGI server")
+
+    yield endpoint
+
+    process.terminate()
+    process.join()
+
+
+def run_requests(server: ServerFacade):
+    entries = [
+        {
+            "start": "2020-01-01",
+            "target": list(np.random.normal(size=series_length)),
+        }
+        for _ in range(series_per_request)
+    ]
+    configuration = {"output_types": ["mean", "quantiles"]}
+
+    def invoke(_):
+        start = time.time()
+        response = requests.post(
+            server.url("/invocations"),
+            json={"instances": entries, "configuration": configuration},
+        )
+        assert response.status_code == 200
+        return time.time() - start
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.array(list(executor.map(invoke, range(num_requests))))
+    duration = time.time() - start
+
+    return (
+        f"{num_requests / duration:.1f} requests/sec, "
+        f"p50 {1000 * np.percentile(latencies, 50):.1f} ms, "
+        f"p99 {1000 * np.percentile(latencies, 99):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base:
+        env = ServeEnv(Path(base))
+        MeanPredictor(prediction_length=24, freq="H").serialize(env.path.model)
+
+        settings = Settings(sagemaker_server_port=free_port())
+        with temporary_server(env, None, settings) as server:
+            print(f"flask/gunicorn: {run_requests(server)}")
+
+        try:
+            import uvicorn  # noqa: F401
+        except ImportError:
+            print("asgi: skipped, uvicorn is not installed")
+        else:
+            settings = Settings(sagemaker_server_port=free_port())
+            with temporary_asgi_server(env, settings) as server:
+                print(f"asgi: {run_requests(server)}")
@@ -0,0 +1,130 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+This example measures the startup time and memory usage of the gunicorn
+scoring service for different numbers of workers, with and without
+preloading the predictor (the GLUONTS_PRELOAD setting).
+
+Startup time is the time until the server responds, plus the time to serve
+a first round of concurrent requests, which includes the initialization that
+workers do on their first request. Memory is summed over the master and
+worker processes: RSS counts shared pages once per process, PSS splits them
+between the processes sharing them. Requires Linux.
+"""
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process
+from pathlib import Path
+
+import numpy as np
+
+from gluonts.dataset.common import ListDataset
+from gluonts.model.simple_feedforward import SimpleFeedForwardEstimator
+from gluonts.mx.trainer import Trainer
+from gluonts.shell.env import ServeEnv
+from gluonts.shell.serve import Settings, make_gunicorn_app
+from gluonts.testutil.shell import ServerFacade, free_port
+
+freq = "H"
+prediction_length = 24
+
+
+def train_predictor(path: Path) -> None:
+    dataset = ListDataset(
+        [
+            {"start": "2020-01-01", "target": np.random.normal(size=500)}
+            for _ in range(10)
+        ],
+        freq=freq,
+    )
+    estimator = SimpleFeedForwardEstimator(
+        freq=freq,
+        prediction_length=prediction_length,
+        num_hidden_dimensions=[512, 512],
+        trainer=Trainer(epochs=1, num_batches_per_epoch=1),
+    )
+    estimator.train(dataset).serialize(path)
+
+
+def serve(env: ServeEnv, settings: Settings) -> None:
+    make_gunicorn_app(env, None, settings).run()
+
+
+def memory_usage(pid: int):
+    with open(f"/proc/{pid}/task/{pid}/children") as children_file:
+        pids = [pid] + [int(child) for child in children_file.read().split()]
+
+    rss = pss = 0
+    for process_id in pids:
+        with open(f"/proc/{process_id}/smaps_rollup") as smaps:
+            for line in smaps:
+                name, value = line.split()[:2]
+                if name == "Rss:":
+                    rss += int(value)
+                elif name == "Pss:":
+                    pss += int(value)
+    return rss / 1024, pss / 1024
+
+
+def measure(env: ServeEnv, num_workers: int, preload: bool) -> str:
+    settings = Settings(
+        sagemaker_server_port=free_port(),
+        model_server_workers=num_workers,
+        gluonts_preload=preload,
+    )
+    server = ServerFacade(
+        f"http://{settings.sagemaker_server_address}:"
+        f"{settings.sagemaker_server_port}"
+    )
+    entry = {"start": "2020-01-01", "target": np.random.normal(size=500)}
+    configuration = {"output_types": ["mean"]}
+
+    start = time.time()
+    process = Process(target=serve, args=(env, settings))
+    process.start()
+    try:
+        while not server.ping():
+            time.sleep(0.05)
+        ready = time.time() - start
+
+        with ThreadPoolExecutor(max_workers=4 * num_workers) as executor:
+            list(
+                executor.map(
+                    lambda _: server.invocations([entry], configuration),
+                    range(4 * num_workers),
+                )
+            )
+        first_requests = time.time() - start - ready
+
+        rss, pss = memory_usage(process.pid)
+    finally:
+        process.terminate()
+        process.join()
+
+    return (
+        f"workers={num_workers:2d} preload={preload!s:5}: "
+        f"ready after {ready:.2f}s, first requests took "
+        f"{first_requests:.2f}s, RSS {rss:.0f} MB, PSS {pss:.0f} MB"
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base:
+        env = ServeEnv(Path(base))
+        train_predictor(env.path.model)
+
+        for num_workers in [1, 4, 16]:
+            for preload in [False, True]:
+                print(measure(env, num_workers, preload))
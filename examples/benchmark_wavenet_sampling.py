@@ -0,0 +1,183 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+This example compares the throughput of the WaveNet sampler, which keeps the
+past inputs of each layer as a ring of time steps, with the previous sampler,
+which shifts a queue per layer by concatenating and slicing it in every step.
+Both are run with the same parameters and a temperature of 0, so that their
+samples can be checked for equality.
+"""
+import mxnet as mx
+import numpy as np
+
+from gluonts.model.wavenet._network import WaveNet, WaveNetSampler
+from gluonts.mx.util import copy_parameters
+from gluonts.support.util import Timer
+
+batch_size = 8
+pred_length = 24
+dilation_depth = 9
+num_time_features = 5
+num_bins = 1024
+num_repetitions = 3
+
+
+class QueueWaveNetSampler(WaveNetSampler):
+    """
+    The previous implementation of the sampling loop, for comparison.
+    """
+
+    def hybrid_forward(
+        self,
+        F,
+        feat_static_cat,
+        past_target,
+        past_observed_values,
+        past_time_feat,
+        future_time_feat,
+        scale,
+    ):
+        def blow_up(u):
+            return F.repeat(u, repeats=self.num_samples, axis=0)
+
+        past_target = past_target.astype("int32")
+        full_features = self.get_full_features(
+            F,
+            feat_static_cat=feat_static_cat,
+            past_observed_values=past_observed_values,
+            past_time_feat=past_time_feat,
+            future_time_feat=future_time_feat,
+            future_observed_values=None,
+            scale=scale,
+        )
+        features_end_ix = (
+            -self.pred_length + 1 if self.pred_length > 1 else None
+        )
+        queues = self.get_initial_conv_queues(
+            F,
+            past_target=F.slice_axis(
+                past_target, begin=-self.receptive_field, end=None, axis=-1
+            ),
+            features=F.slice_axis(
+                full_features,
+                begin=-self.pred_length - self.receptive_field + 1,
+                end=features_end_ix,
+                axis=-1,
+            ),
+        )
+        queues = [blow_up(queue) for queue in queues]
+
+        res = blow_up(F.slice_axis(past_target, begin=-2, end=None, axis=-1))
+        for n in range(self.pred_length):
+            current_target = F.slice_axis(res, begin=-2, end=None, axis=-1)
+            current_features = F.slice_axis(
+                full_features,
+                begin=self.receptive_field + n - 1,
+                end=self.receptive_field + n + 1,
+                axis=-1,
+            )
+            embedding = self.target_feature_embedding(
+                F,
+                target=current_target,
+                features=blow_up(current_features),
+            )
+            unnormalized_outputs, queues = self.base_net(
+                F, embedding, one_step_prediction=True, queues=queues
+            )
+            y = F.argmax(unnormalized_outputs, axis=-1).astype("int32")
+            res = F.concat(res, y, num_args=2, dim=-1)
+        samples = F.slice_axis(res, begin=-self.pred_length, end=None, axis=-1)
+        samples = samples.reshape(
+            shape=(-1, self.num_samples, self.pred_length)
+        )
+        samples = self.post_transform(samples)
+        return F.broadcast_mul(scale.expand_dims(axis=1), samples)
+
+
+def make_network(cls, num_samples: int) -> WaveNetSampler:
+    network = cls(
+        bin_values=np.linspace(0, 10, num_bins).tolist(),
+        num_samples=num_samples,
+        temperature=0.0,
+        n_residue=24,
+        n_skip=32,
+        dilation_depth=dilation_depth,
+        n_stacks=1,
+        act_type="elu",
+        cardinality=[1],
+        embedding_dimension=5,
+        pred_length=pred_length,
+    )
+    network.initialize()
+    return network
+
+
+def make_inputs():
+    receptive_field = WaveNet.get_receptive_field(
+        dilation_depth=dilation_depth, n_stacks=1
+    )
+    return [
+        mx.nd.zeros((batch_size, 1)),
+        mx.nd.random.randint(
+            0, num_bins, shape=(batch_size, receptive_field)
+        ).astype("float32"),
+        mx.nd.ones((batch_size, receptive_field)),
+        mx.nd.random.normal(
+            shape=(batch_size, num_time_features, receptive_field)
+        ),
+        mx.nd.random.normal(
+            shape=(batch_size, num_time_features, pred_length)
+        ),
+        mx.nd.ones((batch_size, 1)),
+    ]
+
+
+def measure(network, inputs) -> float:
+    # the first call includes building the graph
+    network(*inputs).wait_to_read()
+
+    with Timer() as timer:
+        for _ in range(num_repetitions):
+            network(*inputs).wait_to_read()
+    return timer.interval / num_repetitions
+
+
+if __name__ == "__main__":
+    inputs = make_inputs()
+
+    for num_samples in [100, 500]:
+        for hybridize in [False, True]:
+            ring = make_network(WaveNetSampler, num_samples)
+            queue = make_network(QueueWaveNetSampler, num_samples)
+            # initializes the parameters with deferred initialization
+            ring(*inputs)
+            copy_parameters(ring, queue)
+            if hybridize:
+                ring.hybridize()
+                queue.hybridize()
+
+            assert np.array_equal(
+                ring(*inputs).asnumpy(), queue(*inputs).asnumpy()
+            )
+
+            ring_seconds = measure(ring, inputs)
+            queue_seconds = measure(queue, inputs)
+            num_paths = batch_size * num_samples
+
+            print(
+                f"num_samples={num_samples}, hybridize={hybridize}: "
+                f"rings {num_paths / ring_seconds:.0f} paths/sec, "
+                f"queues {num_paths / queue_seconds:.0f} paths/sec, "
+                f"speedup {queue_seconds / ring_seconds:.2f}x"
+            )
@@ -217,6 +217,7 @@ setup_kwargs: dict = dict(
         "docs": docs_require,
         "R": find_requirements("requirements-extras-r.txt"),
         "Prophet": find_requirements("requirements-extras-prophet.txt"),
+        "arrow": find_requirements("requirements-extras-arrow.txt"),
         "shell": shell_require,
     },
     entry_points=dict(
@@ -0,0 +1,341 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+Columnar on-disk format for datasets, based on the Arrow IPC file format.
+
+Time series fields are stored as contiguous buffers with offsets. Files are
+memory-mapped when read, and the arrays of each entry are zero-copy
+(read-only) numpy views into the mapped file, so that no parsing or
+conversion happens per epoch, and forked data loader workers share the
+same pages.
+
+Requires the ``pyarrow`` package.
+"""
+
+import shutil
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from gluonts.core.exception import GluonTSDataError
+from gluonts.dataset.field_names import FieldName
+from gluonts.dataset.jsonl import JsonLinesFile, Line, Span
+from gluonts.dataset.util import find_files, get_bounds_for_mp_data_loading
+
+USAGE_MESSAGE = """
+Cannot import `pyarrow`.
+
+The Arrow dataset format requires `pyarrow`, which can be installed with
+
+    pip install pyarrow
+"""
+
+# dtypes used for the array fields, matching the ones `ProcessDataEntry`
+# converts to, so that processing entries does not copy them
+FIELD_DTYPES = {
+    FieldName.TARGET: np.float32,
+    FieldName.FEAT_DYNAMIC_CAT: np.int32,
+    FieldName.FEAT_DYNAMIC_REAL: np.float32,
+    FieldName.PAST_FEAT_DYNAMIC_REAL: np.float32,
+    FieldName.FEAT_STATIC_CAT: np.int32,
+    FieldName.FEAT_STATIC_REAL: np.float32,
+    "dynamic_feat": np.float32,
+}
+
+ARROW_SUFFIX = ".arrow"
+
+# suffixes of the JSON Lines files replaced by `ARROW_SUFFIX` when converting
+JSON_SUFFIXES = [".gz", ".json"]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise ImportError(USAGE_MESSAGE)
+    return pyarrow
+
+
+def _encode_field(name: str, value):
+    if name in FIELD_DTYPES and value is not None:
+        return np.asarray(value, dtype=FIELD_DTYPES[name])
+    if name == FieldName.START and value is not None:
+        return str(value)
+    return value
+
+
+def _to_arrow_array(pa, values: List):
+    arrays = [value for value in values if value is not None]
+
+    if arrays and isinstance(arrays[0], np.ndarray):
+        value_type = pa.from_numpy_dtype(arrays[0].dtype)
+        if arrays[0].ndim == 1:
+            return pa.array(values, type=pa.list_(value_type))
+        return pa.array(
+            [None if value is None else list(value) for value in values],
+            type=pa.list_(pa.list_(value_type)),
+        )
+
+    return pa.array(values)
+
+
+def write_arrow(
+    entries: Iterable[Dict], path: Path, chunk_size: int = 10_000
+) -> None:
+    """
+    Write data entries to ``path`` in the Arrow format.
+
+    Array fields are stored as (nested) lists of the dtype listed in
+    ``FIELD_DTYPES``; 2-dimensional fields like multivariate targets are
+    stored as lists of rows. All other fields are stored as inferred by
+    ``pyarrow``, except for ``start``, which is stored as a string.
+
+    Parameters
+    ----------
+    entries
+        Data entries to write. Fields which are missing in some of the
+        entries are stored as nulls for them; however, all fields have to
+        occur within the first ``chunk_size`` entries, and each field has
+        to have the same type in all entries.
+    path
+        File to write to.
+    chunk_size
+        Number of entries per record batch.
+    """
+    pa = _pyarrow()
+    entries = iter(entries)
+    schema = writer = None
+
+    try:
+        while True:
+            chunk = list(islice(entries, chunk_size))
+            if not chunk:
+                break
+
+            # fields in order of their first occurrence
+            names = list(
+                dict.fromkeys(name for entry in chunk for name in entry)
+            )
+            arrays = [
+                _to_arrow_array(
+                    pa,
+                    [_encode_field(name, entry.get(name)) for entry in chunk],
+                )
+                for name in names
+            ]
+
+            if writer is None:
+                batch = pa.RecordBatch.from_arrays(arrays, names=names)
+                schema = batch.schema
+                writer = pa.ipc.new_file(str(path), schema)
+            else:
+                batch = _conform_to_schema(
+                    pa, schema, dict(zip(names, arrays)), len(chunk)
+                )
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _conform_to_schema(pa, schema, arrays: Dict, num_rows: int):
+    unknown = set(arrays) - set(schema.names)
+    if unknown:
+        raise GluonTSDataError(
+            f"Fields {sorted(unknown)} do not occur in the first chunk of "
+            f"entries."
+        )
+
+    columns = []
+    for field in schema:
+        array = arrays.get(field.name)
+        if array is None:
+            array = pa.nulls(num_rows, type=field.type)
+        elif array.type != field.type:
+            try:
+                array = array.cast(field.type)
+            except pa.ArrowException:
+                raise GluonTSDataError(
+                    f"Field {field.name!r} has type {array.type}, but "
+                    f"{field.type} in the first chunk of entries."
+                )
+        columns.append(array)
+
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _column_decoder(pa, column) -> Callable[[int], object]:
+    """
+    Return a function which returns the value of the given row of an Arrow
+    array, as a numpy view for (nested) lists of numbers.
+    """
+    is_null = column.is_null().to_numpy(zero_copy_only=False)
+
+    def with_nulls(decode):
+        if not is_null.any():
+            return decode
+        return lambda row: None if is_null[row] else decode(row)
+
+    if pa.types.is_list(column.type):
+        offsets = column.offsets.to_numpy()
+        values = column.values
+        value_type = values.type
+
+        if pa.types.is_integer(value_type) or pa.types.is_floating(value_type):
+            flat = values.to_numpy()
+            return with_nulls(
+                lambda row: flat[offsets[row] : offsets[row + 1]]
+            )
+
+        if pa.types.is_list(value_type) and (
+            pa.types.is_integer(value_type.value_type)
+            or pa.types.is_floating(value_type.value_type)
+        ):
+            inner_offsets = values.offsets.to_numpy()
+            flat = values.values.to_numpy()
+
+            def decode_2d(row):
+                first, last = offsets[row], offsets[row + 1]
+                start, end = inner_offsets[first], inner_offsets[last]
+                return flat[start:end].reshape(last - first, -1)
+
+            return with_nulls(decode_2d)
+
+    values = column.to_pylist()
+    return values.__getitem__
+
+
+class ArrowFile:
+    """
+    An iterable type that draws from a memory-mapped Arrow file, as written
+    by ``write_arrow``.
+
+    Like ``JsonLinesFile``, each data loader worker only iterates over its
+    own segment of the file.
+
+    Parameters
+    ----------
+    path
+        Path of the file to load data from.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._batches: Optional[List] = None
+        self._decoders: Dict[int, Dict[str, Callable]] = {}
+
+    def _open(self) -> List:
+        if self._batches is None:
+            pa = _pyarrow()
+            source = pa.memory_map(str(self.path), "r")
+            reader = pa.ipc.open_file(source)
+            self._batches = [
+                reader.get_batch(i) for i in range(reader.num_record_batches)
+            ]
+        return self._batches
+
+    def _batch_decoders(self, batch_no: int) -> Dict[str, Callable]:
+        if batch_no not in self._decoders:
+            pa = _pyarrow()
+            batch = self._open()[batch_no]
+            self._decoders[batch_no] = {
+                name: _column_decoder(pa, column)
+                for name, column in zip(batch.schema.names, batch.columns)
+            }
+        return self._decoders[batch_no]
+
+    def _entries(self, lower: int, upper: int) -> Iterator[Line]:
+        line_number = 0
+        for batch_no, batch in enumerate(self._open()):
+            begin = max(lower - line_number, 0)
+            end = min(upper - line_number, batch.num_rows)
+            if begin < end:
+                decoders = self._batch_decoders(batch_no)
+                for row in range(begin, end):
+                    yield Line(
+                        {
+                            name: decode(row)
+                            for name, decode in decoders.items()
+                        },
+                        span=Span(path=self.path, line=line_number + row),
+                    )
+            line_number += batch.num_rows
+
+    def __iter__(self) -> Iterator[Line]:
+        bounds = get_bounds_for_mp_data_loading(len(self))
+        yield from self._entries(bounds.lower, bounds.upper)
+
+    def __getitem__(self, line_number: int) -> Line:
+        if not 0 <= line_number < len(self):
+            raise IndexError(f"line {line_number} out of range")
+        return next(self._entries(line_number, line_number + 1))
+
+    def __len__(self) -> int:
+        return sum(batch.num_rows for batch in self._open())
+
+
+def _arrow_name(path: Path) -> str:
+    name = path.name
+    for suffix in JSON_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return name + ARROW_SUFFIX
+
+
+def convert_to_arrow(
+    dataset_path: Path, output_path: Path, chunk_size: int = 10_000
+) -> None:
+    """
+    Convert a dataset in the layout written by ``TrainDatasets.save`` into
+    the Arrow format.
+
+    The metadata is copied as is, and the JSON Lines files of the ``train``
+    and ``test`` splits are converted into one Arrow file each. The result
+    can be loaded with ``load_datasets`` or ``FileDataset``.
+
+    Parameters
+    ----------
+    dataset_path
+        Directory containing ``metadata``, ``train`` and optionally ``test``.
+    output_path
+        Directory to write the converted dataset to.
+    chunk_size
+        Number of entries per record batch.
+    """
+    # deferred import, since `common` imports this module
+    from gluonts.dataset.common import FileDataset
+
+    dataset_path, output_path = Path(dataset_path), Path(output_path)
+
+    shutil.copytree(dataset_path / "metadata", output_path / "metadata")
+
+    for split in ["train", "test"]:
+        if not (dataset_path / split).exists():
+            continue
+
+        (output_path / split).mkdir(parents=True)
+
+        for path in find_files(dataset_path / split, FileDataset.is_valid):
+            arrow_path = output_path / split / _arrow_name(path)
+            if arrow_path.exists():
+                raise GluonTSDataError(
+                    f"Cannot convert {path}, since {arrow_path} was already "
+                    f"written for another file."
+                )
+
+            entries = (line.content for line in JsonLinesFile(path))
+            write_arrow(entries, arrow_path, chunk_size)
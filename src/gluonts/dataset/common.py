@@ -33,7 +33,7 @@ import pydantic
 from pandas.tseries.offsets import Tick
 
 from gluonts.core.exception import GluonTSDataError
-from gluonts.dataset import jsonl, util
+from gluonts.dataset import arrow, jsonl, util
 
 # Dictionary used for data flowing through the transformations.
 DataEntry = Dict[str, Any]
@@ -140,10 +140,14 @@ class FileDataset(Dataset):
     """
     Dataset that loads JSON Lines files contained in a path.
 
+    Files with the suffix ``.arrow`` are read as memory-mapped Arrow files
+    instead, see :mod:`gluonts.dataset.arrow`.
+
     Parameters
     ----------
     path
-        Path containing the dataset files. Each file is considered
+        Path of a dataset file, or of a directory containing the dataset
+        files. Each file is considered
         and should be valid to the exception of files starting with '.'
         or ending with '_SUCCESS'. A valid line in a file can be for
         instance: {"start": "2014-09-07", "target": [0.1, 0.2]}.
@@ -154,6 +158,11 @@ class FileDataset(Dataset):
         Whether to accept only univariate target time series.
     cache
         Indicates whether the dataset should be cached or not.
+    use_index
+        Whether to keep an index of line offsets next to each file, which
+        makes ``len`` free and lets data loader workers seek directly to
+        their part of each file. Indices are (re)built when the dataset is
+        created, and only if a file changed since.
     """
 
     def __init__(
@@ -162,6 +171,7 @@ class FileDataset(Dataset):
         freq: str,
         one_dim_target: bool = True,
         cache: bool = False,
+        use_index: bool = False,
     ) -> None:
         self.cache = cache
         self.path = path
@@ -173,18 +183,48 @@ class FileDataset(Dataset):
 
         # necessary, in order to preserve the cached datasets, in case caching was enabled
         self._json_line_files = [
-            jsonl.JsonLinesFile(path=path, cache=cache)
+            arrow.ArrowFile(path=path)
+            if path.suffix == arrow.ARROW_SUFFIX
+            else jsonl.JsonLinesFile(
+                path=path, cache=cache, use_index=use_index
+            )
             for path in self.files()
         ]
 
+        if use_index:
+            # build the indices once here, rather than in every worker
+            self.len_per_file()
+
+    def _process_line(self, line: jsonl.Line) -> DataEntry:
+        data = self.process(line.content)
+        data["source"] = SourceContext(
+            source=line.span.path, row=line.span.line
+        )
+        return data
+
     def __iter__(self) -> Iterator[DataEntry]:
         for json_line_file in self._json_line_files:
             for line in json_line_file:
-                data = self.process(line.content)
-                data["source"] = SourceContext(
-                    source=line.span.path, row=line.span.line
-                )
-                yield data
+                yield self._process_line(line)
+
+    def __getitem__(self, idx: int) -> DataEntry:
+        """
+        Random access to the entries of the dataset, across all files.
+
+        Uses the line index of each file (see ``use_index``); without it,
+        the index of a file is built in memory on first access.
+        """
+        if idx < 0:
+            idx += len(self)
+
+        for json_line_file, file_len in zip(
+            self._json_line_files, self.len_per_file()
+        ):
+            if 0 <= idx < file_len:
+                return self._process_line(json_line_file[idx])
+            idx -= file_len
+
+        raise IndexError("dataset index out of range")
 
     # Returns array of the sizes for each subdataset per file
     def len_per_file(self):
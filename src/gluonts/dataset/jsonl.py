@@ -13,8 +13,13 @@
 
 import functools
 import gzip
+import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import NamedTuple
+from typing import NamedTuple, Optional
+
+import numpy as np
 
 from gluonts import json
 from gluonts.core.exception import GluonTSDataError
@@ -31,6 +36,96 @@ def dump(objects, file_obj):
         file_obj.writeline(json.dumps(object_))
 
 
+logger = logging.getLogger(__name__)
+
+# 1MB
+BUF_SIZE = 1024 ** 2
+
+
+def line_index_path(path: Path) -> Path:
+    """
+    Return the path of the line index of the JSON Lines file at ``path``.
+
+    The index is stored next to the file as a hidden file, which is ignored
+    by ``FileDataset``.
+    """
+    return path.parent / f".{path.name}.index.npz"
+
+
+def build_line_index(path: Path) -> np.ndarray:
+    """
+    Compute the byte offsets of all lines in the file at ``path``.
+
+    For gzipped files, the offsets refer to the decompressed content.
+
+    Returns
+    -------
+    np.ndarray
+        Array of length ``num_lines + 1``, where line ``i`` spans the bytes
+        ``offsets[i]:offsets[i + 1]``, including its trailing newline.
+    """
+    open_ = gzip.open if path.suffix == ".gz" else open
+    ends = []
+    position = 0
+
+    with open_(path, "rb") as file_obj:
+        for chunk in iter(functools.partial(file_obj.read, BUF_SIZE), b""):
+            buffer = np.frombuffer(chunk, dtype=np.uint8)
+            ends.append(np.flatnonzero(buffer == ord("\n")) + position + 1)
+            position += len(chunk)
+
+    offsets = np.concatenate([np.zeros(1, dtype=np.int64), *ends])
+    # the last line may lack a trailing newline
+    if offsets[-1] != position:
+        offsets = np.append(offsets, position)
+    return offsets.astype(np.int64)
+
+
+def load_line_index(path: Path, persist: bool = True) -> np.ndarray:
+    """
+    Load the line index of ``path`` from its sidecar file, or build it.
+
+    The sidecar file is only used if the size and modification time of
+    ``path`` match the ones recorded when the index was built. If
+    ``persist`` is set, a rebuilt index is written to the sidecar file,
+    unless the directory is not writable.
+    """
+    stat = path.stat()
+    index_path = line_index_path(path)
+
+    try:
+        with np.load(index_path) as index:
+            if (
+                int(index["size"]) == stat.st_size
+                and int(index["mtime_ns"]) == stat.st_mtime_ns
+            ):
+                return index["offsets"]
+    except (OSError, KeyError, ValueError):
+        pass
+
+    offsets = build_line_index(path)
+
+    if persist:
+        try:
+            # write to a temporary file first, so that concurrent readers
+            # never see a partially written index
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as file_obj:
+                np.savez(
+                    file_obj,
+                    offsets=offsets,
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                )
+            os.replace(tmp_path, index_path)
+        except OSError:
+            logger.info(f"Could not write line index for `{path}`.")
+
+    return offsets
+
+
 class Span(NamedTuple):
     path: Path
     line: int
@@ -50,43 +145,85 @@ class JsonLinesFile:
     path
         Path of the file to load data from. This should be a valid
         JSON Lines file.
+    cache
+        Indicates whether the parsed lines should be kept in memory.
+    use_index
+        Whether to use a line index with the byte offsets of all lines,
+        which is stored next to the file (see ``load_line_index``). With
+        the index, the length of the file is known without reading it, and
+        each worker seeks directly to its part of the file.
     """
 
-    def __init__(self, path: Path, cache: bool = False) -> None:
+    def __init__(
+        self, path: Path, cache: bool = False, use_index: bool = False
+    ) -> None:
         self.path = path
         self.open = gzip.open if path.suffix == ".gz" else open
         self.cache = cache
+        self.use_index = use_index
         self._len = None
+        self._offsets: Optional[np.ndarray] = None
         self._data_cache: list = []
 
+    def offsets(self) -> np.ndarray:
+        """
+        Byte offsets of the lines in the file, see ``build_line_index``.
+        """
+        if self._offsets is None:
+            self._offsets = load_line_index(self.path, persist=self.use_index)
+        return self._offsets
+
+    def _parse(self, raw, line_number: int) -> Line:
+        span = Span(path=self.path, line=line_number)
+        try:
+            return Line(json.loads(raw), span=span)
+        except ValueError:
+            raise GluonTSDataError(
+                f"Could not read json line {line_number}, {raw}"
+            )
+
+    def __getitem__(self, line_number: int) -> Line:
+        offsets = self.offsets()
+        if not 0 <= line_number < len(offsets) - 1:
+            raise IndexError(f"line {line_number} out of range")
+
+        start, end = offsets[line_number], offsets[line_number + 1]
+        with self.open(self.path, "rb") as jsonl_file:
+            jsonl_file.seek(start)
+            return self._parse(jsonl_file.read(end - start), line_number)
+
     def __iter__(self):
         # Basic idea is to split the dataset into roughly equally sized segments
         # with lower and upper bound, where each worker is assigned one segment
         bounds = get_bounds_for_mp_data_loading(len(self))
-        if not self.cache or (self.cache and not self._data_cache):
+        if self.use_index and not (self.cache and self._data_cache):
+            offsets = self.offsets()
+            with self.open(self.path, "rb") as jsonl_file:
+                jsonl_file.seek(offsets[bounds.lower])
+                for line_number in range(bounds.lower, bounds.upper):
+                    parsed_line = self._parse(
+                        jsonl_file.readline(), line_number
+                    )
+                    if self.cache:
+                        self._data_cache.append(parsed_line)
+                    yield parsed_line
+        elif not self.cache or (self.cache and not self._data_cache):
             with self.open(self.path) as jsonl_file:
                 for line_number, raw in enumerate(jsonl_file):
                     if not bounds.lower <= line_number < bounds.upper:
                         continue
 
-                    span = Span(path=self.path, line=line_number)
-                    try:
-                        parsed_line = Line(json.loads(raw), span=span)
-                        if self.cache:
-                            self._data_cache.append(parsed_line)
-                        yield parsed_line
-                    except ValueError:
-                        raise GluonTSDataError(
-                            f"Could not read json line {line_number}, {raw}"
-                        )
+                    parsed_line = self._parse(raw, line_number)
+                    if self.cache:
+                        self._data_cache.append(parsed_line)
+                    yield parsed_line
         else:
             yield from self._data_cache
 
     def __len__(self):
-        if self._len is None:
-            # 1MB
-            BUF_SIZE = 1024 ** 2
-
+        if self._len is None and self.use_index:
+            self._len = len(self.offsets()) - 1
+        elif self._len is None:
             with self.open(self.path, "rb") as file_obj:
                 read_chunk = functools.partial(file_obj.read, BUF_SIZE)
                 file_len = sum(
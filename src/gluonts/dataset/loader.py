@@ -18,10 +18,14 @@ import multiprocessing as mp
 import pickle
 import random
 import sys
+import time
+import weakref
+from collections import deque
 from multiprocessing.reduction import ForkingPickler
 from queue import Empty
 from typing import Callable, Iterable, Iterator, List, Optional
 
+from gluonts.core.exception import GluonTSDataError
 from gluonts.dataset.common import DataBatch, DataEntry, Dataset
 from gluonts.dataset.util import MPWorkerInfo
 from gluonts.itertools import batcher, Cyclic, IterableSlice, PseudoShuffled
@@ -30,7 +34,260 @@ from gluonts.transform import Transformation, TransformedDataset
 logger = logging.getLogger(__name__)
 
 
+class QueueTransport:
+    """
+    Transports stacked batches from worker processes to the main process
+    through a queue hosted by a ``multiprocessing.Manager``.
+
+    Each batch is pickled in the worker and unpickled in the main process;
+    both the request and the payload pass through the manager's server
+    process.
+    """
+
+    def __init__(self, num_workers: int, max_queue_size: int) -> None:
+        self.manager = mp.Manager()
+        self.batch_queue = self.manager.Queue(maxsize=max_queue_size)
+        # incremented whenever a worker is restarted, so that batches still
+        # in flight from its predecessor can be told apart
+        self.generations = [0] * num_workers
+
+    def put(
+        self, worker_id: int, batch, should_stop: Callable[[], bool]
+    ) -> bool:
+        buf = io.BytesIO()
+        ForkingPickler(buf, pickle.HIGHEST_PROTOCOL).dump(
+            (worker_id, self.generations[worker_id], batch)
+        )
+        self.batch_queue.put(buf.getvalue())
+        return True
+
+    def get(self, timeout: float):
+        worker_id, generation, batch = pickle.loads(
+            self.batch_queue.get(timeout=timeout)
+        )
+        if generation != self.generations[worker_id]:
+            return None
+        return worker_id, batch
+
+    def restart_worker(self, worker_id: int) -> None:
+        self.generations[worker_id] += 1
+
+    def finish_worker(self, terminated: bool) -> None:
+        pass
+
+    def drain(self) -> None:
+        try:
+            batch = self.batch_queue.get(block=False)
+            while batch:
+                self.batch_queue.get(block=False)
+        except (Empty, FileNotFoundError, EOFError, ConnectionError):
+            pass
+
+    def close(self) -> None:
+        pass
+
+
+class SharedMemoryTransport:
+    """
+    Transports stacked batches from worker processes to the main process
+    through preallocated shared memory.
+
+    Every worker owns a ring of ``slots_per_worker`` fixed-size slots in a
+    single ``multiprocessing.shared_memory`` block. A worker pickles a batch
+    into its next free slot and only sends a small descriptor
+    ``(worker_id, generation, slot, num_bytes)`` to the main process over a
+    pipe-backed queue; the main process unpickles straight from the shared
+    buffer and hands the slot back to the worker. Batches that do not fit
+    into a slot are sent inline through the pipe instead.
+
+    Requires Python 3.8 or newer.
+
+    Parameters
+    ----------
+    num_workers
+        Number of worker processes writing to the transport.
+    max_queue_size
+        Total number of slots, i.e. the maximum number of batches in flight.
+    slot_size
+        Size of each slot in bytes.
+    """
+
+    def __init__(
+        self, num_workers: int, max_queue_size: int, slot_size: int
+    ) -> None:
+        from multiprocessing import shared_memory
+
+        self.num_workers = num_workers
+        self.slots_per_worker = max(1, max_queue_size // num_workers)
+        self.slot_size = slot_size
+
+        self.shm = shared_memory.SharedMemory(
+            create=True,
+            size=num_workers * self.slots_per_worker * slot_size,
+        )
+        # slot descriptors are tiny, so a plain pipe-backed queue suffices
+        self.descriptor_queue = mp.Queue()
+        # counts the free slots of each worker
+        self.free_slots = [
+            mp.Semaphore(self.slots_per_worker) for _ in range(num_workers)
+        ]
+        self.generations = [0] * num_workers
+        # ring position of the next write, only used in the worker processes
+        self.next_slot = 0
+
+    def _offset(self, worker_id: int, slot: int) -> int:
+        return (worker_id * self.slots_per_worker + slot) * self.slot_size
+
+    def put(
+        self, worker_id: int, batch, should_stop: Callable[[], bool]
+    ) -> bool:
+        while not self.free_slots[worker_id].acquire(timeout=0.1):
+            if should_stop() or not _parent_is_alive():
+                return False
+
+        # plain pickling: the reducers registered with `ForkingPickler`
+        # (e.g. by MXNet) pass file descriptors owned by the worker, which
+        # may have exited by the time the batch is read
+        payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+        slot = self.next_slot
+        self.next_slot = (self.next_slot + 1) % self.slots_per_worker
+        generation = self.generations[worker_id]
+
+        if len(payload) <= self.slot_size:
+            offset = self._offset(worker_id, slot)
+            self.shm.buf[offset : offset + len(payload)] = payload
+            self.descriptor_queue.put(
+                (worker_id, generation, slot, len(payload), None)
+            )
+        else:
+            self.descriptor_queue.put(
+                (worker_id, generation, slot, len(payload), payload)
+            )
+        return True
+
+    def get(self, timeout: float):
+        (
+            worker_id,
+            generation,
+            slot,
+            num_bytes,
+            inline,
+        ) = self.descriptor_queue.get(timeout=timeout)
+
+        if generation != self.generations[worker_id]:
+            # the slot may have been overwritten by the restarted worker
+            return None
+
+        if inline is None:
+            offset = self._offset(worker_id, slot)
+            view = self.shm.buf[offset : offset + num_bytes]
+            try:
+                batch = pickle.loads(view)
+            finally:
+                view.release()
+        else:
+            batch = pickle.loads(inline)
+
+        self.free_slots[worker_id].release()
+        return worker_id, batch
+
+    def restart_worker(self, worker_id: int) -> None:
+        # slots held by the crashed worker are never released, so the
+        # restarted worker starts over with a fresh set
+        self.generations[worker_id] += 1
+        self.free_slots[worker_id] = mp.Semaphore(self.slots_per_worker)
+
+    def finish_worker(self, terminated: bool) -> None:
+        if terminated:
+            # nobody reads pending descriptors anymore, don't wait for them
+            self.descriptor_queue.cancel_join_thread()
+        else:
+            # make sure all descriptors are in the pipe before the worker
+            # reports itself as exhausted
+            self.descriptor_queue.close()
+            self.descriptor_queue.join_thread()
+
+    def drain(self) -> None:
+        try:
+            while True:
+                self.get(timeout=0.1)
+        except (Empty, OSError, ValueError):
+            pass
+
+    def close(self) -> None:
+        self.descriptor_queue.close()
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _parent_is_alive() -> bool:
+    # `parent_process` is only available from Python 3.8 on
+    parent = getattr(mp, "parent_process", lambda: None)()
+    return parent is None or parent.is_alive()
+
+
+def _wait_for_epoch(control_queue, terminate_event) -> bool:
+    while not terminate_event.is_set() and _parent_is_alive():
+        try:
+            control_queue.get(timeout=0.1)
+            return True
+        except Empty:
+            pass
+    return False
+
+
+TRANSPORTS = ["queue", "shared_memory"]
+
+
 class MultiProcessBatcher(Iterator):
+    """
+    Iterator over batches which are produced by ``num_workers`` worker
+    processes, each of which covers its own shard of ``dataset``.
+
+    Parameters
+    ----------
+    dataset
+        Dataset to draw entries from; datasets are expected to shard
+        themselves using ``get_bounds_for_mp_data_loading``.
+    batch_size
+        Number of entries per batch.
+    stack_fn
+        Function which turns a list of entries into a batch; called in the
+        worker processes.
+    num_workers
+        Number of worker processes.
+    max_queue_size
+        Maximum number of batches in flight, defaults to ``5 * num_workers``.
+    decode_fn
+        Function applied to each batch in the main process.
+    transport
+        How batches are sent to the main process, one of ``"queue"`` (a
+        ``multiprocessing.Manager`` queue) or ``"shared_memory"`` (see
+        :class:`SharedMemoryTransport`).
+    shared_memory_slot_size
+        Size in bytes of one slot when using the ``"shared_memory"``
+        transport.
+    timeout
+        Maximum number of seconds to wait for the next batch before raising
+        a ``GluonTSDataError``; ``None`` waits indefinitely.
+    max_worker_restarts
+        How often crashed workers are restarted in total. A restarted worker
+        resumes its shard after the last batch that was received from its
+        predecessor. If the limit is exceeded, the crash is raised as a
+        ``GluonTSDataError``.
+    ordered
+        If ``True``, batches are returned round-robin from the workers
+        (worker 0, worker 1, ...), which makes the batch order reproducible
+        across runs. Batches of workers which are ahead are held back in
+        the main process, up to ``max_queue_size // num_workers`` per
+        worker; workers wait until their held back batches are returned.
+    persistent
+        If ``True``, workers are kept alive when the end of ``dataset`` is
+        reached and wait for :meth:`start_epoch` to iterate over it once
+        more. This keeps the state of the dataset in the workers, e.g.
+        opened or cached files, and saves forking processes every epoch.
+    """
+
     def __init__(
         self,
         dataset: Dataset,
@@ -39,10 +296,22 @@ class MultiProcessBatcher(Iterator):
         num_workers: int,
         max_queue_size: Optional[int] = None,
         decode_fn: Callable = lambda x: x,
+        transport: str = "queue",
+        shared_memory_slot_size: int = 16 * 1024 ** 2,
+        timeout: Optional[float] = 120,
+        max_worker_restarts: int = 0,
+        ordered: bool = False,
+        persistent: bool = False,
     ):
         assert num_workers >= 1
         assert max_queue_size is None or max_queue_size >= num_workers
+        assert (
+            transport in TRANSPORTS
+        ), f"transport must be one of {TRANSPORTS}, got {transport!r}"
+        assert timeout is None or timeout > 0
+        assert max_worker_restarts >= 0
 
+        self.dataset = dataset
         self.batch_size = batch_size
         self.stack_fn = stack_fn
         self.decode_fn = decode_fn
@@ -50,33 +319,82 @@ class MultiProcessBatcher(Iterator):
         self.max_queue_size = (
             max_queue_size if max_queue_size is not None else 5 * num_workers
         )
+        self.timeout = timeout
+        self.remaining_restarts = max_worker_restarts
+        self.ordered = ordered
+        self.persistent = persistent
+
+        if transport == "shared_memory":
+            self.transport = SharedMemoryTransport(
+                num_workers,
+                self.max_queue_size,
+                slot_size=shared_memory_slot_size,
+            )
+        else:
+            self.transport = QueueTransport(num_workers, self.max_queue_size)
+
+        self.terminate_event = mp.Event()
+        # ends the current epoch early, see `start_epoch`
+        self.abort_event = mp.Event()
+        # persistent workers wait for a message to start each epoch
+        self.epoch = 0
+        self.control_queues = (
+            [mp.Queue() for _ in range(num_workers)] if persistent else None
+        )
+        self.exhausted_events = [mp.Event() for _ in range(self.num_workers)]
+        # number of batches each worker has sent (shared with the workers)
+        # and received by the main process so far
+        self.sent_counts = [mp.Value("l", 0) for _ in range(num_workers)]
+        self.received_counts = [0] * num_workers
+        # batches held back in `ordered` mode
+        self.pending: List[deque] = [deque() for _ in range(num_workers)]
+        # in `ordered` mode, workers need a credit for every batch they send,
+        # which is returned once the batch leaves `pending`
+        self.max_pending = max(1, self.max_queue_size // num_workers)
+        self.credits = (
+            [mp.Semaphore(self.max_pending) for _ in range(num_workers)]
+            if ordered
+            else None
+        )
+        self.next_worker = 0
+        self.last_liveness_check = time.monotonic()
 
-        self.manager = mp.Manager()
-        self.batch_queue = self.manager.Queue(maxsize=self.max_queue_size)
-        self.terminate_event = self.manager.Event()
-        self.exhausted_events = [
-            self.manager.Event() for _ in range(self.num_workers)
+        self.processes: List[mp.Process] = [
+            self._start_worker(worker_id) for worker_id in range(num_workers)
         ]
-        self.processes = []
-
-        for worker_id, event in enumerate(self.exhausted_events):
-            p = mp.Process(
-                target=self.worker_fn,
-                args=(
-                    worker_id,
-                    num_workers,
-                    dataset,
-                    batch_size,
-                    stack_fn,
-                    self.batch_queue,
-                    self.terminate_event,
-                    event,
-                ),
-            )
-            p.start()
-            self.processes.append(p)
+        if persistent:
+            for control_queue in self.control_queues:
+                control_queue.put(self.epoch)
 
         self.count = 0
+        self._finalizer = weakref.finalize(
+            self,
+            self._halt,
+            self.transport,
+            self.terminate_event,
+            self.processes,
+        )
+
+    def _start_worker(self, worker_id: int) -> mp.Process:
+        p = mp.Process(
+            target=self.worker_fn,
+            args=(
+                worker_id,
+                self.num_workers,
+                self.dataset,
+                self.batch_size,
+                self.stack_fn,
+                self.transport,
+                self.terminate_event,
+                self.abort_event,
+                self.exhausted_events[worker_id],
+                self.sent_counts[worker_id],
+                self.control_queues[worker_id] if self.persistent else None,
+                self.credits[worker_id] if self.ordered else None,
+            ),
+        )
+        p.start()
+        return p
 
     @staticmethod
     def worker_fn(
@@ -85,66 +403,224 @@ class MultiProcessBatcher(Iterator):
         dataset,
         batch_size: int,
         stack_fn: Callable,
-        batch_queue: mp.Queue,
+        transport,
         terminate_event,
+        abort_event,
         exhausted_event,
+        sent_count,
+        control_queue,
+        credits,
     ):
         MPWorkerInfo.set_worker_info(
             num_workers=num_workers,
             worker_id=worker_id,
         )
 
-        for batch in batcher(dataset, batch_size):
-            stacked_batch = stack_fn(batch)
+        def should_stop() -> bool:
+            return terminate_event.is_set() or abort_event.is_set()
+
+        def run_epoch() -> bool:
+            # a restarted worker skips the batches its predecessor already
+            # sent
+            batches = itertools.islice(
+                batcher(dataset, batch_size), sent_count.value, None
+            )
+
+            for batch in batches:
+                if credits is not None:
+                    while not credits.acquire(timeout=0.1):
+                        if should_stop() or not _parent_is_alive():
+                            return False
+                stacked_batch = stack_fn(batch)
+                if should_stop():
+                    return False
+                if transport.put(worker_id, stacked_batch, should_stop):
+                    sent_count.value += 1
+            return True
+
+        if control_queue is None:
             try:
-                if terminate_event.is_set():
-                    return
-                buf = io.BytesIO()
-                ForkingPickler(buf, pickle.HIGHEST_PROTOCOL).dump(
-                    (worker_id, stacked_batch)
-                )
-                batch_queue.put(buf.getvalue())
+                completed = run_epoch()
             except (EOFError, BrokenPipeError):
-                return
+                completed = False
 
-        exhausted_event.set()
+            transport.finish_worker(terminated=not completed)
+            if completed:
+                exhausted_event.set()
+                # stay alive until all batches are received: they may hold
+                # resources owned by this process, e.g. shared MXNet arrays
+                while not terminate_event.wait(0.1) and _parent_is_alive():
+                    pass
+            return
+
+        try:
+            while _wait_for_epoch(control_queue, terminate_event):
+                run_epoch()
+                # also report aborted epochs as done
+                exhausted_event.set()
+        except (EOFError, BrokenPipeError):
+            pass
+
+        transport.finish_worker(terminated=True)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if (
-            all(event.is_set() for event in self.exhausted_events)
-            and self.batch_queue.empty()
-        ):
-            self._halt_processes()
-            raise StopIteration
+        start = time.monotonic()
 
-        try:
-            # TODO make timeout configurable
-            got = self.batch_queue.get(timeout=120)
-            worker_id, batch = pickle.loads(got)
-            batch = self.decode_fn(batch)
-        except Empty:
-            raise StopIteration
+        while True:
+            batch = self._pop_pending()
+            if batch is not None:
+                return self.decode_fn(batch)
 
-        return batch
+            if self._is_exhausted():
+                if not self.persistent:
+                    self._halt_processes()
+                raise StopIteration
 
-    def _empty_queue(self):
-        try:
-            batch = self.batch_queue.get(block=False)
-            while batch:
-                self.batch_queue.get(block=False)
-        except (Empty, FileNotFoundError):
-            pass
+            now = time.monotonic()
+            if now - self.last_liveness_check > 1.0:
+                self.last_liveness_check = now
+                self._check_workers()
+
+            # poll in short intervals, so that workers which get exhausted
+            # or crash while we are waiting are noticed right away
+            try:
+                got = self.transport.get(timeout=0.1)
+            except Empty:
+                waited = time.monotonic() - start
+                if self.timeout is not None and waited > self.timeout:
+                    self._halt_processes()
+                    raise GluonTSDataError(
+                        f"No batch was received from the data loader "
+                        f"workers within {self.timeout} seconds."
+                    )
+                self._check_workers()
+                continue
+
+            if got is not None:
+                worker_id, batch = got
+                self.received_counts[worker_id] += 1
+                self.pending[worker_id].append(batch)
+
+    def _pop_pending(self):
+        if not self.ordered:
+            for queue in self.pending:
+                if queue:
+                    return queue.popleft()
+            return None
+
+        # skip workers which won't produce any more batches
+        for _ in range(self.num_workers):
+            worker_id = self.next_worker
+            if self.pending[worker_id] or not self._is_done(worker_id):
+                break
+            self.next_worker = (worker_id + 1) % self.num_workers
+
+        if self.pending[self.next_worker]:
+            batch = self.pending[self.next_worker].popleft()
+            self.credits[self.next_worker].release()
+            self.next_worker = (self.next_worker + 1) % self.num_workers
+            return batch
+        return None
+
+    def _is_done(self, worker_id: int) -> bool:
+        return (
+            self.exhausted_events[worker_id].is_set()
+            and self.received_counts[worker_id]
+            >= self.sent_counts[worker_id].value
+        )
+
+    def _is_exhausted(self) -> bool:
+        return not any(self.pending) and all(
+            self._is_done(worker_id) for worker_id in range(self.num_workers)
+        )
+
+    def _check_workers(self):
+        for worker_id, p in enumerate(self.processes):
+            if p.is_alive() or self.exhausted_events[worker_id].is_set():
+                continue
+
+            if self.remaining_restarts == 0:
+                self._halt_processes()
+                raise GluonTSDataError(
+                    f"Data loader worker {worker_id} exited unexpectedly "
+                    f"with exit code {p.exitcode}."
+                )
+
+            self.remaining_restarts -= 1
+            logger.warning(
+                f"Data loader worker {worker_id} exited unexpectedly with "
+                f"exit code {p.exitcode}, restarting it."
+            )
+            # batches still in flight from the crashed worker are dropped
+            # and produced again by its successor
+            self.transport.restart_worker(worker_id)
+            self.sent_counts[worker_id].value = self.received_counts[worker_id]
+            if self.ordered:
+                # credits of the batches in flight are lost with them
+                self.credits[worker_id] = mp.Semaphore(
+                    self.max_pending - len(self.pending[worker_id])
+                )
+            if self.persistent:
+                # the crashed worker might not have read its last message
+                self.control_queues[worker_id] = mp.Queue()
+                self.control_queues[worker_id].put(self.epoch)
+            self.processes[worker_id] = self._start_worker(worker_id)
+
+    def start_epoch(self) -> None:
+        """
+        Let the persistent workers iterate over the dataset once more.
+
+        If the current epoch is not finished yet, the workers stop early
+        and the remaining batches are discarded.
+        """
+        assert self.persistent, "Only persistent workers can be reused."
+
+        if not self._is_exhausted():
+            self.abort_event.set()
+            while not all(
+                self._is_done(worker_id) or not p.is_alive()
+                for worker_id, p in enumerate(self.processes)
+            ):
+                try:
+                    got = self.transport.get(timeout=0.1)
+                except Empty:
+                    continue
+                if got is not None:
+                    self.received_counts[got[0]] += 1
+                    if self.ordered:
+                        self.credits[got[0]].release()
+            self.abort_event.clear()
+
+        self.epoch += 1
+        self.next_worker = 0
+        for worker_id in range(self.num_workers):
+            if self.ordered:
+                for _ in self.pending[worker_id]:
+                    self.credits[worker_id].release()
+            self.pending[worker_id].clear()
+            self.received_counts[worker_id] = 0
+            self.sent_counts[worker_id].value = 0
+            self.exhausted_events[worker_id].clear()
+            self.control_queues[worker_id].put(self.epoch)
 
     def _halt_processes(self):
+        self._finalizer()
+
+    @staticmethod
+    def _halt(transport, terminate_event, processes):
         # Send termination message to workers
-        self.terminate_event.set()
+        terminate_event.set()
         # Empty queue to make sure workers get the message
-        self._empty_queue()
-        for p in self.processes:
-            p.join()
+        transport.drain()
+        for p in processes:
+            p.join(timeout=10)
+            if p.is_alive():
+                # the worker is stuck, e.g. writing to a full pipe
+                p.terminate()
+        transport.close()
 
 
 def win32_guard(num_workers: Optional[int]) -> Optional[int]:
@@ -167,6 +643,11 @@ class DataLoader(Iterable[DataBatch]):
         num_workers: Optional[int] = None,
         num_prefetch: Optional[int] = None,
         decode_fn: Callable = lambda x: x,
+        transport: str = "queue",
+        timeout: Optional[float] = 120,
+        max_worker_restarts: int = 0,
+        ordered: bool = False,
+        persistent_workers: bool = False,
     ) -> None:
         self.data_iterable = data_iterable
         self.batch_size = batch_size
@@ -174,23 +655,50 @@ class DataLoader(Iterable[DataBatch]):
         self.num_workers = win32_guard(num_workers)
         self.num_prefetch = num_prefetch
         self.decode_fn = decode_fn
+        self.transport = transport
+        self.timeout = timeout
+        self.max_worker_restarts = max_worker_restarts
+        self.ordered = ordered
+        self.persistent_workers = persistent_workers
+        self._batcher: Optional[MultiProcessBatcher] = None
 
     def __iter__(self):
-        batch_iterator = (
-            map(self.stack_fn, batcher(self.data_iterable, self.batch_size))
-            if not self.num_workers
-            else MultiProcessBatcher(
-                self.data_iterable,
-                batch_size=self.batch_size,
-                stack_fn=self.stack_fn,
-                decode_fn=self.decode_fn,
-                num_workers=self.num_workers,
-                max_queue_size=self.num_prefetch,
+        if not self.num_workers:
+            return map(
+                self.stack_fn, batcher(self.data_iterable, self.batch_size)
             )
+
+        if self.persistent_workers and self._batcher is not None:
+            self._batcher.start_epoch()
+            return self._batcher
+
+        batch_iterator = MultiProcessBatcher(
+            self.data_iterable,
+            batch_size=self.batch_size,
+            stack_fn=self.stack_fn,
+            decode_fn=self.decode_fn,
+            num_workers=self.num_workers,
+            max_queue_size=self.num_prefetch,
+            transport=self.transport,
+            timeout=self.timeout,
+            max_worker_restarts=self.max_worker_restarts,
+            ordered=self.ordered,
+            persistent=self.persistent_workers,
         )
+        if self.persistent_workers:
+            self._batcher = batch_iterator
 
         return batch_iterator
 
+    def close(self) -> None:
+        """
+        Stop the persistent workers, if any; a later iteration starts new
+        ones.
+        """
+        if self._batcher is not None:
+            self._batcher._halt_processes()
+            self._batcher = None
+
 
 # TODO: the following are for backward compatibility, and could eventually be removed
 
@@ -206,6 +714,10 @@ def TrainDataLoader(
     num_prefetch: Optional[int] = None,
     shuffle_buffer_length: Optional[int] = None,
     decode_fn: Callable = lambda x: x,
+    transport: str = "queue",
+    timeout: Optional[float] = 120,
+    max_worker_restarts: int = 0,
+    ordered: bool = False,
 ):
     transformed_dataset = TransformedDataset(
         Cyclic(dataset), transform, is_train=True
@@ -224,6 +736,10 @@ def TrainDataLoader(
         num_workers=num_workers,
         num_prefetch=num_prefetch,
         decode_fn=decode_fn,
+        transport=transport,
+        timeout=timeout,
+        max_worker_restarts=max_worker_restarts,
+        ordered=ordered,
     )
     return (
         iter(data_loader)
@@ -242,12 +758,16 @@ def ValidationDataLoader(
     num_prefetch: Optional[int] = None,
     shuffle_buffer_length: Optional[int] = None,
     decode_fn: Callable = lambda x: x,
+    persistent_workers: bool = False,
 ):
     return DataLoader(
         data_iterable=TransformedDataset(dataset, transform, is_train=True),
         batch_size=batch_size,
         stack_fn=stack_fn,
+        num_workers=num_workers,
+        num_prefetch=num_prefetch,
         decode_fn=decode_fn,
+        persistent_workers=persistent_workers,
     )
 
 
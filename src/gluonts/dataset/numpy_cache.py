@@ -0,0 +1,226 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+Memory-mapped cache of a dataset, stored in plain NumPy files.
+
+The arrays of all entries are written back to back into a single ``.npy``
+blob of bytes, and an index stores where each array starts, its shape and
+its dtype. Loading the cache memory-maps the blob, so that entries are
+read-only views into it: nothing is parsed when a process starts, and
+forked data loader workers share the same physical pages instead of each
+holding a private copy of the data.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from gluonts import json
+from gluonts.dataset.common import (
+    DataEntry,
+    Dataset,
+    ProcessDataEntry,
+    SourceContext,
+)
+from gluonts.dataset.util import get_bounds_for_mp_data_loading
+
+DATA_FILE = "data.npy"
+INDEX_FILE = "index.npz"
+FIELDS_FILE = "fields.json"
+
+# arrays in the blob start at multiples of this, so that views are aligned
+ALIGNMENT = 8
+
+
+def write_numpy_cache(dataset: Dataset, path: Path) -> None:
+    """
+    Write ``dataset`` into a cache directory at ``path``.
+
+    Fields holding numpy arrays go to the data blob; ``start`` and all other
+    fields are stored in the index, and therefore must be JSON
+    serializable. The cache is written to a temporary directory first and
+    moved into place at the end, so that an interrupted write never leaves
+    a partial cache behind.
+
+    Parameters
+    ----------
+    dataset
+        Dataset to cache, usually after processing, e.g. a ``FileDataset``.
+    path
+        Directory to write the cache to; it must not exist yet.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+
+    offsets: Dict[str, List[int]] = {}
+    shapes: Dict[str, List[tuple]] = {}
+    dtypes: Dict[str, str] = {}
+    starts: List[str] = []
+    other_fields: List[dict] = []
+    num_bytes = 0
+
+    try:
+        with open(tmp_dir / "data.bin", "wb") as blob:
+            for row, entry in enumerate(dataset):
+                other = {}
+                for name, value in entry.items():
+                    if name == "start":
+                        starts.append(str(value))
+                    elif isinstance(value, np.ndarray):
+                        if name not in offsets:
+                            # fields first seen in a later entry
+                            offsets[name] = [-1] * row
+                            shapes[name] = [()] * row
+                            dtypes[name] = value.dtype.str
+                        assert dtypes[name] == value.dtype.str, (
+                            f"Field '{name}' has dtype {value.dtype}, "
+                            f"expected {np.dtype(dtypes[name])}."
+                        )
+                        offsets[name].append(num_bytes)
+                        shapes[name].append(value.shape)
+
+                        data = np.ascontiguousarray(value).tobytes()
+                        padding = -len(data) % ALIGNMENT
+                        blob.write(data + b"\0" * padding)
+                        num_bytes += len(data) + padding
+                    elif name != "source":
+                        other[name] = value
+
+                for name in offsets:
+                    if len(offsets[name]) <= row:
+                        offsets[name].append(-1)
+                        shapes[name].append(())
+                other_fields.append(other)
+
+        # prepend the `.npy` header, now that the size of the blob is known
+        with open(tmp_dir / DATA_FILE, "wb") as out_file:
+            np.lib.format.write_array_header_1_0(
+                out_file,
+                {
+                    "descr": "|u1",
+                    "fortran_order": False,
+                    "shape": (num_bytes,),
+                },
+            )
+            with open(tmp_dir / "data.bin", "rb") as blob:
+                shutil.copyfileobj(blob, out_file)
+        os.remove(tmp_dir / "data.bin")
+
+        index = {"start": np.array(starts, dtype=str)}
+        for name in offsets:
+            max_ndim = max(len(shape) for shape in shapes[name])
+            index[f"{name}.offset"] = np.array(offsets[name], dtype=np.int64)
+            index[f"{name}.shape"] = np.array(
+                [
+                    list(shape) + [-1] * (max_ndim - len(shape))
+                    for shape in shapes[name]
+                ],
+                dtype=np.int64,
+            ).reshape(len(starts), max_ndim)
+            index[f"{name}.dtype"] = np.array(dtypes[name])
+        np.savez(tmp_dir / INDEX_FILE, **index)
+
+        # depending on the json backend, `dumps` returns `str` or `bytes`
+        fields = json.dumps(other_fields)
+        if isinstance(fields, str):
+            fields = fields.encode("utf-8")
+        with open(tmp_dir / FIELDS_FILE, "wb") as out_file:
+            out_file.write(fields)
+
+        os.rename(tmp_dir, path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class NumpyCacheDataset(Dataset):
+    """
+    Dataset that reads the memory-mapped cache written by
+    ``write_numpy_cache``.
+
+    Entries are processed like in ``FileDataset``, which leaves the arrays
+    from the cache as read-only views if they already have the required
+    dtype. Like ``FileDataset``, each data loader worker only iterates over
+    its own segment of the dataset.
+
+    Parameters
+    ----------
+    path
+        Directory containing the cache.
+    freq
+        Frequency of the observation in the time series.
+        Must be a valid Pandas frequency.
+    one_dim_target
+        Whether to accept only univariate target time series.
+    """
+
+    def __init__(
+        self, path: Path, freq: str, one_dim_target: bool = True
+    ) -> None:
+        self.path = Path(path)
+        self.process = ProcessDataEntry(freq, one_dim_target=one_dim_target)
+
+        self.data = np.load(self.path / DATA_FILE, mmap_mode="r")
+
+        with np.load(self.path / INDEX_FILE) as index:
+            self.starts = index["start"]
+            self.array_fields = {
+                key[: -len(".offset")]: (
+                    index[key],
+                    index[key[: -len(".offset")] + ".shape"],
+                    np.dtype(str(index[key[: -len(".offset")] + ".dtype"])),
+                )
+                for key in index.files
+                if key.endswith(".offset")
+            }
+
+        with open(self.path / FIELDS_FILE, "rb") as in_file:
+            self.other_fields = json.loads(in_file.read())
+
+    def _entry(self, row: int) -> DataEntry:
+        entry = dict(self.other_fields[row])
+        entry["start"] = str(self.starts[row])
+
+        for name, (offsets, shapes, dtype) in self.array_fields.items():
+            offset = offsets[row]
+            if offset < 0:
+                continue
+            shape = tuple(int(dim) for dim in shapes[row] if dim >= 0)
+            size = int(np.prod(shape)) * dtype.itemsize
+            entry[name] = (
+                self.data[offset : offset + size].view(dtype).reshape(shape)
+            )
+
+        entry = self.process(entry)
+        entry["source"] = SourceContext(source=str(self.path), row=row)
+        return entry
+
+    def __iter__(self) -> Iterator[DataEntry]:
+        bounds = get_bounds_for_mp_data_loading(len(self))
+        for row in range(bounds.lower, bounds.upper):
+            yield self._entry(row)
+
+    def __getitem__(self, row: int) -> DataEntry:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("dataset index out of range")
+        return self._entry(row)
+
+    def __len__(self) -> int:
+        return len(self.starts)
@@ -12,12 +12,14 @@
 # permissions and limitations under the License.
 
 import logging
+import shutil
 from collections import OrderedDict
 from functools import partial
 from pathlib import Path
 
 from gluonts.dataset.artificial import ConstantDataset
-from gluonts.dataset.common import TrainDatasets, load_datasets
+from gluonts.dataset.common import FileDataset, TrainDatasets, load_datasets
+from gluonts.dataset.numpy_cache import NumpyCacheDataset, write_numpy_cache
 from gluonts.dataset.repository._artificial import generate_artificial_dataset
 from gluonts.dataset.repository._gp_copula_2019 import (
     generate_gp_copula_dataset,
@@ -166,6 +168,7 @@ def get_dataset(
     dataset_name: str,
     path: Path = default_dataset_path,
     regenerate: bool = False,
+    mmap_cache: bool = False,
 ) -> TrainDatasets:
     """
     Get a repository dataset.
@@ -184,18 +187,51 @@ def get_dataset(
         be downloaded again.
     path
         where the dataset should be saved
+    mmap_cache
+        whether to load the dataset from a memory-mapped NumPy cache, which
+        is stored under the dataset directory and created on first use.
+        Entries are then read-only views into the cache, which forked data
+        loader workers share instead of each parsing their own copy.
     Returns
     -------
         dataset obtained by either downloading or reloading from local file.
     """
     dataset_path = materialize_dataset(dataset_name, path, regenerate)
 
-    return load_datasets(
+    datasets = load_datasets(
         metadata=dataset_path,
         train=dataset_path / "train",
         test=dataset_path / "test",
     )
 
+    if not mmap_cache:
+        return datasets
+
+    cache_path = dataset_path / "numpy_cache"
+    if regenerate and cache_path.exists():
+        shutil.rmtree(cache_path)
+
+    return TrainDatasets(
+        metadata=datasets.metadata,
+        train=_load_numpy_cache(
+            datasets.train, cache_path / "train", datasets.metadata.freq
+        ),
+        test=_load_numpy_cache(
+            datasets.test, cache_path / "test", datasets.metadata.freq
+        )
+        if datasets.test is not None
+        else None,
+    )
+
+
+def _load_numpy_cache(
+    dataset: FileDataset, cache_path: Path, freq: str
+) -> NumpyCacheDataset:
+    if not cache_path.exists():
+        logging.info(f"writing numpy cache to {cache_path}")
+        write_numpy_cache(dataset, cache_path)
+    return NumpyCacheDataset(cache_path, freq=freq)
+
 
 if __name__ == "__main__":
     for dataset in dataset_names:
@@ -12,8 +12,11 @@
 # permissions and limitations under the License.
 
 import math
+import multiprocessing
+import sys
 from collections import defaultdict
-from typing import Any, List, NamedTuple, Optional, Set
+from functools import partial, reduce
+from typing import Any, List, NamedTuple, Optional, Sequence, Set
 
 import numpy as np
 
@@ -70,6 +73,23 @@ class ScaleHistogram:
         else:
             self.empty_target_count = self.empty_target_count + 1
 
+    def merge(self, other: "ScaleHistogram") -> "ScaleHistogram":
+        """
+        Return the histogram of the time series counted in both histograms.
+        """
+        assert self._base == other._base, "Histograms need the same base."
+
+        bin_counts = dict(self.bin_counts)
+        for bucket, count in other.bin_counts.items():
+            bin_counts[bucket] = bin_counts.get(bucket, 0) + count
+
+        return ScaleHistogram(
+            base=self._base,
+            bin_counts=bin_counts,
+            empty_target_count=self.empty_target_count
+            + other.empty_target_count,
+        )
+
     def count(self, target):
         if len(target) > 0:
             return self.bin_counts[self.bucket_index(target)]
@@ -136,8 +156,350 @@ class DatasetStatistics(NamedTuple):
         return True
 
 
+def _merge_num_features(
+    name: str, num_features: Optional[int], other: Optional[int]
+) -> Optional[int]:
+    # `None` means that no time series was seen, and 0 that the feature is
+    # absent from the time series
+    if num_features is None:
+        return other
+    if other is None:
+        return num_features
+
+    if other == 0:
+        assert_data_error(
+            num_features == 0,
+            f"{name} was found for some instances but not others.",
+        )
+    else:
+        assert_data_error(
+            num_features == other,
+            "Found instances with different number of features in "
+            f"{name}, found one with {{}} and another with {{}}.",
+            num_features,
+            other,
+        )
+    return num_features
+
+
+def _merge_static_features(
+    name: str,
+    observed: Optional[List[set]],
+    other: Optional[List[set]],
+) -> Optional[List[set]]:
+    if observed is None:
+        return None if other is None else [set(s) for s in other]
+    if other is None:
+        return [set(s) for s in observed]
+
+    assert_data_error(
+        len(observed) == len(other),
+        f"Not all {name} vectors have the same length {{}} != {{}}.",
+        len(observed),
+        len(other),
+    )
+    return [left | right for left, right in zip(observed, other)]
+
+
+def _check_dynamic_features(name: str, features, target) -> None:
+    assert_data_error(
+        np.all(np.isfinite(features)),
+        "Features values have to be finite and cannot exceed single "
+        "precision floating point range.",
+    )
+    if name == FieldName.PAST_FEAT_DYNAMIC_REAL:
+        return
+
+    assert_data_error(
+        len(features[0]) == len(target),
+        f"Each feature in {name} has to have the same length as the target. "
+        f"Found an instance with {name} of length {{}} and a target of "
+        "length {}.",
+        len(features[0]),
+        len(target),
+    )
+
+
+class PartialDatasetStatistics:
+    """
+    Statistics of a part of a dataset, which can be merged with the ones of
+    other parts to obtain the `DatasetStatistics` of the whole dataset.
+
+    Time series are added one at a time with `add`, and `merge` combines
+    two partial statistics. Merging is associative, so partial statistics
+    can be computed for shards of a dataset independently, for example in
+    separate processes, and be merged in any grouping afterwards.
+    """
+
+    def __init__(self) -> None:
+        self.num_time_observations = 0
+        self.num_time_series = 0
+        self.min_target = 1e20
+        self.max_target = -1e20
+        self.sum_target = 0.0
+        self.sum_abs_target = 0.0
+        self.integer_dataset = True
+        self.max_target_length = 0
+        self.num_missing_values = 0
+        self.observed_feat_static_cat: Optional[List[Set[int]]] = None
+        self.observed_feat_static_real: Optional[List[Set[float]]] = None
+        self.num_past_feat_dynamic_real: Optional[int] = None
+        self.num_feat_dynamic_real: Optional[int] = None
+        self.num_feat_dynamic_cat: Optional[int] = None
+        self.scale_histogram = ScaleHistogram()
+
+    def add(self, ts: dict) -> None:
+        """
+        Add the statistics of a single time series.
+        """
+        self.num_time_series += 1
+
+        # TARGET
+        target = np.asarray(ts[FieldName.TARGET])
+        is_nan = np.isnan(target)
+        num_missing_values = int(is_nan.sum())
+        observed_target = (
+            target[~is_nan] if num_missing_values > 0 else target.ravel()
+        )
+        num_observations = len(observed_target)
+
+        if num_observations > 0:
+            min_target = float(observed_target.min())
+            max_target = float(observed_target.max())
+
+            # 'nan' is handled in observed_target definition, so infinite
+            # values would show up in the minimum or maximum
+            assert_data_error(
+                np.isfinite(min_target) and np.isfinite(max_target),
+                "Target values have to be finite (e.g., not inf, -inf, "
+                "or None) and cannot exceed single precision floating "
+                "point range.",
+            )
+
+            self.num_time_observations += num_observations
+            self.max_target_length = max(
+                num_observations, self.max_target_length
+            )
+            self.min_target = min(self.min_target, min_target)
+            self.max_target = max(self.max_target, max_target)
+            self.num_missing_values += num_missing_values
+            self.sum_target += float(observed_target.sum())
+            self.sum_abs_target += float(np.abs(observed_target).sum())
+            self.integer_dataset = self.integer_dataset and bool(
+                np.all(np.mod(observed_target, 1) == 0)
+            )
+
+        # after checks for inf and None
+        self.scale_histogram.add(observed_target)
+
+        # FEAT_STATIC_CAT
+        feat_static_cat = ts.get(FieldName.FEAT_STATIC_CAT, [])
+
+        if self.observed_feat_static_cat is None:
+            self.observed_feat_static_cat = [set() for _ in feat_static_cat]
+
+        assert_data_error(
+            len(self.observed_feat_static_cat) == len(feat_static_cat),
+            "Not all feat_static_cat vectors have the same length {} != {}.",
+            len(self.observed_feat_static_cat),
+            len(feat_static_cat),
+        )
+        for observed, c in zip(self.observed_feat_static_cat, feat_static_cat):
+            observed.add(c)
+
+        # FEAT_STATIC_REAL
+        feat_static_real = ts.get(FieldName.FEAT_STATIC_REAL, [])
+
+        if self.observed_feat_static_real is None:
+            self.observed_feat_static_real = [set() for _ in feat_static_real]
+
+        assert_data_error(
+            len(self.observed_feat_static_real) == len(feat_static_real),
+            "Not all feat_static_real vectors have the same length {} != {}.",
+            len(self.observed_feat_static_real),
+            len(feat_static_real),
+        )
+        for observed, c in zip(
+            self.observed_feat_static_real, feat_static_real
+        ):
+            observed.add(c)
+
+        # FEAT_DYNAMIC_CAT
+        feat_dynamic_cat = ts.get(FieldName.FEAT_DYNAMIC_CAT)
+        self.num_feat_dynamic_cat = _merge_num_features(
+            FieldName.FEAT_DYNAMIC_CAT,
+            self.num_feat_dynamic_cat,
+            0 if feat_dynamic_cat is None else len(feat_dynamic_cat),
+        )
+        if feat_dynamic_cat is not None:
+            _check_dynamic_features(
+                FieldName.FEAT_DYNAMIC_CAT, feat_dynamic_cat, target
+            )
+
+        # FEAT_DYNAMIC_REAL
+        feat_dynamic_real = None
+        if FieldName.FEAT_DYNAMIC_REAL in ts:
+            feat_dynamic_real = ts[FieldName.FEAT_DYNAMIC_REAL]
+        elif FieldName.FEAT_DYNAMIC_REAL_LEGACY in ts:
+            feat_dynamic_real = ts[FieldName.FEAT_DYNAMIC_REAL_LEGACY]
+
+        self.num_feat_dynamic_real = _merge_num_features(
+            FieldName.FEAT_DYNAMIC_REAL,
+            self.num_feat_dynamic_real,
+            0 if feat_dynamic_real is None else len(feat_dynamic_real),
+        )
+        if feat_dynamic_real is not None:
+            _check_dynamic_features(
+                FieldName.FEAT_DYNAMIC_REAL, feat_dynamic_real, target
+            )
+
+        # PAST_FEAT_DYNAMIC_REAL
+        past_feat_dynamic_real = ts.get(FieldName.PAST_FEAT_DYNAMIC_REAL)
+        self.num_past_feat_dynamic_real = _merge_num_features(
+            FieldName.PAST_FEAT_DYNAMIC_REAL,
+            self.num_past_feat_dynamic_real,
+            0
+            if past_feat_dynamic_real is None
+            else len(past_feat_dynamic_real),
+        )
+        if past_feat_dynamic_real is not None:
+            _check_dynamic_features(
+                FieldName.PAST_FEAT_DYNAMIC_REAL,
+                past_feat_dynamic_real,
+                target,
+            )
+
+    def merge(
+        self, other: "PartialDatasetStatistics"
+    ) -> "PartialDatasetStatistics":
+        """
+        Return the statistics of the union of both parts, leaving `self`
+        and `other` unchanged.
+        """
+        merged = PartialDatasetStatistics()
+        merged.num_time_observations = (
+            self.num_time_observations + other.num_time_observations
+        )
+        merged.num_time_series = self.num_time_series + other.num_time_series
+        merged.min_target = min(self.min_target, other.min_target)
+        merged.max_target = max(self.max_target, other.max_target)
+        merged.sum_target = self.sum_target + other.sum_target
+        merged.sum_abs_target = self.sum_abs_target + other.sum_abs_target
+        merged.integer_dataset = self.integer_dataset and other.integer_dataset
+        merged.max_target_length = max(
+            self.max_target_length, other.max_target_length
+        )
+        merged.num_missing_values = (
+            self.num_missing_values + other.num_missing_values
+        )
+        merged.observed_feat_static_cat = _merge_static_features(
+            FieldName.FEAT_STATIC_CAT,
+            self.observed_feat_static_cat,
+            other.observed_feat_static_cat,
+        )
+        merged.observed_feat_static_real = _merge_static_features(
+            FieldName.FEAT_STATIC_REAL,
+            self.observed_feat_static_real,
+            other.observed_feat_static_real,
+        )
+        merged.num_past_feat_dynamic_real = _merge_num_features(
+            FieldName.PAST_FEAT_DYNAMIC_REAL,
+            self.num_past_feat_dynamic_real,
+            other.num_past_feat_dynamic_real,
+        )
+        merged.num_feat_dynamic_real = _merge_num_features(
+            FieldName.FEAT_DYNAMIC_REAL,
+            self.num_feat_dynamic_real,
+            other.num_feat_dynamic_real,
+        )
+        merged.num_feat_dynamic_cat = _merge_num_features(
+            FieldName.FEAT_DYNAMIC_CAT,
+            self.num_feat_dynamic_cat,
+            other.num_feat_dynamic_cat,
+        )
+        merged.scale_histogram = self.scale_histogram.merge(
+            other.scale_histogram
+        )
+        return merged
+
+    def finalize(self) -> DatasetStatistics:
+        """
+        Return the `DatasetStatistics` of all time series added so far.
+        """
+        assert_data_error(
+            self.num_time_series > 0, "Time series dataset is empty!"
+        )
+        assert_data_error(
+            self.num_time_observations > 0,
+            "Only empty time series found in the dataset!",
+        )
+
+        # note this require the above assumption to avoid a division by zero
+        # runtime error
+        mean_target_length = self.num_time_observations / self.num_time_series
+
+        # note this require the above assumption to avoid a division by zero
+        # runtime error
+        mean_target = self.sum_target / self.num_time_observations
+        mean_abs_target = self.sum_abs_target / self.num_time_observations
+
+        integer_dataset = self.integer_dataset and self.min_target >= 0.0
+
+        assert len(self.scale_histogram) == self.num_time_series
+
+        return DatasetStatistics(
+            integer_dataset=integer_dataset,
+            max_target=self.max_target,
+            mean_abs_target=mean_abs_target,
+            mean_target=mean_target,
+            mean_target_length=mean_target_length,
+            max_target_length=self.max_target_length,
+            min_target=self.min_target,
+            num_missing_values=self.num_missing_values,
+            feat_static_real=self.observed_feat_static_real or [],
+            feat_static_cat=self.observed_feat_static_cat or [],
+            num_past_feat_dynamic_real=self.num_past_feat_dynamic_real,
+            num_feat_dynamic_real=self.num_feat_dynamic_real,
+            num_feat_dynamic_cat=self.num_feat_dynamic_cat,
+            num_time_observations=self.num_time_observations,
+            num_time_series=self.num_time_series,
+            scale_histogram=self.scale_histogram,
+        )
+
+
 # TODO: reorganize modules to avoid circular dependency
 # TODO: and substitute Any with Dataset
+def calculate_partial_statistics(
+    ts_dataset: Any, progress_bar: bool = True
+) -> PartialDatasetStatistics:
+    """
+    Computes the partial statistics of a given Dataset, which can be merged
+    with the ones of other datasets.
+
+    Parameters
+    ----------
+    ts_dataset
+        Dataset of which to compute the statistics.
+    progress_bar
+        Whether to show a progress bar.
+
+    Returns
+    -------
+    PartialDatasetStatistics
+        Statistics of the dataset, which are not finalized yet.
+    """
+    partial_statistics = PartialDatasetStatistics()
+
+    it = iter(ts_dataset)
+    if progress_bar:
+        it = tqdm(it, total=len(ts_dataset))
+
+    for ts in it:
+        partial_statistics.add(ts)
+
+    return partial_statistics
+
+
 def calculate_dataset_statistics(ts_dataset: Any) -> DatasetStatistics:
     """
     Computes the statistics of a given Dataset.
@@ -152,268 +514,43 @@ def calculate_dataset_statistics(ts_dataset: Any) -> DatasetStatistics:
     DatasetStatistics
         NamedTuple containing the statistics.
     """
-    num_time_observations = 0
-    num_time_series = 0
-    min_target = 1e20
-    max_target = -1e20
-    sum_target = 0.0
-    sum_abs_target = 0.0
-    integer_dataset = True
-    observed_feat_static_cat: Optional[List[Set[int]]] = None
-    observed_feat_static_real: Optional[List[Set[float]]] = None
-    num_feat_static_real: Optional[int] = None
-    num_feat_static_cat: Optional[int] = None
-    num_past_feat_dynamic_real: Optional[int] = None
-    num_feat_dynamic_real: Optional[int] = None
-    num_feat_dynamic_cat: Optional[int] = None
-    num_missing_values = 0
-
-    scale_histogram = ScaleHistogram()
-
-    with tqdm(enumerate(ts_dataset, start=1), total=len(ts_dataset)) as it:
-        max_target_length = 0
-        for num_time_series, ts in it:
-
-            # TARGET
-            target = ts[FieldName.TARGET]
-            observed_target = target[~np.isnan(target)]
-            num_observations = len(observed_target)
-
-            if num_observations > 0:
-                # 'nan' is handled in observed_target definition
-                assert_data_error(
-                    np.all(np.isfinite(observed_target)),
-                    "Target values have to be finite (e.g., not inf, -inf, "
-                    "or None) and cannot exceed single precision floating "
-                    "point range.",
-                )
-
-                num_time_observations += num_observations
-                max_target_length = max(num_observations, max_target_length)
-                min_target = float(min(min_target, observed_target.min()))
-                max_target = float(max(max_target, observed_target.max()))
-                num_missing_values += int(np.isnan(target).sum())
-                sum_target += float(observed_target.sum())
-                sum_abs_target += float(np.abs(observed_target).sum())
-                integer_dataset = integer_dataset and bool(
-                    np.all(np.mod(observed_target, 1) == 0)
-                )
-
-            scale_histogram.add(
-                observed_target
-            )  # after checks for inf and None
-
-            # FEAT_STATIC_CAT
-            feat_static_cat = (
-                ts[FieldName.FEAT_STATIC_CAT]
-                if FieldName.FEAT_STATIC_CAT in ts
-                else []
-            )
-
-            if num_feat_static_cat is None:
-                num_feat_static_cat = len(feat_static_cat)
-                observed_feat_static_cat = [
-                    set() for _ in range(num_feat_static_cat)
-                ]
+    return calculate_partial_statistics(ts_dataset).finalize()
 
-            # needed to type check
-            assert num_feat_static_cat is not None
-            assert observed_feat_static_cat is not None
 
-            assert_data_error(
-                num_feat_static_cat == len(feat_static_cat),
-                "Not all feat_static_cat vectors have the same length {} != {}.",
-                num_feat_static_cat,
-                len(feat_static_cat),
-            )
-            for i, c in enumerate(feat_static_cat):
-                observed_feat_static_cat[i].add(c)
-
-            # FEAT_STATIC_REAL
-            feat_static_real = (
-                ts[FieldName.FEAT_STATIC_REAL]
-                if FieldName.FEAT_STATIC_REAL in ts
-                else []
-            )
-
-            if num_feat_static_real is None:
-                num_feat_static_real = len(feat_static_real)
-                observed_feat_static_real = [
-                    set() for _ in range(num_feat_static_real)
-                ]
+def calculate_sharded_dataset_statistics(
+    shards: Sequence[Any], num_workers: Optional[int] = None
+) -> DatasetStatistics:
+    """
+    Computes the statistics of a dataset, which is split into shards, by
+    computing the partial statistics of the shards in parallel.
 
-            # needed to type check
-            assert num_feat_static_real is not None
-            assert observed_feat_static_real is not None
+    A `FileDataset` can for instance be split into one shard per file with
+    ``[FileDataset(path, freq) for path in dataset.files()]``.
 
-            assert_data_error(
-                num_feat_static_real == len(feat_static_real),
-                "Not all feat_static_real vectors have the same length {} != {}.",
-                num_feat_static_real,
-                len(feat_static_real),
-            )
-            for i, c in enumerate(feat_static_real):
-                observed_feat_static_real[i].add(c)
-
-            # FEAT_DYNAMIC_CAT
-            feat_dynamic_cat = (
-                ts[FieldName.FEAT_DYNAMIC_CAT]
-                if FieldName.FEAT_DYNAMIC_CAT in ts
-                else None
-            )
-
-            if feat_dynamic_cat is None:
-                # feat_dynamic_cat not found, check it was the first ts we encounter or
-                # that feat_dynamic_cat were seen before
-                assert_data_error(
-                    num_feat_dynamic_cat is None or num_feat_dynamic_cat == 0,
-                    "feat_dynamic_cat was found for some instances but not others.",
-                )
-                num_feat_dynamic_cat = 0
-            else:
-                if num_feat_dynamic_cat is None:
-                    # first num_feat_dynamic_cat found
-                    num_feat_dynamic_cat = len(feat_dynamic_cat)
-                else:
-                    assert_data_error(
-                        num_feat_dynamic_cat == len(feat_dynamic_cat),
-                        "Found instances with different number of features in "
-                        "feat_dynamic_cat, found one with {} and another with {}.",
-                        num_feat_dynamic_cat,
-                        len(feat_dynamic_cat),
-                    )
-
-                assert_data_error(
-                    np.all(np.isfinite(feat_dynamic_cat)),
-                    "Features values have to be finite and cannot exceed single "
-                    "precision floating point range.",
-                )
-                num_feat_dynamic_cat_time_steps = len(feat_dynamic_cat[0])
-                assert_data_error(
-                    num_feat_dynamic_cat_time_steps == len(target),
-                    "Each feature in feat_dynamic_cat has to have the same length as "
-                    "the target. Found an instance with feat_dynamic_cat of length {} "
-                    "and a target of length {}.",
-                    num_feat_dynamic_cat_time_steps,
-                    len(target),
-                )
-
-            # FEAT_DYNAMIC_REAL
-            feat_dynamic_real = None
-            if FieldName.FEAT_DYNAMIC_REAL in ts:
-                feat_dynamic_real = ts[FieldName.FEAT_DYNAMIC_REAL]
-            elif FieldName.FEAT_DYNAMIC_REAL_LEGACY in ts:
-                feat_dynamic_real = ts[FieldName.FEAT_DYNAMIC_REAL_LEGACY]
-
-            if feat_dynamic_real is None:
-                # feat_dynamic_real not found, check it was the first ts we encounter or
-                # that feat_dynamic_real were seen before
-                assert_data_error(
-                    num_feat_dynamic_real is None
-                    or num_feat_dynamic_real == 0,
-                    "feat_dynamic_real was found for some instances but not others.",
-                )
-                num_feat_dynamic_real = 0
-            else:
-                if num_feat_dynamic_real is None:
-                    # first num_feat_dynamic_real found
-                    num_feat_dynamic_real = len(feat_dynamic_real)
-                else:
-                    assert_data_error(
-                        num_feat_dynamic_real == len(feat_dynamic_real),
-                        "Found instances with different number of features in "
-                        "feat_dynamic_real, found one with {} and another with {}.",
-                        num_feat_dynamic_real,
-                        len(feat_dynamic_real),
-                    )
-
-                assert_data_error(
-                    np.all(np.isfinite(feat_dynamic_real)),
-                    "Features values have to be finite and cannot exceed single "
-                    "precision floating point range.",
-                )
-                num_feat_dynamic_real_time_steps = len(feat_dynamic_real[0])
-                assert_data_error(
-                    num_feat_dynamic_real_time_steps == len(target),
-                    "Each feature in feat_dynamic_real has to have the same length as "
-                    "the target. Found an instance with feat_dynamic_real of length {} "
-                    "and a target of length {}.",
-                    num_feat_dynamic_real_time_steps,
-                    len(target),
-                )
-
-            # PAST_FEAT_DYNAMIC_REAL
-            past_feat_dynamic_real = None
-            if FieldName.PAST_FEAT_DYNAMIC_REAL in ts:
-                past_feat_dynamic_real = ts[FieldName.PAST_FEAT_DYNAMIC_REAL]
-
-            if past_feat_dynamic_real is None:
-                # past_feat_dynamic_real not found, check it was the first ts we encounter or
-                # that past_feat_dynamic_real were seen before
-                assert_data_error(
-                    num_past_feat_dynamic_real is None
-                    or num_past_feat_dynamic_real == 0,
-                    "past_feat_dynamic_real was found for some instances but not others.",
-                )
-                num_past_feat_dynamic_real = 0
-            else:
-                if num_past_feat_dynamic_real is None:
-                    # first num_past_feat_dynamic_real found
-                    num_past_feat_dynamic_real = len(past_feat_dynamic_real)
-                else:
-                    assert_data_error(
-                        num_past_feat_dynamic_real
-                        == len(past_feat_dynamic_real),
-                        "Found instances with different number of features in "
-                        "past_feat_dynamic_real, found one with {} and another with {}.",
-                        num_past_feat_dynamic_real,
-                        len(past_feat_dynamic_real),
-                    )
-
-                assert_data_error(
-                    np.all(np.isfinite(past_feat_dynamic_real)),
-                    "Features values have to be finite and cannot exceed single "
-                    "precision floating point range.",
-                )
-
-    assert_data_error(num_time_series > 0, "Time series dataset is empty!")
-    assert_data_error(
-        num_time_observations > 0,
-        "Only empty time series found in the dataset!",
-    )
+    Parameters
+    ----------
+    shards
+        Datasets which together form the dataset of which to compute the
+        statistics. Shards need to be picklable.
+    num_workers
+        Number of worker processes, by default the number of CPUs. If 0,
+        the shards are processed in the main process.
 
-    # note this require the above assumption to avoid a division by zero
-    # runtime error
-    mean_target_length = num_time_observations / num_time_series
-
-    # note this require the above assumption to avoid a division by zero
-    # runtime error
-    mean_target = sum_target / num_time_observations
-    mean_abs_target = sum_abs_target / num_time_observations
-
-    integer_dataset = integer_dataset and min_target >= 0.0
-
-    assert len(scale_histogram) == num_time_series
-
-    return DatasetStatistics(
-        integer_dataset=integer_dataset,
-        max_target=max_target,
-        mean_abs_target=mean_abs_target,
-        mean_target=mean_target,
-        mean_target_length=mean_target_length,
-        max_target_length=max_target_length,
-        min_target=min_target,
-        num_missing_values=num_missing_values,
-        feat_static_real=observed_feat_static_real
-        if observed_feat_static_real
-        else [],
-        feat_static_cat=observed_feat_static_cat
-        if observed_feat_static_cat
-        else [],
-        num_past_feat_dynamic_real=num_past_feat_dynamic_real,
-        num_feat_dynamic_real=num_feat_dynamic_real,
-        num_feat_dynamic_cat=num_feat_dynamic_cat,
-        num_time_observations=num_time_observations,
-        num_time_series=num_time_series,
-        scale_histogram=scale_histogram,
-    )
+    Returns
+    -------
+    DatasetStatistics
+        NamedTuple containing the statistics.
+    """
+    compute = partial(calculate_partial_statistics, progress_bar=False)
+
+    if num_workers == 0 or sys.platform == "win32":
+        partial_statistics = list(map(compute, shards))
+    else:
+        with multiprocessing.Pool(processes=num_workers) as pool:
+            partial_statistics = pool.map(compute, shards, chunksize=1)
+
+    return reduce(
+        PartialDatasetStatistics.merge,
+        partial_statistics,
+        PartialDatasetStatistics(),
+    ).finalize()
@@ -88,6 +88,11 @@ def _split(
 
 
 def _list_files(directory: Path) -> Iterator[Path]:
+    directory = Path(directory)
+    if directory.is_file():
+        yield directory
+        return
+
     for dirname, _, filenames in os.walk(directory):
         for filename in filenames:
             yield Path(dirname, filename)
@@ -11,13 +11,21 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-from ._base import Evaluator, MultivariateEvaluator
-from .backtest import make_evaluation_predictions, backtest_metrics
+from ._base import ArrayTimeSeries, Evaluator, MultivariateEvaluator
+from ._streaming import MetricsAccumulator
+from .backtest import (
+    make_evaluation_arrays,
+    make_evaluation_predictions,
+    backtest_metrics,
+)
 
 __all__ = [
     "Evaluator",
     "MultivariateEvaluator",
+    "ArrayTimeSeries",
+    "MetricsAccumulator",
     "make_evaluation_predictions",
+    "make_evaluation_arrays",
     "backtest_metrics",
 ]
 
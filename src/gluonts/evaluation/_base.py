@@ -14,8 +14,9 @@
 import logging
 import multiprocessing
 import sys
-from functools import partial
-from itertools import chain, tee
+from functools import lru_cache, partial
+from itertools import chain, islice, tee
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -23,7 +24,9 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
@@ -32,9 +35,66 @@ import numpy as np
 import pandas as pd
 
 from gluonts.gluonts_tqdm import tqdm
-from gluonts.model.forecast import Forecast, Quantile
+from gluonts.model.forecast import Forecast, ForecastBatch, Quantile
 from gluonts.time_feature import get_seasonality
 
+from . import _vectorized
+from ._streaming import MetricsAccumulator
+
+
+class ArrayTimeSeries(NamedTuple):
+    """
+    Ground truth time series given by its start date and target array, with
+    the time axis last, like in a data entry.
+
+    The `Evaluator` aligns forecasts with it by an integer offset into the
+    target, computed from the frequency of the forecast, instead of by the
+    dates of a pandas index. Plain `(start, target)` tuples work the same.
+    """
+
+    start: pd.Timestamp
+    target: np.ndarray
+
+
+@lru_cache(maxsize=10000)
+def _start_offset(
+    start: pd.Timestamp, forecast_start: pd.Timestamp, freq: str
+) -> int:
+    """
+    Number of time steps of frequency `freq` from `start` to
+    `forecast_start`.
+
+    The result is cached, since many time series share their start date or
+    the start date of their forecast.
+    """
+    start = pd.Timestamp(start)
+    forecast_start = pd.Timestamp(forecast_start)
+    offset = pd.tseries.frequencies.to_offset(freq)
+
+    periods = forecast_start.to_period(freq) - start.to_period(freq)
+    num_steps = periods.n // offset.n
+
+    assert start + num_steps * offset == forecast_start, (
+        f"Start date of the forecast {forecast_start} is not aligned with "
+        f"start date of the target {start} for frequency {freq}"
+    )
+    return num_steps
+
+
+def _array_forecast_range(
+    time_series: Tuple[pd.Timestamp, np.ndarray], forecast: Forecast
+) -> Tuple[np.ndarray, int, int]:
+    start, target = time_series
+    begin = _start_offset(start, forecast.start_date, forecast.freq)
+    end = begin + forecast.prediction_length
+
+    assert 0 <= begin and end <= target.shape[-1], (
+        "Cannot extract prediction target since the forecast is outside "
+        f"the target: forecast covers steps {begin} to {end}, target has "
+        f"length {target.shape[-1]}"
+    )
+    return target, begin, end
+
 
 def nan_if_masked(a: Union[float, np.ma.core.MaskedConstant]) -> float:
     return a if a is not np.ma.masked else np.nan
@@ -88,6 +148,14 @@ class Evaluator:
     chunk_size
         Controls the approximate chunk size each workers handles at a time.
         Default is 32.
+    vectorized
+        Whether to compute the metrics of `chunk_size` time series at once,
+        over arrays holding all of them, instead of one time series at a
+        time. This is much faster for large numbers of time series; the
+        evaluation then happens in the main process, ignoring `num_workers`,
+        and larger values of `chunk_size` are preferable. The forecast
+        iterator may then also yield `ForecastBatch` objects, which are
+        evaluated at once.
     """
 
     default_quantiles = 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9
@@ -101,6 +169,7 @@ class Evaluator:
         custom_eval_fn: Optional[Dict] = None,
         num_workers: Optional[int] = multiprocessing.cpu_count(),
         chunk_size: int = 32,
+        vectorized: bool = False,
     ) -> None:
         self.quantiles = tuple(map(Quantile.parse, quantiles))
         self.seasonality = seasonality
@@ -109,10 +178,13 @@ class Evaluator:
         self.custom_eval_fn = custom_eval_fn
         self.num_workers = num_workers
         self.chunk_size = chunk_size
+        self.vectorized = vectorized
 
     def __call__(
         self,
-        ts_iterator: Iterable[Union[pd.DataFrame, pd.Series]],
+        ts_iterator: Iterable[
+            Union[pd.DataFrame, pd.Series, np.ndarray, ArrayTimeSeries]
+        ],
         fcst_iterator: Iterable[Forecast],
         num_series: Optional[int] = None,
     ) -> Tuple[Dict[str, float], pd.DataFrame]:
@@ -122,7 +194,10 @@ class Evaluator:
         Parameters
         ----------
         ts_iterator
-            iterator containing true target on the predicted range
+            iterator containing true target on the predicted range, either
+            as series indexed by date, as target arrays which end with the
+            prediction range of the forecasts, like the ones returned by
+            `make_evaluation_arrays`, or as `ArrayTimeSeries`
         fcst_iterator
             iterator of forecasts on the predicted range
         num_series
@@ -136,11 +211,122 @@ class Evaluator:
         pd.DataFrame
             DataFrame containing per-time-series metrics
         """
+        chunks = list(
+            self.iter_metrics_per_ts(ts_iterator, fcst_iterator, num_series)
+        )
+        metrics_per_ts = (
+            pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        )
+        return self.get_aggregate_metrics(metrics_per_ts)
+
+    def evaluate_streaming(
+        self,
+        ts_iterator: Iterable[
+            Union[pd.DataFrame, pd.Series, np.ndarray, ArrayTimeSeries]
+        ],
+        fcst_iterator: Iterable[Union[Forecast, ForecastBatch]],
+        num_series: Optional[int] = None,
+        item_metrics_path: Optional[Path] = None,
+    ) -> Dict[str, float]:
+        """
+        Compute the aggregated accuracy metrics, without keeping the metrics
+        of all time series in memory.
+
+        The metrics of each chunk of time series are added to a
+        `MetricsAccumulator`, which keeps running sums for the aggregations,
+        and are then discarded. To inspect the aggregated metrics during the
+        evaluation, use `iter_metrics_per_ts` and a `MetricsAccumulator`
+        directly.
+
+        Parameters
+        ----------
+        ts_iterator
+            iterator containing true target on the predicted range
+        fcst_iterator
+            iterator of forecasts on the predicted range
+        num_series
+            number of series of the iterator
+            (optional, only used for displaying progress)
+        item_metrics_path
+            optional path of a file to which the metrics of each time series
+            are appended as they are computed; they are written as Parquet
+            if the path ends with ".parquet", and as CSV otherwise
+
+        Returns
+        -------
+        dict
+            Dictionary of aggregated metrics
+        """
+        with MetricsAccumulator(self, item_metrics_path) as accumulator:
+            for chunk in self.iter_metrics_per_ts(
+                ts_iterator, fcst_iterator, num_series
+            ):
+                accumulator.add(chunk)
+
+        return accumulator.get_aggregate_metrics()
+
+    def iter_metrics_per_ts(
+        self,
+        ts_iterator: Iterable[
+            Union[pd.DataFrame, pd.Series, np.ndarray, ArrayTimeSeries]
+        ],
+        fcst_iterator: Iterable[Union[Forecast, ForecastBatch]],
+        num_series: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Compute the metrics of each time series, yielding them in chunks of
+        about `chunk_size` time series.
+
+        Parameters
+        ----------
+        ts_iterator
+            iterator containing true target on the predicted range
+        fcst_iterator
+            iterator of forecasts on the predicted range
+        num_series
+            number of series of the iterator
+            (optional, only used for displaying progress)
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame containing the metrics of the next time series
+        """
         ts_iterator = iter(ts_iterator)
         fcst_iterator = iter(fcst_iterator)
 
-        rows = []
+        num_rows = 0
+        if self.vectorized:
+            chunks = self._evaluate_chunks(
+                ts_iterator, fcst_iterator, num_series
+            )
+        else:
+            chunks = self._evaluate_per_ts(
+                ts_iterator, fcst_iterator, num_series
+            )
+        for chunk in chunks:
+            num_rows += len(chunk)
+            yield chunk
+
+        assert not any(
+            True for _ in ts_iterator
+        ), "ts_iterator has more elements than fcst_iterator"
 
+        assert not any(
+            True for _ in fcst_iterator
+        ), "fcst_iterator has more elements than ts_iterator"
+
+        if num_series is not None:
+            assert (
+                num_rows == num_series
+            ), f"num_series={num_series} did not match number of elements={num_rows}"
+
+    def _evaluate_per_ts(
+        self,
+        ts_iterator: Iterator[Union[pd.DataFrame, pd.Series]],
+        fcst_iterator: Iterator[Forecast],
+        num_series: Optional[int],
+    ) -> Iterator[pd.DataFrame]:
         with tqdm(
             zip(ts_iterator, fcst_iterator),
             total=num_series,
@@ -150,45 +336,101 @@ class Evaluator:
                 mp_pool = multiprocessing.Pool(
                     initializer=None, processes=self.num_workers
                 )
-                rows = mp_pool.map(
-                    func=partial(worker_function, self),
-                    iterable=iter(it),
-                    chunksize=self.chunk_size,
-                )
-                mp_pool.close()
-                mp_pool.join()
+                # hand out a bounded number of time series at a time, since
+                # `map` would read the whole input first
+                window_size = self.chunk_size * self.num_workers
+                try:
+                    while True:
+                        rows = mp_pool.map(
+                            func=partial(worker_function, self),
+                            iterable=list(islice(it, window_size)),
+                            chunksize=self.chunk_size,
+                        )
+                        if not rows:
+                            break
+                        yield self._to_metrics_frame(rows)
+                finally:
+                    mp_pool.close()
+                    mp_pool.join()
             else:
-                for ts, forecast in it:
-                    rows.append(self.get_metrics_per_ts(ts, forecast))
+                while True:
+                    rows = [
+                        self.get_metrics_per_ts(ts, forecast)
+                        for ts, forecast in islice(it, self.chunk_size)
+                    ]
+                    if not rows:
+                        break
+                    yield self._to_metrics_frame(rows)
 
-        assert not any(
-            True for _ in ts_iterator
-        ), "ts_iterator has more elements than fcst_iterator"
+    @staticmethod
+    def _to_metrics_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        # If all entries of a target array are NaNs, the resulting metric will have value "masked". Pandas does not
+        # handle masked values correctly. Thus we set dtype=np.float64 to convert masked values back to NaNs which
+        # are handled correctly by pandas Dataframes during aggregation.
+        return pd.DataFrame(rows, dtype=np.float64)
 
-        assert not any(
-            True for _ in fcst_iterator
-        ), "fcst_iterator has more elements than ts_iterator"
+    def _evaluate_chunks(
+        self,
+        ts_iterator: Iterator[Union[pd.DataFrame, pd.Series]],
+        fcst_iterator: Iterator[Union[Forecast, ForecastBatch]],
+        num_series: Optional[int],
+    ) -> Iterator[pd.DataFrame]:
+        with tqdm(
+            None, total=num_series, desc="Running evaluation"
+        ) as progress, np.errstate(invalid="ignore"):
+            for time_series, forecasts in self._iterate_chunks(
+                ts_iterator, fcst_iterator
+            ):
+                yield self.get_metrics_per_batch(time_series, forecasts)
+                progress.update(len(time_series))
+
+    def _iterate_chunks(
+        self,
+        ts_iterator: Iterator[Union[pd.DataFrame, pd.Series]],
+        fcst_iterator: Iterator[Union[Forecast, ForecastBatch]],
+    ) -> Iterator[Tuple[List, Union[List[Forecast], ForecastBatch]]]:
+        """
+        Groups forecasts into chunks of `chunk_size`, or into the given
+        forecast batches, together with their time series.
+        """
 
-        if num_series is not None:
+        def take_series(num: int) -> List:
+            time_series = list(islice(ts_iterator, num))
             assert (
-                len(rows) == num_series
-            ), f"num_series={num_series} did not match number of elements={len(rows)}"
+                len(time_series) == num
+            ), "fcst_iterator has more elements than ts_iterator"
+            return time_series
+
+        forecasts: List[Forecast] = []
+        for forecast in fcst_iterator:
+            if isinstance(forecast, ForecastBatch):
+                if forecasts:
+                    yield take_series(len(forecasts)), forecasts
+                    forecasts = []
+                yield take_series(len(forecast)), forecast
+            else:
+                forecasts.append(forecast)
+                if len(forecasts) == self.chunk_size:
+                    yield take_series(len(forecasts)), forecasts
+                    forecasts = []
 
-        # If all entries of a target array are NaNs, the resulting metric will have value "masked". Pandas does not
-        # handle masked values correctly. Thus we set dtype=np.float64 to convert masked values back to NaNs which
-        # are handled correctly by pandas Dataframes during aggregation.
-        metrics_per_ts = pd.DataFrame(rows, dtype=np.float64)
-        return self.get_aggregate_metrics(metrics_per_ts)
+        if forecasts:
+            yield take_series(len(forecasts)), forecasts
 
     @staticmethod
     def extract_pred_target(
-        time_series: Union[pd.Series, pd.DataFrame], forecast: Forecast
+        time_series: Union[
+            pd.Series, pd.DataFrame, np.ndarray, ArrayTimeSeries
+        ],
+        forecast: Forecast,
     ) -> np.ndarray:
         """
 
         Parameters
         ----------
         time_series
+            time series indexed by date, a target array which ends with the
+            prediction range of the forecast, or an `ArrayTimeSeries`
         forecast
 
         Returns
@@ -196,6 +438,19 @@ class Evaluator:
         np.ndarray
             time series cut in the Forecast object dates
         """
+        if isinstance(time_series, np.ndarray):
+            assert time_series.shape[-1] >= forecast.prediction_length, (
+                "Cannot extract prediction target since the target is "
+                "shorter than the forecast"
+            )
+            return np.atleast_1d(
+                np.squeeze(time_series[..., -forecast.prediction_length :])
+            )
+
+        if isinstance(time_series, tuple):
+            target, begin, end = _array_forecast_range(time_series, forecast)
+            return np.atleast_1d(np.squeeze(target[..., begin:end]))
+
         assert forecast.index.intersection(time_series.index).equals(
             forecast.index
         ), (
@@ -212,13 +467,18 @@ class Evaluator:
     # It extracts the training sequence from the Series or DataFrame to a numpy array
     @staticmethod
     def extract_past_data(
-        time_series: Union[pd.Series, pd.DataFrame], forecast: Forecast
+        time_series: Union[
+            pd.Series, pd.DataFrame, np.ndarray, ArrayTimeSeries
+        ],
+        forecast: Forecast,
     ) -> np.ndarray:
         """
 
         Parameters
         ----------
         time_series
+            time series indexed by date, a target array which ends with the
+            prediction range of the forecast, or an `ArrayTimeSeries`
         forecast
 
         Returns
@@ -226,6 +486,17 @@ class Evaluator:
         np.ndarray
             time series without the forecast dates
         """
+        if isinstance(time_series, np.ndarray):
+            assert (
+                time_series.shape[-1] >= forecast.prediction_length
+            ), "Target is shorter than the forecast"
+            return np.atleast_1d(
+                np.squeeze(time_series[..., : -forecast.prediction_length])
+            )
+
+        if isinstance(time_series, tuple):
+            target, begin, _ = _array_forecast_range(time_series, forecast)
+            return np.atleast_1d(np.squeeze(target[..., :begin]))
 
         assert forecast.index.intersection(time_series.index).equals(
             forecast.index
@@ -360,9 +631,183 @@ class Evaluator:
 
         return metrics
 
-    def get_aggregate_metrics(
-        self, metric_per_ts: pd.DataFrame
-    ) -> Tuple[Dict[str, float], pd.DataFrame]:
+    def get_metrics_per_batch(
+        self,
+        time_series: Sequence[Union[pd.Series, pd.DataFrame]],
+        forecasts: Union[Sequence[Forecast], ForecastBatch],
+    ) -> pd.DataFrame:
+        """
+        Vectorized version of `get_metrics_per_ts`, which computes the
+        metrics of several time series at once.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing the metrics of each time series, with the
+            same columns as the rows returned by `get_metrics_per_ts`.
+        """
+        forecast_list = list(forecasts)
+
+        pred_targets = [
+            np.array(self.extract_pred_target(ts, forecast))
+            for ts, forecast in zip(time_series, forecast_list)
+        ]
+        past_data = [
+            np.array(self.extract_past_data(ts, forecast))
+            for ts, forecast in zip(time_series, forecast_list)
+        ]
+
+        return self._get_metrics_from_arrays(
+            pred_targets, past_data, forecasts
+        )
+
+    def _get_metrics_from_arrays(
+        self,
+        pred_targets: List[np.ndarray],
+        past_data: List[np.ndarray],
+        forecasts: Union[Sequence[Forecast], ForecastBatch],
+    ) -> pd.DataFrame:
+        forecast_list = list(forecasts)
+
+        def quantile(q: float) -> np.ndarray:
+            if isinstance(forecasts, ForecastBatch):
+                return forecasts.quantile(q)
+            return _vectorized.stack_padded(
+                [forecast.quantile(q) for forecast in forecast_list]
+            )
+
+        # (num_series, prediction_length), with padding masked
+        target = np.ma.masked_invalid(_vectorized.stack_padded(pred_targets))
+        past_target = np.ma.masked_invalid(
+            _vectorized.stack_padded(past_data, align_right=True)
+        )
+
+        if isinstance(forecasts, ForecastBatch):
+            mean_fcst = forecasts.mean
+            has_mean = np.ones(len(forecasts), dtype=bool)
+        else:
+            means = []
+            for forecast in forecast_list:
+                try:
+                    means.append(forecast.mean)
+                except:
+                    means.append(None)
+            has_mean = np.array([mean is not None for mean in means])
+            mean_fcst = _vectorized.stack_padded(
+                [
+                    mean if mean is not None else np.full(len(target_), np.nan)
+                    for mean, target_ in zip(means, pred_targets)
+                ]
+            )
+        median_fcst = quantile(0.5)
+
+        seasonalities = {}
+        for forecast in forecast_list:
+            if forecast.freq not in seasonalities:
+                seasonalities[forecast.freq] = (
+                    self.seasonality
+                    if self.seasonality
+                    else get_seasonality(forecast.freq)
+                )
+        seasonal_error = _vectorized.seasonal_error(
+            past_target,
+            lengths=np.array([len(data) for data in past_data]),
+            seasonalities=np.array(
+                [seasonalities[forecast.freq] for forecast in forecast_list]
+            ),
+        )
+
+        item_ids = [forecast.item_id for forecast in forecast_list]
+
+        metrics: Dict[str, Any] = {
+            "item_id": item_ids
+            if any(item_id is not None for item_id in item_ids)
+            else np.full(len(item_ids), np.nan),
+            "MSE": np.where(
+                has_mean, _vectorized.mse(target, mean_fcst), np.nan
+            ),
+            "abs_error": _vectorized.abs_error(target, median_fcst),
+            "abs_target_sum": _vectorized.abs_target_sum(target),
+            "abs_target_mean": _vectorized.abs_target_mean(target),
+            "seasonal_error": seasonal_error,
+            "MASE": _vectorized.mase(target, median_fcst, seasonal_error),
+            "MAPE": _vectorized.mape(target, median_fcst),
+            "sMAPE": _vectorized.smape(target, median_fcst),
+            "OWA": np.full(len(forecast_list), np.nan),
+        }
+
+        # metrics which cannot be vectorized are computed per time series,
+        # on the same arrays `get_metrics_per_ts` uses
+        def per_ts_arrays(i: int) -> Tuple[np.ndarray, np.ndarray]:
+            length = len(pred_targets[i])
+            return (
+                np.ma.masked_invalid(pred_targets[i]),
+                np.asarray(median_fcst[i][:length]),
+            )
+
+        if self.custom_eval_fn is not None:
+            for k, (eval_fn, _, fcst_type) in self.custom_eval_fn.items():
+                values = []
+                for i in range(len(forecast_list)):
+                    pred_target, target_fcst = per_ts_arrays(i)
+                    if fcst_type == "mean":
+                        if has_mean[i]:
+                            target_fcst = mean_fcst[i][: len(pred_target)]
+                        else:
+                            logging.warning(
+                                "mean_fcst is None, therfore median_fcst is used."
+                            )
+                    try:
+                        value = eval_fn(pred_target, target_fcst)
+                    except:
+                        value = np.nan
+                    values.append(float(np.ma.filled(value, np.nan)))
+                metrics[k] = np.array(values, dtype=np.float64)
+
+        try:
+            metrics["MSIS"] = _vectorized.msis(
+                target,
+                quantile(self.alpha / 2),
+                quantile(1.0 - self.alpha / 2),
+                seasonal_error,
+                self.alpha,
+            )
+        except Exception:
+            logging.warning("Could not calculate MSIS metric.")
+            metrics["MSIS"] = np.full(len(forecast_list), np.nan)
+
+        if self.calculate_owa:
+            metrics["OWA"] = np.array(
+                [
+                    self.owa(
+                        *per_ts_arrays(i),
+                        np.ma.masked_invalid(past_data[i]),
+                        seasonal_error[i],
+                        forecast.start_date,
+                    )
+                    for i, forecast in enumerate(forecast_list)
+                ],
+                dtype=np.float64,
+            )
+
+        for q in self.quantiles:
+            forecast_quantile = quantile(q.value)
+
+            metrics[q.loss_name] = _vectorized.quantile_loss(
+                target, forecast_quantile, q.value
+            )
+            metrics[q.coverage_name] = _vectorized.coverage(
+                target, forecast_quantile
+            )
+
+        # same dtype handling as the rows of `get_metrics_per_ts`
+        return pd.DataFrame(metrics, dtype=np.float64)
+
+    def aggregation_functions(self) -> Dict[str, Any]:
+        """
+        Return how each of the per time series metrics is aggregated, as
+        the pandas aggregation to apply to its column.
+        """
         agg_funs = {
             "MSE": "mean",
             "abs_error": "sum",
@@ -384,6 +829,13 @@ class Evaluator:
             agg_funs[quantile.loss_name] = "sum"
             agg_funs[quantile.coverage_name] = "mean"
 
+        return agg_funs
+
+    def get_aggregate_metrics(
+        self, metric_per_ts: pd.DataFrame
+    ) -> Tuple[Dict[str, float], pd.DataFrame]:
+        agg_funs = self.aggregation_functions()
+
         assert (
             set(metric_per_ts.columns) >= agg_funs.keys()
         ), "Some of the requested item metrics are missing."
@@ -391,7 +843,14 @@ class Evaluator:
         totals = {
             key: metric_per_ts[key].agg(agg) for key, agg in agg_funs.items()
         }
+        return self.add_derived_metrics(totals), metric_per_ts
 
+    def add_derived_metrics(
+        self, totals: Dict[str, float]
+    ) -> Dict[str, float]:
+        """
+        Add the metrics derived from the aggregated metrics to `totals`.
+        """
         # derived metrics based on previous aggregate metrics
         totals["RMSE"] = np.sqrt(totals["MSE"])
         totals["NRMSE"] = totals["RMSE"] / totals["abs_target_mean"]
@@ -419,7 +878,7 @@ class Evaluator:
                 for q in self.quantiles
             ]
         )
-        return totals, metric_per_ts
+        return totals
 
     @staticmethod
     def mse(target: np.ndarray, forecast: np.ndarray) -> float:
@@ -0,0 +1,173 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # avoid circular import
+    from ._base import Evaluator
+
+USAGE_MESSAGE = """
+Cannot import `pyarrow`.
+
+Writing item metrics to Parquet requires `pyarrow`, which can be installed
+with
+
+    pip install pyarrow
+"""
+
+
+class MetricsAccumulator:
+    """
+    Aggregates the per time series metrics of an ``Evaluator`` as they are
+    computed, chunk by chunk.
+
+    Metrics aggregated with "sum" or "mean" are reduced to running sums and
+    counts, so that memory usage does not grow with the number of time
+    series; the values of metrics with any other aggregation (e.g. a custom
+    metric aggregated with "median") are kept until the end. The aggregated
+    metrics are available at any time through ``get_aggregate_metrics``.
+
+    Parameters
+    ----------
+    evaluator
+        Evaluator which computes the metrics.
+    item_metrics_path
+        Optional path of a file to which the metrics of each chunk are
+        appended, as Parquet if the path ends with ".parquet", and as CSV
+        otherwise. The file is overwritten if it exists.
+    """
+
+    def __init__(
+        self, evaluator: "Evaluator", item_metrics_path: Optional[Path] = None
+    ) -> None:
+        self.evaluator = evaluator
+        self.agg_funs = evaluator.aggregation_functions()
+        self.item_metrics_path = (
+            Path(item_metrics_path) if item_metrics_path is not None else None
+        )
+        self.num_series = 0
+
+        self._sums = {
+            key: 0.0
+            for key, agg in self.agg_funs.items()
+            if agg in ("sum", "mean")
+        }
+        self._counts = {key: 0 for key in self._sums}
+        self._values: Dict[str, List[np.ndarray]] = {
+            key: [] for key in self.agg_funs if key not in self._sums
+        }
+        self._parquet_writer = None
+
+    def add(self, metrics_per_ts: pd.DataFrame) -> None:
+        """
+        Add the metrics of a chunk of time series, as yielded by
+        ``Evaluator.iter_metrics_per_ts``.
+        """
+        assert (
+            set(metrics_per_ts.columns) >= self.agg_funs.keys()
+        ), "Some of the requested item metrics are missing."
+
+        for key in self._sums:
+            column = metrics_per_ts[key]
+            # like pandas, skip NaNs in both sums and means
+            self._sums[key] += column.sum()
+            self._counts[key] += column.count()
+        for key in self._values:
+            self._values[key].append(metrics_per_ts[key].to_numpy())
+
+        if self.item_metrics_path is not None:
+            self._write_item_metrics(metrics_per_ts)
+
+        self.num_series += len(metrics_per_ts)
+
+    def get_aggregate_metrics(self) -> Dict[str, float]:
+        """
+        Return the aggregated metrics of all time series added so far, in
+        the same form as ``Evaluator.get_aggregate_metrics``.
+        """
+        totals = {}
+        for key, agg in self.agg_funs.items():
+            if key in self._values:
+                values = self._values[key]
+                totals[key] = pd.Series(
+                    np.concatenate(values) if values else [],
+                    dtype=np.float64,
+                ).agg(agg)
+            elif agg == "sum":
+                totals[key] = self._sums[key]
+            elif self._counts[key] > 0:
+                totals[key] = self._sums[key] / self._counts[key]
+            else:
+                totals[key] = np.nan
+
+        return self.evaluator.add_derived_metrics(totals)
+
+    def _write_item_metrics(self, metrics_per_ts: pd.DataFrame) -> None:
+        if self.item_metrics_path.suffix == ".parquet":
+            self._write_parquet(metrics_per_ts)
+        else:
+            metrics_per_ts.to_csv(
+                self.item_metrics_path,
+                mode="a" if self.num_series > 0 else "w",
+                header=self.num_series == 0,
+                index=False,
+            )
+
+    def _write_parquet(self, metrics_per_ts: pd.DataFrame) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(USAGE_MESSAGE)
+
+        # item ids are NaN if the forecasts have none, so that the schema
+        # is fixed up front instead of inferred from the first chunk
+        metrics_per_ts = metrics_per_ts.assign(
+            item_id=[
+                None if pd.isna(item_id) else str(item_id)
+                for item_id in metrics_per_ts["item_id"]
+            ]
+        )
+        schema = pa.schema(
+            [
+                (name, pa.string() if name == "item_id" else pa.float64())
+                for name in metrics_per_ts.columns
+            ]
+        )
+        table = pa.Table.from_pandas(
+            metrics_per_ts, schema=schema, preserve_index=False
+        )
+
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(
+                str(self.item_metrics_path), schema
+            )
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        """
+        Finish writing the item metrics file.
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self) -> "MetricsAccumulator":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
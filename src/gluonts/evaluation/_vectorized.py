@@ -0,0 +1,169 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+Vectorized versions of the metrics of the ``Evaluator``.
+
+All functions take masked arrays of shape (num_series, length), where
+invalid and padded values are masked, and compute the metric of each row,
+in the same way the corresponding ``Evaluator`` method does for a single
+time series. Rows for which the metric is undefined are NaN.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+def stack_padded(
+    arrays: Sequence[np.ndarray], align_right: bool = False
+) -> np.ndarray:
+    """
+    Stack 1D arrays of possibly different lengths into a 2D array, padded
+    with NaNs.
+
+    Parameters
+    ----------
+    arrays
+        arrays to stack
+    align_right
+        pad the arrays on the left instead of the right, which aligns their
+        ends
+    """
+    lengths = [len(array) for array in arrays]
+    max_length = max(lengths, default=0)
+
+    if all(length == max_length for length in lengths):
+        stacked = np.stack(arrays) if arrays else np.empty((0, 0))
+    else:
+        dtype = np.result_type(*arrays)
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+        stacked = np.full((len(arrays), max_length), np.nan, dtype=dtype)
+        for row, (array, length) in enumerate(zip(arrays, lengths)):
+            if align_right:
+                stacked[row, max_length - length :] = array
+            else:
+                stacked[row, :length] = array
+
+    return stacked
+
+
+def _filled(values) -> np.ndarray:
+    values = np.ma.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    return np.ma.filled(values, np.nan)
+
+
+def _zero_as_nan(denominator: np.ndarray) -> np.ndarray:
+    return np.where(np.isclose(denominator, 0.0), np.nan, denominator)
+
+
+def mse(target: np.ma.MaskedArray, forecast: np.ndarray) -> np.ndarray:
+    return _filled(np.mean(np.square(target - forecast), axis=1))
+
+
+def abs_error(target: np.ma.MaskedArray, forecast: np.ndarray) -> np.ndarray:
+    return _filled(np.sum(np.abs(target - forecast), axis=1))
+
+
+def abs_target_sum(target: np.ma.MaskedArray) -> np.ndarray:
+    return _filled(np.sum(np.abs(target), axis=1))
+
+
+def abs_target_mean(target: np.ma.MaskedArray) -> np.ndarray:
+    return _filled(np.mean(np.abs(target), axis=1))
+
+
+def quantile_loss(
+    target: np.ma.MaskedArray, forecast: np.ndarray, q: float
+) -> np.ndarray:
+    return _filled(
+        2
+        * np.sum(
+            np.abs((forecast - target) * ((target <= forecast) - q)), axis=1
+        )
+    )
+
+
+def coverage(target: np.ma.MaskedArray, forecast: np.ndarray) -> np.ndarray:
+    return _filled(np.mean(target < forecast, axis=1))
+
+
+def seasonal_error(
+    past_data: np.ma.MaskedArray,
+    lengths: np.ndarray,
+    seasonalities: np.ndarray,
+) -> np.ndarray:
+    """
+    Seasonal error of right-aligned past data, where row `i` contains
+    `lengths[i]` values and has seasonality `seasonalities[i]`.
+    """
+    # edge case: the seasonal freq is larger than the length of ts
+    # revert to freq=1
+    seasonalities = np.where(seasonalities < lengths, seasonalities, 1)
+
+    result = None
+    for seasonality in np.unique(seasonalities):
+        rows = seasonalities == seasonality
+        data = past_data[rows]
+        y_t = data[:, :-seasonality]
+        y_tm = data[:, seasonality:]
+        values = _filled(np.mean(abs(y_t - y_tm), axis=1))
+        if result is None:
+            # keep the precision of the data, like the per series metric
+            result = np.full(len(past_data), np.nan, dtype=values.dtype)
+        result[rows] = values
+
+    return result if result is not None else np.full(len(past_data), np.nan)
+
+
+def mase(
+    target: np.ma.MaskedArray, forecast: np.ndarray, seasonal_error: np.ndarray
+) -> np.ndarray:
+    return _filled(
+        np.mean(np.abs(target - forecast), axis=1)
+        / _zero_as_nan(seasonal_error)
+    )
+
+
+def mape(target: np.ma.MaskedArray, forecast: np.ndarray) -> np.ndarray:
+    denominator = np.abs(target)
+    denominator = np.ma.masked_where(np.isclose(denominator, 0.0), denominator)
+    return _filled(np.mean(np.abs(target - forecast) / denominator, axis=1))
+
+
+def smape(target: np.ma.MaskedArray, forecast: np.ndarray) -> np.ndarray:
+    denominator = np.abs(target) + np.abs(forecast)
+    denominator = np.ma.masked_where(np.isclose(denominator, 0.0), denominator)
+    return _filled(
+        2 * np.mean(np.abs(target - forecast) / denominator, axis=1)
+    )
+
+
+def msis(
+    target: np.ma.MaskedArray,
+    lower_quantile: np.ndarray,
+    upper_quantile: np.ndarray,
+    seasonal_error: np.ndarray,
+    alpha: float,
+) -> np.ndarray:
+    numerator = np.mean(
+        upper_quantile
+        - lower_quantile
+        + 2.0 / alpha * (lower_quantile - target) * (target < lower_quantile)
+        + 2.0 / alpha * (target - upper_quantile) * (target > upper_quantile),
+        axis=1,
+    )
+    return _filled(numerator / _zero_as_nan(seasonal_error))
@@ -13,8 +13,10 @@
 
 import logging
 import re
+from itertools import tee
 from typing import Dict, Iterator, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 import gluonts  # noqa
@@ -87,13 +89,7 @@ def make_evaluation_predictions(
             yield data_entry["ts"]
 
     def truncate_target(data):
-        data = data.copy()
-        target = data["target"]
-        assert (
-            target.shape[-1] >= prediction_length
-        )  # handles multivariate case (target_dim, history_length)
-        data["target"] = target[..., : -prediction_length - lead_time]
-        return data
+        return _truncate_target(data, prediction_length, lead_time)
 
     # TODO filter out time series with target shorter than prediction length
     # TODO or fix the evaluator so it supports missing values instead (all
@@ -109,6 +105,75 @@ def make_evaluation_predictions(
     )
 
 
+def _truncate_target(
+    data: DataEntry, prediction_length: int, lead_time: int
+) -> DataEntry:
+    data = data.copy()
+    target = data["target"]
+    assert (
+        target.shape[-1] >= prediction_length
+    )  # handles multivariate case (target_dim, history_length)
+    data["target"] = target[..., : -prediction_length - lead_time]
+    return data
+
+
+def make_evaluation_arrays(
+    dataset: Dataset,
+    predictor: Predictor,
+    num_samples: int = 100,
+) -> Tuple[Iterator[Forecast], Iterator[np.ndarray]]:
+    """
+    Like `make_evaluation_predictions`, but reads the dataset only once, and
+    returns the ground truth as plain target arrays instead of pandas
+    objects.
+
+    Each entry is read once and handed, truncated, to the predictor; only
+    its target array is kept as ground truth. The target arrays end with
+    the prediction range of the corresponding forecasts, which is how the
+    `Evaluator` aligns them, so that no dates are involved in evaluating.
+
+    The two iterators share the pass over the dataset: entries read by one
+    of them are buffered until the other one reaches them too. They are
+    meant to be consumed side by side, as the `Evaluator` does; consuming
+    one of them entirely before the other one buffers the whole dataset.
+
+    Parameters
+    ----------
+    dataset
+        Dataset where the evaluation will happen. Only the portion excluding
+        the prediction_length portion is used when making prediction.
+    predictor
+        Model used to draw predictions.
+    num_samples
+        Number of samples to draw on the model when evaluating. Only sampling-based
+        models will use this.
+
+    Returns
+    -------
+    Tuple[Iterator[Forecast], Iterator[np.ndarray]]
+        A pair of iterators, the first one yielding the forecasts, and the second
+        one yielding the corresponding target arrays.
+    """
+
+    prediction_length = predictor.prediction_length
+    lead_time = predictor.lead_time
+
+    entries_to_predict, entries_to_evaluate = tee(iter(dataset))
+
+    def truncated_entries() -> Iterator[DataEntry]:
+        for data_entry in entries_to_predict:
+            yield _truncate_target(data_entry, prediction_length, lead_time)
+
+    def targets() -> Iterator[np.ndarray]:
+        for data_entry in entries_to_evaluate:
+            yield data_entry["target"]
+
+    return (
+        predictor.predict(truncated_entries(), num_samples=num_samples),
+        targets(),
+    )
+
+
 train_dataset_stats_key = "train_dataset_stats"
 test_dataset_stats_key = "test_dataset_stats"
 estimator_key = "estimator"
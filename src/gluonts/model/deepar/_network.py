@@ -510,6 +510,7 @@ class DeepARPredictionNetwork(DeepARNetwork):
         time_feat: Tensor,
         scale: Tensor,
         begin_states: List,
+        num_samples: Optional[int] = None,
     ) -> Tensor:
         """
         Computes sample paths by unrolling the LSTM starting with a initial
@@ -528,6 +529,8 @@ class DeepARPredictionNetwork(DeepARNetwork):
         begin_states : List
             list of initial states for the LSTM layers.
             the shape of each tensor of the list should be (batch_size, num_cells)
+        num_samples : Optional[int]
+            number of sample paths to draw, by default `num_parallel_samples`.
         Returns
         --------
         Tensor
@@ -535,22 +538,26 @@ class DeepARPredictionNetwork(DeepARNetwork):
             Shape: (batch_size, num_sample_paths, prediction_length).
         """
 
-        # blows-up the dimension of each tensor to batch_size * self.num_parallel_samples for increasing parallelism
-        repeated_past_target = past_target.repeat(
-            repeats=self.num_parallel_samples, axis=0
-        )
-        repeated_time_feat = time_feat.repeat(
-            repeats=self.num_parallel_samples, axis=0
+        if num_samples is None:
+            num_samples = self.num_parallel_samples
+
+        # only the last `max(lags_seq)` values are ever looked up, so the
+        # decoder keeps a fixed-size window of the target instead of the
+        # whole, growing history; this keeps the cost of each step constant
+        window_length = max(self.lags_seq)
+        past_window = past_target.slice_axis(
+            axis=1, begin=-window_length, end=None
         )
+
+        # blows-up the dimension of each tensor to batch_size * num_samples for increasing parallelism
+        repeated_window = past_window.repeat(repeats=num_samples, axis=0)
+        repeated_time_feat = time_feat.repeat(repeats=num_samples, axis=0)
         repeated_static_feat = static_feat.repeat(
-            repeats=self.num_parallel_samples, axis=0
+            repeats=num_samples, axis=0
         ).expand_dims(axis=1)
-        repeated_scale = scale.repeat(
-            repeats=self.num_parallel_samples, axis=0
-        )
+        repeated_scale = scale.repeat(repeats=num_samples, axis=0)
         repeated_states = [
-            s.repeat(repeats=self.num_parallel_samples, axis=0)
-            for s in begin_states
+            s.repeat(repeats=num_samples, axis=0) for s in begin_states
         ]
 
         future_samples = []
@@ -560,8 +567,8 @@ class DeepARPredictionNetwork(DeepARNetwork):
             # (batch_size * num_samples, 1, *target_shape, num_lags)
             lags = self.get_lagged_subsequences(
                 F=F,
-                sequence=repeated_past_target,
-                sequence_length=self.history_length + k,
+                sequence=repeated_window,
+                sequence_length=window_length,
                 indices=self.shifted_lags,
                 subsequences_length=1,
             )
@@ -606,9 +613,12 @@ class DeepARPredictionNetwork(DeepARNetwork):
             # (batch_size * num_samples, 1, *target_shape)
             new_samples = distr.sample(dtype=self.dtype)
 
-            # (batch_size * num_samples, seq_len, *target_shape)
-            repeated_past_target = F.concat(
-                repeated_past_target, new_samples, dim=1
+            # shift the window by one step
+            # (batch_size * num_samples, window_length, *target_shape)
+            repeated_window = F.concat(
+                repeated_window.slice_axis(axis=1, begin=1, end=None),
+                new_samples,
+                dim=1,
             )
             future_samples.append(new_samples)
 
@@ -618,7 +628,7 @@ class DeepARPredictionNetwork(DeepARNetwork):
         # (batch_size, num_samples, prediction_length, *target_shape)
         return samples.reshape(
             shape=(
-                (-1, self.num_parallel_samples)
+                (-1, num_samples)
                 + (self.prediction_length,)
                 + self.target_shape
             )
@@ -673,3 +683,46 @@ class DeepARPredictionNetwork(DeepARNetwork):
             scale=scale,
             begin_states=state,
         )
+
+    def encode(
+        self,
+        feat_static_cat: Tensor,
+        feat_static_real: Tensor,
+        past_time_feat: Tensor,
+        past_target: Tensor,
+        past_observed_values: Tensor,
+        future_time_feat: Tensor,
+    ) -> List[Tensor]:
+        """
+        Runs the encoder on the same inputs as the network, and returns the
+        state from which `sample_from_state` draws sample paths.
+        """
+        _, state, scale, static_feat = self.unroll_encoder(
+            F=mx.nd,
+            feat_static_cat=feat_static_cat,
+            feat_static_real=feat_static_real,
+            past_time_feat=past_time_feat,
+            past_target=past_target,
+            past_observed_values=past_observed_values,
+            future_time_feat=None,
+            future_target=None,
+        )
+        return [past_target, future_time_feat, static_feat, scale] + state
+
+    def sample_from_state(
+        self, state: List[Tensor], num_samples: int
+    ) -> Tensor:
+        """
+        Draws `num_samples` sample paths from a state returned by `encode`,
+        without running the encoder again.
+        """
+        past_target, future_time_feat, static_feat, scale, *states = state
+        return self.sampling_decoder(
+            F=mx.nd,
+            past_target=past_target,
+            time_feat=future_time_feat,
+            static_feat=static_feat,
+            scale=scale,
+            begin_states=states,
+            num_samples=num_samples,
+        )
@@ -544,6 +544,7 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
         time_feat: Tensor,
         scale: Tensor,
         begin_states: List[Tensor],
+        num_samples: Optional[int] = None,
     ) -> Tensor:
         """
         Computes sample paths by unrolling the RNN starting with a initial
@@ -563,6 +564,8 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
             Mean scale for each time series (batch_size, 1, target_dim)
         begin_states
             List of initial states for the RNN layers (batch_size, num_cells)
+        num_samples
+            Number of sample paths to draw, by default `num_parallel_samples`.
         Returns
         --------
         sample_paths : Tensor
@@ -570,11 +573,14 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
             prediction_length, target_dim).
         """
 
+        if num_samples is None:
+            num_samples = self.num_parallel_samples
+
         def repeat(tensor):
-            return tensor.repeat(repeats=self.num_parallel_samples, axis=0)
+            return tensor.repeat(repeats=num_samples, axis=0)
 
         # blows-up the dimension of each tensor to
-        # batch_size * self.num_sample_paths for increasing parallelism
+        # batch_size * num_samples for increasing parallelism
         repeated_past_target_cdf = repeat(past_target_cdf)
         repeated_time_feat = repeat(time_feat)
         repeated_scale = repeat(scale)
@@ -583,7 +589,7 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
         )
 
         # slight difference for GPVAR and DeepVAR, in GPVAR, its a list
-        repeated_states = self.make_states(begin_states)
+        repeated_states = self.make_states(begin_states, num_samples)
 
         future_samples = []
 
@@ -635,13 +641,15 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
         return samples.reshape(
             shape=(
                 -1,
-                self.num_parallel_samples,
+                num_samples,
                 self.prediction_length,
                 self.target_dim,
             )
         )
 
-    def make_states(self, begin_states: List[Tensor]) -> List[Tensor]:
+    def make_states(
+        self, begin_states: List[Tensor], num_samples: Optional[int] = None
+    ) -> List[Tensor]:
         """
         Repeat states to match the the shape induced by the number of sample
         paths.
@@ -650,14 +658,18 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
         ----------
         begin_states
             List of initial states for the RNN layers (batch_size, num_cells)
+        num_samples
+            Number of sample paths, by default `num_parallel_samples`.
 
         Returns
         -------
             List of initial states
         """
+        if num_samples is None:
+            num_samples = self.num_parallel_samples
 
         def repeat(tensor):
-            return tensor.repeat(repeats=self.num_parallel_samples, axis=0)
+            return tensor.repeat(repeats=num_samples, axis=0)
 
         return [repeat(s) for s in begin_states]
 
@@ -702,6 +714,48 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
 
         """
 
+        (
+            past_target_cdf,
+            target_dimension_indicator,
+            time_feat,
+            scale,
+            *state,
+        ) = self.predict_encode(
+            F,
+            target_dimension_indicator=target_dimension_indicator,
+            past_time_feat=past_time_feat,
+            past_target_cdf=past_target_cdf,
+            past_observed_values=past_observed_values,
+            past_is_pad=past_is_pad,
+            future_time_feat=future_time_feat,
+        )
+
+        return self.sampling_decoder(
+            F=F,
+            past_target_cdf=past_target_cdf,
+            target_dimension_indicator=target_dimension_indicator,
+            time_feat=time_feat,
+            scale=scale,
+            begin_states=state,
+        )
+
+    def predict_encode(
+        self,
+        F,
+        target_dimension_indicator: Tensor,
+        past_time_feat: Tensor,
+        past_target_cdf: Tensor,
+        past_observed_values: Tensor,
+        past_is_pad: Tensor,
+        future_time_feat: Tensor,
+    ) -> List[Tensor]:
+        """
+        Runs the encoder in prediction mode, and returns the arguments of
+        `sampling_decoder` as list: the past target, the target dimension
+        indicator, the future time features, the scale and the begin states.
+        The arguments are the same as for `predict_hybrid_forward`.
+        """
+
         # mark padded data as unobserved
         # (batch_size, target_dim, seq_len)
         past_observed_values = F.broadcast_minimum(
@@ -720,14 +774,12 @@ class DeepVARNetwork(mx.gluon.HybridBlock):
             target_dimension_indicator=target_dimension_indicator,
         )
 
-        return self.sampling_decoder(
-            F=F,
-            past_target_cdf=past_target_cdf,
-            target_dimension_indicator=target_dimension_indicator,
-            time_feat=future_time_feat,
-            scale=scale,
-            begin_states=state,
-        )
+        return [
+            past_target_cdf,
+            target_dimension_indicator,
+            future_time_feat,
+            scale,
+        ] + state
 
 
 class DeepVARTrainingNetwork(DeepVARNetwork):
@@ -860,3 +912,50 @@ class DeepVARPredictionNetwork(DeepVARNetwork):
             past_is_pad=past_is_pad,
             future_time_feat=future_time_feat,
         )
+
+    def encode(
+        self,
+        target_dimension_indicator: Tensor,
+        past_time_feat: Tensor,
+        past_target_cdf: Tensor,
+        past_observed_values: Tensor,
+        past_is_pad: Tensor,
+        future_time_feat: Tensor,
+    ) -> List[Tensor]:
+        """
+        Runs the encoder on the same inputs as the network, and returns the
+        state from which `sample_from_state` draws sample paths.
+        """
+        return self.predict_encode(
+            mx.nd,
+            target_dimension_indicator=target_dimension_indicator,
+            past_time_feat=past_time_feat,
+            past_target_cdf=past_target_cdf,
+            past_observed_values=past_observed_values,
+            past_is_pad=past_is_pad,
+            future_time_feat=future_time_feat,
+        )
+
+    def sample_from_state(
+        self, state: List[Tensor], num_samples: int
+    ) -> Tensor:
+        """
+        Draws `num_samples` sample paths from a state returned by `encode`,
+        without running the encoder again.
+        """
+        (
+            past_target_cdf,
+            target_dimension_indicator,
+            time_feat,
+            scale,
+            *begin_states,
+        ) = state
+        return self.sampling_decoder(
+            F=mx.nd,
+            past_target_cdf=past_target_cdf,
+            target_dimension_indicator=target_dimension_indicator,
+            time_feat=time_feat,
+            scale=scale,
+            begin_states=begin_states,
+            num_samples=num_samples,
+        )
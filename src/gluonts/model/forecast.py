@@ -12,8 +12,18 @@
 # permissions and limitations under the License.
 
 import re
+from collections import OrderedDict
 from enum import Enum
-from typing import Callable, Dict, List, NamedTuple, Optional, Set, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -107,6 +117,14 @@ class Quantile(NamedTuple):
             return cls.from_str(quantile)
 
 
+def _arrays_to_lists(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, dict):
+        return {key: _arrays_to_lists(value) for key, value in obj.items()}
+    return obj
+
+
 class Forecast:
     """
     A abstract class representing predictions.
@@ -277,17 +295,24 @@ class Forecast:
         """
         raise NotImplementedError()
 
-    def as_json_dict(self, config: "Config") -> dict:
+    def as_array_dict(self, config: "Config") -> dict:
+        """
+        Return the outputs requested in `config`, with the forecasted values
+        as numpy arrays.
+
+        In contrast to `as_json_dict`, the arrays are not converted to
+        lists, so that they can be serialized directly.
+        """
         result = {}
 
         if OutputType.mean in config.output_types:
-            result["mean"] = self.mean.tolist()
+            result["mean"] = self.mean
 
         if OutputType.quantiles in config.output_types:
             quantiles = map(Quantile.parse, config.quantiles)
 
             result["quantiles"] = {
-                quantile.name: self.quantile(quantile.value).tolist()
+                quantile.name: self.quantile(quantile.value)
                 for quantile in quantiles
             }
 
@@ -296,6 +321,9 @@ class Forecast:
 
         return result
 
+    def as_json_dict(self, config: "Config") -> dict:
+        return _arrays_to_lists(self.as_array_dict(config))
+
 
 class SampleForecast(Forecast):
     """
@@ -333,21 +361,69 @@ class SampleForecast(Forecast):
         ), "samples should be a 2-dimensional or 3-dimensional array. Dimensions found: {}".format(
             len(np.shape(samples))
         )
+        assert isinstance(
+            start_date, pd.Timestamp
+        ), "start_date should be a pandas Timestamp object"
+        assert isinstance(freq, str), "freq should be a string"
+
+        self._set_fields(samples, start_date, freq, item_id, info)
+
+    def _set_fields(
+        self,
+        samples: np.ndarray,
+        start_date: pd.Timestamp,
+        freq: str,
+        item_id: Optional[str],
+        info: Optional[Dict],
+    ) -> None:
         self.samples = samples
         self._sorted_samples_value = None
         self._mean = None
         self._dim = None
         self.item_id = item_id
         self.info = info
-
-        assert isinstance(
-            start_date, pd.Timestamp
-        ), "start_date should be a pandas Timestamp object"
         self.start_date = start_date
-
-        assert isinstance(freq, str), "freq should be a string"
         self.freq = freq
 
+    @classmethod
+    def from_arrays(
+        cls,
+        samples: np.ndarray,
+        start_date: pd.Timestamp,
+        freq: str,
+        item_id: Optional[str] = None,
+        info: Optional[Dict] = None,
+    ) -> "SampleForecast":
+        """
+        Creates a forecast without validating the arguments.
+
+        This is meant for forecast generators, which create a large number of
+        forecasts from arrays they produced themselves, and for which the
+        validation done by the constructor is a significant overhead. The
+        arguments must be of the types expected by the constructor. The
+        resulting forecast is equivalent to one created by the constructor,
+        and can be serialized in the same way.
+        """
+        if item_id is not None and not isinstance(item_id, str):
+            # the constructor coerces `item_id` to `str` as well
+            item_id = str(item_id)
+
+        forecast = cls.__new__(cls)
+        forecast.__init_args__ = OrderedDict(
+            [
+                ("freq", freq),
+                ("info", info),
+                ("item_id", item_id),
+                ("samples", samples),
+                ("start_date", start_date),
+            ]
+        )
+        forecast._set_fields(samples, start_date, freq, item_id, info)
+        return forecast
+
+    def __getnewargs_ex__(self):
+        return (), self.__init_args__
+
     @property
     def _sorted_samples(self):
         if self._sorted_samples_value is None:
@@ -436,11 +512,11 @@ class SampleForecast(Forecast):
                 # shape: (num_samples, prediction_length, target_dim)
                 return self.samples.shape[2]
 
-    def as_json_dict(self, config: "Config") -> dict:
-        result = super().as_json_dict(config)
+    def as_array_dict(self, config: "Config") -> dict:
+        result = super().as_array_dict(config)
 
         if OutputType.samples in config.output_types:
-            result["samples"] = self.samples.tolist()
+            result["samples"] = self.samples
 
         return result
 
@@ -498,15 +574,35 @@ class QuantileForecast(Forecast):
         item_id: Optional[str] = None,
         info: Optional[Dict] = None,
     ) -> None:
-        self.forecast_array = forecast_arrays
-        self.start_date = pd.Timestamp(start_date, freq=freq)
-        self.freq = freq
+        self._set_fields(
+            forecast_arrays,
+            pd.Timestamp(start_date, freq=freq),
+            freq,
+            self.normalize_keys(forecast_keys),
+            item_id,
+            info,
+        )
 
-        # normalize keys
-        self.forecast_keys = [
-            Quantile.from_str(key).name if key != "mean" else key
+    @staticmethod
+    def normalize_keys(forecast_keys: List[Union[float, str]]) -> List[str]:
+        return [
+            Quantile.parse(key).name if key != "mean" else key
             for key in forecast_keys
         ]
+
+    def _set_fields(
+        self,
+        forecast_arrays: np.ndarray,
+        start_date: pd.Timestamp,
+        freq: str,
+        forecast_keys: List[str],
+        item_id: Optional[str],
+        info: Optional[Dict],
+    ) -> None:
+        self.forecast_array = forecast_arrays
+        self.start_date = start_date
+        self.freq = freq
+        self.forecast_keys = forecast_keys
         self.item_id = item_id
         self.info = info
         self._dim = None
@@ -523,6 +619,30 @@ class QuantileForecast(Forecast):
 
         self._nan_out = np.array([np.nan] * self.prediction_length)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        forecast_arrays: np.ndarray,
+        start_date: pd.Timestamp,
+        freq: str,
+        forecast_keys: List[str],
+        item_id: Optional[str] = None,
+        info: Optional[Dict] = None,
+    ) -> "QuantileForecast":
+        """
+        Creates a forecast without converting the arguments.
+
+        This is meant for forecast generators, which create a large number of
+        forecasts. Unlike for the constructor, `start_date` must already be
+        a `pd.Timestamp` with the frequency set, and `forecast_keys` must
+        already be normalized with `normalize_keys`.
+        """
+        forecast = cls.__new__(cls)
+        forecast._set_fields(
+            forecast_arrays, start_date, freq, forecast_keys, item_id, info
+        )
+        return forecast
+
     def quantile(self, q: Union[float, str]) -> np.ndarray:
         q_str = Quantile.parse(q).name
         # We return nan here such that evaluation runs through
@@ -584,6 +704,126 @@ class QuantileForecast(Forecast):
             plt.savefig(output_file)
 
 
+class ForecastBatch:
+    """
+    A batch of sample based forecasts, where the samples of all time series
+    are kept in a single array.
+
+    Quantiles and means are computed for the whole batch at once; iterating
+    over the batch, or indexing it, gives a :class:`SampleForecast` for each
+    time series, whose samples are views into the batch array.
+
+    Parameters
+    ----------
+    samples
+        Array of size (batch_size, num_samples, prediction_length) (1D case)
+        or (batch_size, num_samples, prediction_length, target_dim)
+        (multivariate case)
+    start_dates
+        start of the forecast, for each time series
+    freq
+        forecast frequency
+    item_ids
+        item_id of each time series, if any
+    info
+        additional information for each time series, if any
+    """
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        start_dates: List[pd.Timestamp],
+        freq: str,
+        item_ids: Optional[List[Optional[str]]] = None,
+        info: Optional[List[Optional[Dict]]] = None,
+    ) -> None:
+        assert isinstance(
+            samples, np.ndarray
+        ), "samples should be a numpy array"
+        assert samples.ndim in (3, 4), (
+            "samples should be a 3-dimensional or 4-dimensional array. "
+            f"Dimensions found: {samples.ndim}"
+        )
+        assert len(start_dates) == len(samples), (
+            f"Found {len(start_dates)} start dates for a batch of "
+            f"{len(samples)} forecasts."
+        )
+
+        self.samples = samples
+        self.start_dates = start_dates
+        self.freq = freq
+        self.item_ids = item_ids
+        self.info = info
+        self._sorted_samples_value = None
+
+    @property
+    def _sorted_samples(self) -> np.ndarray:
+        if self._sorted_samples_value is None:
+            self._sorted_samples_value = np.sort(self.samples, axis=1)
+        return self._sorted_samples_value
+
+    @property
+    def num_samples(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def prediction_length(self) -> int:
+        return self.samples.shape[2]
+
+    @property
+    def mean(self) -> np.ndarray:
+        """
+        Forecast means, of shape (batch_size, prediction_length, ...).
+        """
+        return np.mean(self.samples, axis=1)
+
+    def quantile(self, q: Union[float, str]) -> np.ndarray:
+        """
+        Forecast quantiles, of shape (batch_size, prediction_length, ...).
+        """
+        q = Quantile.parse(q).value
+        sample_idx = int(np.round((self.num_samples - 1) * q))
+        return self._sorted_samples[:, sample_idx]
+
+    def to_quantile_forecast(
+        self, quantiles: List[Union[float, str]]
+    ) -> List["QuantileForecast"]:
+        forecast_keys = QuantileForecast.normalize_keys(quantiles)
+        # (batch_size, num_quantiles, prediction_length, ...)
+        forecast_arrays = np.stack([self.quantile(q) for q in quantiles], 1)
+
+        return [
+            QuantileForecast.from_arrays(
+                forecast_arrays[i],
+                start_date=self.start_dates[i],
+                freq=self.freq,
+                forecast_keys=forecast_keys,
+                item_id=self.item_ids[i] if self.item_ids else None,
+                info=self.info[i] if self.info else None,
+            )
+            for i in range(len(self))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __getitem__(self, i: int) -> SampleForecast:
+        forecast = SampleForecast.from_arrays(
+            self.samples[i],
+            start_date=self.start_dates[i],
+            freq=self.freq,
+            item_id=self.item_ids[i] if self.item_ids else None,
+            info=self.info[i] if self.info else None,
+        )
+        if self._sorted_samples_value is not None:
+            forecast._sorted_samples_value = self._sorted_samples_value[i]
+        return forecast
+
+    def __iter__(self) -> Iterator[SampleForecast]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 class OutputType(str, Enum):
     mean = "mean"
     samples = "samples"
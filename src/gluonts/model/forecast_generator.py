@@ -21,7 +21,12 @@ from gluonts.core.component import validated
 from gluonts.dataset.common import DataEntry
 from gluonts.dataset.field_names import FieldName
 from gluonts.dataset.loader import DataLoader
-from gluonts.model.forecast import Forecast, QuantileForecast, SampleForecast
+from gluonts.model.forecast import (
+    Forecast,
+    ForecastBatch,
+    QuantileForecast,
+    SampleForecast,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,28 @@ def predict_to_numpy(prediction_net, tensor) -> np.ndarray:
     raise NotImplementedError
 
 
+# Prediction networks can split the computation of sample paths into two
+# stages, by implementing `encode(*inputs)`, which returns a state (e.g. the
+# encoded past of the time series), and `sample_from_state(state,
+# num_samples)`, which returns `num_samples` sample paths drawn from that
+# state. This allows to draw many sample paths while running the encoder only
+# once per batch.
+def supports_sampling_from_state(prediction_net) -> bool:
+    return hasattr(prediction_net, "encode") and hasattr(
+        prediction_net, "sample_from_state"
+    )
+
+
+@singledispatch
+def encode_to_state(prediction_net, inputs):
+    raise NotImplementedError
+
+
+@singledispatch
+def sample_state_to_numpy(prediction_net, state, num_samples) -> np.ndarray:
+    raise NotImplementedError
+
+
 @singledispatch
 def recursively_zip_arrays(x) -> Iterator:
     """
@@ -110,10 +137,28 @@ class ForecastGenerator:
         freq: str,
         output_transform: Optional[OutputTransform],
         num_samples: Optional[int],
-        **kwargs
+        **kwargs,
     ) -> Iterator[Forecast]:
         raise NotImplementedError()
 
+    def generate_batches(
+        self,
+        inference_data_loader: DataLoader,
+        prediction_net,
+        input_names: List[str],
+        freq: str,
+        output_transform: Optional[OutputTransform],
+        num_samples: Optional[int],
+        **kwargs,
+    ) -> Iterator[ForecastBatch]:
+        """
+        Like calling the generator, but yields one `ForecastBatch` per batch
+        of the data loader, instead of one forecast per time series.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support forecast batches."
+        )
+
 
 class QuantileForecastGenerator(ForecastGenerator):
     @validated()
@@ -128,8 +173,10 @@ class QuantileForecastGenerator(ForecastGenerator):
         freq: str,
         output_transform: Optional[OutputTransform],
         num_samples: Optional[int],
-        **kwargs
+        **kwargs,
     ) -> Iterator[Forecast]:
+        forecast_keys = QuantileForecast.normalize_keys(self.quantiles)
+
         for batch in inference_data_loader:
             inputs = [batch[k] for k in input_names]
             outputs = predict_to_numpy(prediction_net, inputs)
@@ -141,7 +188,7 @@ class QuantileForecastGenerator(ForecastGenerator):
 
             i = -1
             for i, output in enumerate(outputs):
-                yield QuantileForecast(
+                yield QuantileForecast.from_arrays(
                     output,
                     start_date=batch["forecast_start"][i],
                     freq=freq,
@@ -149,7 +196,7 @@ class QuantileForecastGenerator(ForecastGenerator):
                     if FieldName.ITEM_ID in batch
                     else None,
                     info=batch["info"][i] if "info" in batch else None,
-                    forecast_keys=self.quantiles,
+                    forecast_keys=forecast_keys,
                 )
             assert i + 1 == len(batch["forecast_start"])
 
@@ -167,10 +214,48 @@ class SampleForecastGenerator(ForecastGenerator):
         freq: str,
         output_transform: Optional[OutputTransform],
         num_samples: Optional[int],
-        **kwargs
+        **kwargs,
     ) -> Iterator[Forecast]:
+        for forecast_batch in self.generate_batches(
+            inference_data_loader=inference_data_loader,
+            prediction_net=prediction_net,
+            input_names=input_names,
+            freq=freq,
+            output_transform=output_transform,
+            num_samples=num_samples,
+            **kwargs,
+        ):
+            yield from forecast_batch
+
+    def generate_batches(
+        self,
+        inference_data_loader: DataLoader,
+        prediction_net,
+        input_names: List[str],
+        freq: str,
+        output_transform: Optional[OutputTransform],
+        num_samples: Optional[int],
+        **kwargs,
+    ) -> Iterator[ForecastBatch]:
         for batch in inference_data_loader:
             inputs = [batch[k] for k in input_names]
+
+            if num_samples and supports_sampling_from_state(prediction_net):
+                yield ForecastBatch(
+                    self._sample_from_state(
+                        prediction_net,
+                        inputs,
+                        batch,
+                        output_transform,
+                        num_samples,
+                    ),
+                    start_dates=batch["forecast_start"],
+                    freq=freq,
+                    item_ids=batch.get(FieldName.ITEM_ID),
+                    info=batch.get("info"),
+                )
+                continue
+
             outputs = predict_to_numpy(prediction_net, inputs)
             if output_transform is not None:
                 outputs = output_transform(batch, outputs)
@@ -188,18 +273,48 @@ class SampleForecastGenerator(ForecastGenerator):
                     for s in zip(*collected_samples)
                 ]
                 assert len(outputs[0]) == num_samples
-            i = -1
-            for i, output in enumerate(outputs):
-                yield SampleForecast(
-                    output,
-                    start_date=batch["forecast_start"][i],
-                    freq=freq,
-                    item_id=batch[FieldName.ITEM_ID][i]
-                    if FieldName.ITEM_ID in batch
-                    else None,
-                    info=batch["info"][i] if "info" in batch else None,
-                )
-            assert i + 1 == len(batch["forecast_start"])
+
+            yield ForecastBatch(
+                np.asarray(outputs),
+                start_dates=batch["forecast_start"],
+                freq=freq,
+                item_ids=batch.get(FieldName.ITEM_ID),
+                info=batch.get("info"),
+            )
+
+    @staticmethod
+    def _sample_from_state(
+        prediction_net,
+        inputs,
+        batch,
+        output_transform: Optional[OutputTransform],
+        num_samples: int,
+    ) -> np.ndarray:
+        # the encoder runs once, and sample paths are then drawn in chunks of
+        # the size the network would draw in a forward pass
+        state = encode_to_state(prediction_net, inputs)
+        chunk_size = (
+            getattr(prediction_net, "num_parallel_samples", None)
+            or num_samples
+        )
+
+        collected_samples = []
+        num_collected_samples = 0
+        while num_collected_samples < num_samples:
+            num_chunk_samples = min(
+                chunk_size, num_samples - num_collected_samples
+            )
+            outputs = sample_state_to_numpy(
+                prediction_net, state, num_chunk_samples
+            )
+            if output_transform is not None:
+                outputs = output_transform(batch, outputs)
+            collected_samples.append(outputs)
+            num_collected_samples += num_chunk_samples
+
+        outputs = np.concatenate(collected_samples, axis=1)
+        assert outputs.shape[1] == num_samples
+        return outputs
 
 
 class DistributionForecastGenerator(ForecastGenerator):
@@ -215,7 +330,7 @@ class DistributionForecastGenerator(ForecastGenerator):
         freq: str,
         output_transform: Optional[OutputTransform],
         num_samples: Optional[int],
-        **kwargs
+        **kwargs,
     ) -> Iterator[Forecast]:
         for batch in inference_data_loader:
             inputs = [batch[k] for k in input_names]
@@ -277,7 +277,9 @@ class GPVARPredictionNetwork(GPVARNetwork):
         # last target value
         self.shifted_lags = [l - 1 for l in self.lags_seq]
 
-    def make_states(self, begin_states: List[Tensor]) -> List[List[Tensor]]:
+    def make_states(
+        self, begin_states: List[Tensor], num_samples: Optional[int] = None
+    ) -> List[List[Tensor]]:
         """
         Repeat states to match the the shape induced by the number of sample
         paths.
@@ -286,14 +288,18 @@ class GPVARPredictionNetwork(GPVARNetwork):
         ----------
         begin_states
             List of initial states for the RNN layers (batch_size, num_cells)
+        num_samples
+            Number of sample paths, by default `num_parallel_samples`.
 
         Returns
         -------
             List of list of initial states
         """
+        if num_samples is None:
+            num_samples = self.num_parallel_samples
 
         def repeat(tensor):
-            return tensor.repeat(repeats=self.num_parallel_samples, axis=0)
+            return tensor.repeat(repeats=num_samples, axis=0)
 
         return [[repeat(s) for s in states] for states in begin_states]
 
@@ -11,7 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-from typing import Any, Callable, Iterator, List, Optional, cast
+from typing import Any, Callable, Iterator, List, Optional, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -110,13 +110,103 @@ class NPTS:
 
             yield sampling_weights
 
+    @staticmethod
+    def compute_weight_matrix(
+        train_features: np.ndarray,
+        pred_features: np.ndarray,
+        target_isnan_positions: np.ndarray,
+        kernel: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        do_exp: bool = True,
+    ) -> np.ndarray:
+        """
+        Vectorized version of `compute_weights`, which evaluates the kernel
+        for all pairs of time points at once and returns the sampling
+        weights of all time steps in the prediction range as one matrix.
+
+        Row `pred_t` contains the same weights `compute_weights` yields for
+        `pred_t`, padded with zeros to `train_length + prediction_length`,
+        since time step `pred_t` cannot sample from the predictions at
+        `pred_t` and later.
+
+        Parameters
+        ----------
+        train_features
+            shape: (num_features, train_length)
+        pred_features
+            shape: (num_features, prediction_length)
+        target_isnan_positions:
+            an array of indices where the target is a NaN
+        kernel
+            kernel function that maps pairs of arrays to real numbers; it
+            has to reduce over the first (feature) axis and broadcast over
+            the remaining ones, like the kernels defined in this class
+        do_exp:
+            exponentiate the weights in case of exponential kernel
+            (for numerical stability we do this here)
+
+        Returns
+        -------
+        sampling weights
+            shape: (prediction_length, train_length + prediction_length)
+        """
+
+        assert len(np.shape(train_features)) == 2, (
+            "Train features should be 2D-array where the rows represent "
+            "features and columns the time points."
+        )
+
+        assert len(np.shape(pred_features)) == 2, (
+            "Prediction features should be 2D-array where the rows represent "
+            "features and columns the time points."
+        )
+
+        train_length = train_features.shape[1]
+        prediction_length = pred_features.shape[1]
+        total_length = train_length + prediction_length
+
+        features = np.concatenate([train_features, pred_features], axis=1)
+
+        # (prediction_length, total_length)
+        sampling_weights = np.array(
+            kernel(features[:, None, :], pred_features[:, :, None]),
+            dtype=float,
+        )
+
+        # Prediction for `pred_t` samples from all the training targets
+        # as well as predictions until `pred_t` - 1
+        valid = np.arange(total_length)[None, :] < (
+            train_length + np.arange(prediction_length)[:, None]
+        )
+
+        if do_exp:
+            # To avoid numerical issues with exponentiation.
+            sampling_weights[~valid] = -np.inf
+            sampling_weights -= sampling_weights.max(axis=1, keepdims=True)
+            sampling_weights = np.exp(sampling_weights)
+        else:
+            sampling_weights[~valid] = 0.0
+
+        # reset kernel at positions where the target is NaN
+        isnan_positions = np.ravel(target_isnan_positions)
+        sampling_weights[:, isnan_positions] = 0.0
+
+        # Where all positions with non-zero probability are NaNs, sample
+        # uniformly from the observed positions, see `compute_weights`.
+        all_zero = sampling_weights.sum(axis=1) == 0
+        if all_zero.any():
+            sampling_weights[all_zero] = valid[all_zero]
+            sampling_weights[np.ix_(all_zero, isnan_positions)] = 0.0
+
+        return sampling_weights
+
     @staticmethod
     def predict(
         targets: pd.Series,
         prediction_length: int,
-        sampling_weights_iterator: Iterator[np.ndarray],
+        sampling_weights_iterator: Union[Iterator[np.ndarray], np.ndarray],
         num_samples: int,
         item_id: Optional[Any] = None,
+        samples_ix: Optional[np.ndarray] = None,
     ) -> SampleForecast:
         """
         Given the `targets`, generates `Forecast` containing prediction
@@ -132,11 +222,17 @@ class NPTS:
         prediction_length
             prediction length
         sampling_weights_iterator
-            iterator over weights used for sampling
+            iterator over weights used for sampling, or the weight matrix
+            returned by `compute_weight_matrix`, in which case all time
+            steps are sampled at once
         num_samples
             number of samples to set in the :class:`SampleForecast` object
         item_id
             item_id to identify the time series
+        samples_ix
+            indices drawn from the sampling weights beforehand, of shape
+            (num_samples, prediction_length); if given,
+            `sampling_weights_iterator` is ignored
         Returns
         -------
         SampleForecast
@@ -156,11 +252,26 @@ class NPTS:
         )
 
         train_length = len(targets)
-        for t, sampling_weights in enumerate(sampling_weights_iterator):
-            samples_ix = WeightedSampler.sample(sampling_weights, num_samples)
-            samples[:, train_length + t] = samples[
-                np.arange(num_samples), samples_ix
-            ]
+        if samples_ix is None and isinstance(
+            sampling_weights_iterator, np.ndarray
+        ):
+            samples_ix = WeightedSampler.sample_batched(
+                sampling_weights_iterator, num_samples
+            )
+
+        if samples_ix is not None:
+            # The indices do not depend on the sampled values, only
+            # resolving them has to happen step by step.
+            for t in range(prediction_length):
+                samples[:, train_length + t] = samples[
+                    np.arange(num_samples), samples_ix[:, t]
+                ]
+        else:
+            for t, sampling_weights in enumerate(sampling_weights_iterator):
+                step_ix = WeightedSampler.sample(sampling_weights, num_samples)
+                samples[:, train_length + t] = samples[
+                    np.arange(num_samples), step_ix
+                ]
 
         # Forecast takes as input the prediction range samples, the start date
         # of the prediction range, and the frequency of the time series.
@@ -176,21 +287,31 @@ class NPTS:
             item_id=item_id,
         )
 
+    # The kernels reduce over the first (feature) axis and broadcast over the
+    # remaining ones, so that they can be evaluated for single pairs of time
+    # points as well as for all pairs at once.
+
     @staticmethod
     def log_distance_kernel(
         alpha: float,
     ) -> Callable[[np.ndarray, np.ndarray], float]:
-        return lambda x, y: cast(float, -alpha * np.sum(np.abs(x - y)))
+        return lambda x, y: cast(float, -alpha * np.sum(np.abs(x - y), axis=0))
 
     @staticmethod
     def log_weighted_distance_kernel(
         kernel_weights: List[float],
     ) -> Callable[[np.ndarray, np.ndarray], float]:
-        kernel_weights_nd = np.ndarray(kernel_weights, dtype=np.float32)
-        return lambda x, y: cast(
-            float, -np.sum(kernel_weights_nd * np.abs(x - y))
-        )
+        kernel_weights_nd = np.array(kernel_weights, dtype=np.float32)
+
+        def kernel(x: np.ndarray, y: np.ndarray) -> float:
+            diff = np.abs(x - y)
+            weights = kernel_weights_nd.reshape((-1,) + (1,) * (diff.ndim - 1))
+            return cast(float, -np.sum(weights * diff, axis=0))
+
+        return kernel
 
     @staticmethod
     def uniform_kernel() -> Callable[[np.ndarray, np.ndarray], float]:
-        return lambda x, y: 1.0 if np.sum(np.abs(x - y)) == 0.0 else 0.0
+        return lambda x, y: cast(
+            float, np.where(np.sum(np.abs(x - y), axis=0) == 0.0, 1.0, 0.0)
+        )
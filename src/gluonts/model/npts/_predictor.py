@@ -25,6 +25,7 @@ from gluonts.model.predictor import RepresentablePredictor
 from gluonts.time_feature import time_features_from_frequency_str
 
 from ._model import NPTS
+from ._weighted_sampler import WeightedSampler
 
 
 class KernelType(str, Enum):
@@ -148,6 +149,11 @@ class NPTSPredictor(RepresentablePredictor):
     feature_scale
         scale for time (seasonal) features in order to sample past seasons
         with higher probability
+    batch_size
+        number of time series for which the sample indices are drawn at
+        once; the sampling weights of a batch take
+        `batch_size * prediction_length * (context_length + prediction_length)`
+        floats of memory
     """
 
     @validated()
@@ -162,6 +168,7 @@ class NPTSPredictor(RepresentablePredictor):
         use_default_time_features: bool = True,
         num_default_time_features: int = 1,
         feature_scale: float = 1000.0,
+        batch_size: int = 32,
     ) -> None:
         super().__init__(freq=freq, prediction_length=prediction_length)
         # We limit the context length to some maximum value instead of
@@ -174,6 +181,7 @@ class NPTSPredictor(RepresentablePredictor):
         self.use_seasonal_model = use_seasonal_model
         self.use_default_time_features = use_default_time_features
         self.feature_scale = feature_scale
+        self.batch_size = batch_size
 
         if not self._is_exp_kernel():
             self.kernel = NPTS.uniform_kernel()
@@ -193,6 +201,7 @@ class NPTSPredictor(RepresentablePredictor):
     def predict(
         self, dataset: Dataset, num_samples: int = 100, **kwargs
     ) -> Iterator[SampleForecast]:
+        batch = []
         for data in dataset:
             start = pd.Timestamp(data["start"])
             target = np.asarray(data["target"], np.float32)
@@ -217,9 +226,13 @@ class NPTSPredictor(RepresentablePredictor):
             else:
                 custom_features = None
 
-            yield self.predict_time_series(
-                ts, num_samples, custom_features, item_id=item_id
-            )
+            batch.append((ts, custom_features, item_id))
+            if len(batch) == self.batch_size:
+                yield from self._predict_batch(batch, num_samples)
+                batch = []
+
+        if batch:
+            yield from self._predict_batch(batch, num_samples)
 
     def predict_time_series(
         self,
@@ -250,7 +263,57 @@ class NPTSPredictor(RepresentablePredictor):
         Forecast
           A prediction for the supplied `ts` and `custom_features`.
         """
+        (forecast,) = self._predict_batch(
+            [(ts, custom_features, item_id)], num_samples
+        )
+        return forecast
+
+    def _predict_batch(
+        self,
+        batch: List[Tuple[pd.Series, Optional[np.ndarray], Optional[Any]]],
+        num_samples: int,
+    ) -> List[SampleForecast]:
+        """
+        Generates forecasts for a batch of (ts, custom_features, item_id)
+        tuples, drawing the sample indices of all time series at once.
+        """
+        weight_matrices = [
+            self._sampling_weights(ts, custom_features)
+            for ts, custom_features, _ in batch
+        ]
+
+        # The weight matrices are padded to the same width with zeros,
+        # which are never sampled.
+        width = max(weights.shape[1] for weights in weight_matrices)
+        samples_ix = WeightedSampler.sample_batched(
+            np.concatenate(
+                [
+                    np.pad(weights, [(0, 0), (0, width - weights.shape[1])])
+                    for weights in weight_matrices
+                ]
+            ),
+            num_samples,
+        )
+
+        return [
+            NPTS.predict(
+                targets=ts,
+                prediction_length=self.prediction_length,
+                sampling_weights_iterator=weights,
+                num_samples=num_samples,
+                item_id=item_id,
+                samples_ix=ts_samples_ix,
+            )
+            for (ts, _, item_id), weights, ts_samples_ix in zip(
+                batch,
+                weight_matrices,
+                np.split(samples_ix, len(batch), axis=1),
+            )
+        ]
 
+    def _sampling_weights(
+        self, ts: pd.Series, custom_features: Optional[np.ndarray]
+    ) -> np.ndarray:
         if np.all(np.isnan(ts.values[-self.context_length :])):
             raise GluonTSDataError(
                 f"The last {self.context_length} positions of the target time "
@@ -267,7 +330,7 @@ class NPTSPredictor(RepresentablePredictor):
 
         # Compute weights for sampling for each time step `t` in the
         # prediction range
-        sampling_weights_iterator = NPTS.compute_weights(
+        return NPTS.compute_weight_matrix(
             train_features=train_features,
             pred_features=predict_features,
             target_isnan_positions=np.argwhere(np.isnan(ts.values)),
@@ -275,17 +338,6 @@ class NPTSPredictor(RepresentablePredictor):
             do_exp=self._is_exp_kernel(),
         )
 
-        # Generate forecasts
-        forecast = NPTS.predict(
-            targets=ts,
-            prediction_length=self.prediction_length,
-            sampling_weights_iterator=sampling_weights_iterator,
-            num_samples=num_samples,
-            item_id=item_id,
-        )
-
-        return forecast
-
     def _get_features(
         self,
         train_index: pd.DatetimeIndex,
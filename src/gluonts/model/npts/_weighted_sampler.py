@@ -32,10 +32,10 @@ class WeightedSampler:
         :param num_samples:
         :return:
         """
-        assert all(weights >= 0.0), "Sampling weights must be non-negative"
+        assert (weights >= 0.0).all(), "Sampling weights must be non-negative"
         # In the special case where all the weights are zeros, we want to
         # sample all indices uniformly
-        weights = np.ones_like(weights) if sum(weights) == 0.0 else weights
+        weights = np.ones_like(weights) if weights.sum() == 0.0 else weights
 
         cumsum_weights = np.cumsum(weights)
 
@@ -54,3 +54,46 @@ class WeightedSampler:
         )
 
         return samples_ix
+
+    @staticmethod
+    def sample_batched(weights, num_samples):
+        """
+        Sample indices for each row of `weights` at once:
+            `ix[:, row]` is chosen with probability `weights[row, ix]`
+
+        Rows need not sum to 1. Rows where all the weights are zeros are
+        sampled uniformly.
+
+        :param weights: array of shape (num_rows, num_weights)
+        :param num_samples:
+        :return: array of shape (num_samples, num_rows)
+        """
+        weights = np.asarray(weights, dtype=float)
+        assert weights.ndim == 2, "Sampling weights must be a 2D-array"
+        assert (weights >= 0.0).all(), "Sampling weights must be non-negative"
+
+        num_rows, num_weights = weights.shape
+        all_zero = weights.sum(axis=1) == 0.0
+        if all_zero.any():
+            weights = weights.copy()
+            weights[all_zero] = 1.0
+
+        # Normalize the cumulative weights of each row to [0, 1] and offset
+        # row `r` by `r`, which makes the flattened matrix sorted, so that a
+        # single search covers all rows.
+        cumsum_weights = np.cumsum(weights, axis=1)
+        cumsum_weights /= cumsum_weights[:, -1:]
+        cumsum_weights += np.arange(num_rows)[:, None]
+
+        # Samples from U(`row`, `row` + 1], such that they are never found
+        # in the previous row, nor at zero weights at the start of a row
+        uniform_samples = (
+            np.arange(num_rows)
+            + 1.0
+            - np.random.random((num_samples, num_rows))
+        )
+        flat_ix = np.searchsorted(
+            cumsum_weights.ravel(), uniform_samples, side="left"
+        )
+
+        return flat_ix - np.arange(num_rows) * num_weights
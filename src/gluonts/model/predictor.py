@@ -31,7 +31,7 @@ from gluonts.core.component import equals, from_hyperparameters, validated
 from gluonts.core.exception import GluonTSException
 from gluonts.core.serde import dump_json, load_json
 from gluonts.dataset.common import DataEntry, Dataset
-from gluonts.model.forecast import Forecast
+from gluonts.model.forecast import Forecast, ForecastBatch
 
 if TYPE_CHECKING:  # avoid circular import
     from gluonts.model.estimator import Estimator  # noqa
@@ -82,6 +82,28 @@ class Predictor:
         """
         raise NotImplementedError
 
+    def predict_batches(
+        self, dataset: Dataset, **kwargs
+    ) -> Iterator[ForecastBatch]:
+        """
+        Compute forecasts like `predict`, but as batches of sample based
+        forecasts, which keep the samples of all time series of a batch in
+        a single array. Only some predictors support this.
+
+        Parameters
+        ----------
+        dataset
+            The dataset containing the time series to predict.
+        Returns
+        -------
+        Iterator[ForecastBatch]
+            Iterator over the forecast batches, in the same order as the
+            dataset iterable was provided.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support forecast batches."
+        )
+
     def serialize(self, path: Path) -> None:
         # serialize Predictor type
         with (path / "type.txt").open("w") as fp:
@@ -126,12 +126,12 @@ class PointProcessSampleForecast(Forecast):
             "Datetime index not defined for point process samples"
         )
 
-    def as_json_dict(self, config: "Config") -> dict:
-        result = super().as_json_dict(config)
+    def as_array_dict(self, config: "Config") -> dict:
+        result = super().as_array_dict(config)
 
         if OutputType.samples in config.output_types:
-            result["samples"] = self.samples.tolist()
-            result["valid_length"] = self.valid_length.tolist()
+            result["samples"] = self.samples
+            result["valid_length"] = self.valid_length
 
         return result
 
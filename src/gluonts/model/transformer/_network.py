@@ -339,8 +339,16 @@ class TransformerPredictionNetwork(TransformerNetwork):
             a tensor containing sampled paths. Shape: (batch_size, num_sample_paths, prediction_length).
         """
 
+        # only the last `max(lags_seq)` values are ever looked up, so the
+        # decoder keeps a fixed-size window of the target instead of the
+        # whole, growing history
+        window_length = max(self.lags_seq)
+        past_window = past_target.slice_axis(
+            axis=1, begin=-window_length, end=None
+        )
+
         # blows-up the dimension of each tensor to batch_size * self.num_parallel_samples for increasing parallelism
-        repeated_past_target = past_target.repeat(
+        repeated_window = past_window.repeat(
             repeats=self.num_parallel_samples, axis=0
         )
         repeated_time_feat = time_feat.repeat(
@@ -351,19 +359,26 @@ class TransformerPredictionNetwork(TransformerNetwork):
         ).expand_dims(axis=1)
         repeated_enc_out = enc_out.repeat(
             repeats=self.num_parallel_samples, axis=0
-        ).expand_dims(axis=1)
+        )
         repeated_scale = scale.repeat(
             repeats=self.num_parallel_samples, axis=0
         )
 
+        # the keys and values of the encoder output are the same for all
+        # steps, the ones of the decoder steps are appended to the caches
+        memory_keys, memory_values = self.decoder.project_memory(
+            F, repeated_enc_out
+        )
+        cache_keys = cache_values = None
+
         future_samples = []
 
         # for each future time-units we draw new samples for this time-unit and update the state
         for k in range(self.prediction_length):
             lags = self.get_lagged_subsequences(
                 F=F,
-                sequence=repeated_past_target,
-                sequence_length=self.history_length + k,
+                sequence=repeated_window,
+                sequence_length=window_length,
                 indices=self.shifted_lags,
                 subsequences_length=1,
             )
@@ -388,7 +403,14 @@ class TransformerPredictionNetwork(TransformerNetwork):
                 dim=-1,
             )
 
-            dec_output = self.decoder(dec_input, repeated_enc_out, None, False)
+            dec_output, cache_keys, cache_values = self.decoder.decode_step(
+                F,
+                dec_input,
+                memory_keys,
+                memory_values,
+                cache_keys=cache_keys,
+                cache_values=cache_values,
+            )
 
             distr_args = self.proj_dist_args(dec_output)
 
@@ -400,15 +422,15 @@ class TransformerPredictionNetwork(TransformerNetwork):
             # (batch_size * num_samples, 1, *target_shape)
             new_samples = distr.sample()
 
-            # (batch_size * num_samples, seq_len, *target_shape)
-            repeated_past_target = F.concat(
-                repeated_past_target, new_samples, dim=1
+            # shift the window by one step
+            # (batch_size * num_samples, window_length, *target_shape)
+            repeated_window = F.concat(
+                repeated_window.slice_axis(axis=1, begin=1, end=None),
+                new_samples,
+                dim=1,
             )
             future_samples.append(new_samples)
 
-        # reset cache of the decoder
-        self.decoder.cache_reset()
-
         # (batch_size * num_samples, prediction_length, *target_shape)
         samples = F.concat(*future_samples, dim=1)
 
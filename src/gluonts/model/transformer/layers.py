@@ -247,13 +247,31 @@ class MultiHeadAttentionBase(HybridBlock):
         Context vectors of shape (batch_size, query_max_length, att_dim_out)
         """
 
+        # (batch_size * heads, length, dim/heads)
+        keys = split_heads(F, keys, self.dim_per_head, self.heads)
+        values = split_heads(F, values, self.dim_per_head, self.heads)
+
+        return self._attend_heads(F, queries, keys, values, mask)
+
+    def _attend_heads(
+        self,
+        F,
+        queries: Tensor,
+        keys: Tensor,
+        values: Tensor,
+        mask: Optional[Tensor] = None,
+    ) -> Tensor:
+        r"""
+        Same as `_attend`, but for keys and values which are already split
+        into heads, i.e. of shape
+        (batch_size * heads, memory_max_length, dim_per_head).
+        """
+
         # scale by 1/sqrt(dim_per_head)
         queries = queries * (self.dim_per_head ** -0.5)
 
-        # (batch_size * heads, length, dim/heads)
+        # (batch_size * heads, query_max_length, dim/heads)
         queries = split_heads(F, queries, self.dim_per_head, self.heads)
-        keys = split_heads(F, keys, self.dim_per_head, self.heads)
-        values = split_heads(F, values, self.dim_per_head, self.heads)
 
         # (batch_size * heads, query_max_length, dim_per_head)
         contexts = dot_attention(
@@ -354,6 +372,57 @@ class MultiHeadSelfAttention(MultiHeadAttentionBase):
 
         return self._attend(F, queries, keys, values, mask), cache
 
+    def decode_step(
+        self,
+        F,
+        inputs: Tensor,
+        cache_keys: Optional[Tensor] = None,
+        cache_values: Optional[Tensor] = None,
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        r"""
+        Computes multi-head self-attention for a single step of incremental
+        decoding, using caches of the keys and values of the previous steps.
+
+        In contrast to the `cache` dictionary of `hybrid_forward`, the caches
+        are passed in and returned explicitly and are kept split into heads,
+        such that the keys and values of previous steps are not projected
+        again. Only the steps decoded so far are attended to.
+
+        Parameters
+        ----------
+        inputs
+            Input data of shape (batch_size, 1, att_dim_in)
+        cache_keys
+            Keys of the previous steps, split into heads, i.e. of shape
+            (batch_size * heads, num_steps, dim_per_head); `None` for the
+            first step
+        cache_values
+            Values of the previous steps, of the same shape as `cache_keys`
+
+        Returns
+        -------
+        Tuple[Tensor, Tensor, Tensor]
+            A tensor of shape (batch_size, 1, att_dim_out), and the caches of
+            keys and values including the step
+        """
+
+        # (batch_size, 1, att_dim_in * 3)
+        combined = self.dense_pre_satt(inputs)
+
+        # (batch_size, 1, att_dim_in)
+        queries, keys, values = F.split(data=combined, num_outputs=3, axis=2)
+
+        # (batch_size * heads, 1, dim_per_head)
+        keys = split_heads(F, keys, self.dim_per_head, self.heads)
+        values = split_heads(F, values, self.dim_per_head, self.heads)
+
+        # (batch_size * heads, num_steps + 1, dim_per_head)
+        if cache_keys is not None:
+            keys = F.concat(cache_keys, keys, dim=1)
+            values = F.concat(cache_values, values, dim=1)
+
+        return self._attend_heads(F, queries, keys, values), keys, values
+
 
 class MultiHeadAttention(MultiHeadAttentionBase):
     r"""
@@ -418,9 +487,16 @@ class MultiHeadAttention(MultiHeadAttentionBase):
 
         # Q -> Q * W_q
         # K = V -> K * W_k, V * W_v
+        keys, values = self.project_memory(F, memory)
 
-        # (batch, query_max_length, att_dim_in)
-        queries = self.dense_pre_att_q(queries)
+        return self.attend_memory(F, queries, keys, values, mask=mask)
+
+    def project_memory(self, F, memory: Tensor) -> Tuple[Tensor, Tensor]:
+        """
+        Returns the keys and values for a memory tensor, split into heads,
+        which can be reused by `attend_memory` for all queries to the same
+        memory.
+        """
 
         # (batch, memory_max_length, att_dim_in)
         keys = self.dense_pre_att_k(memory)
@@ -428,7 +504,29 @@ class MultiHeadAttention(MultiHeadAttentionBase):
         # (batch, memory_max_length, att_dim_in)
         values = self.dense_pre_att_v(memory)
 
-        return self._attend(F, queries, keys, values, mask=mask)
+        # (batch * heads, memory_max_length, dim_per_head)
+        keys = split_heads(F, keys, self.dim_per_head, self.heads)
+        values = split_heads(F, values, self.dim_per_head, self.heads)
+
+        return keys, values
+
+    def attend_memory(
+        self,
+        F,
+        queries: Tensor,
+        keys: Tensor,
+        values: Tensor,
+        mask: Optional[Tensor] = None,
+    ) -> Tensor:
+        """
+        Computes multi-head attention for queries given the keys and values
+        returned by `project_memory`.
+        """
+
+        # (batch, query_max_length, att_dim_in)
+        queries = self.dense_pre_att_q(queries)
+
+        return self._attend_heads(F, queries, keys, values, mask=mask)
 
 
 class TransformerFeedForward(HybridBlock):
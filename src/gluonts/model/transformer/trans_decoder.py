@@ -11,7 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from mxnet.gluon import HybridBlock
 
@@ -121,3 +121,54 @@ class TransformerDecoder(HybridBlock):
             self.cache = cache.copy()
 
         return data
+
+    def decode_step(
+        self,
+        F,
+        data: Tensor,
+        memory_keys: Tensor,
+        memory_values: Tensor,
+        cache_keys: Optional[Tensor] = None,
+        cache_values: Optional[Tensor] = None,
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        """
+        Decodes a single step, given the keys and values of the encoder output
+        (see `project_memory`) and the self-attention caches of the previous
+        steps (see `MultiHeadSelfAttention.decode_step`). Returns the output
+        of the step and the updated caches.
+
+        In contrast to calling the decoder with `is_train=False`, no state is
+        kept in the block, and neither the encoder output nor the inputs of
+        previous steps are projected again.
+        """
+
+        # embedding
+        inputs = self.enc_input_layer(data)
+
+        # self-attention
+        data_att, cache_keys, cache_values = self.dec_self_att.decode_step(
+            F,
+            self.dec_pre_self_att(inputs, None),
+            cache_keys,
+            cache_values,
+        )
+        data = self.dec_post_self_att(data_att, inputs)
+
+        # encoder attention
+        data_att = self.dec_enc_att.attend_memory(
+            F, data, memory_keys, memory_values
+        )
+        data = self.dec_post_att(data_att, data)
+
+        # feed-forward
+        data_ff = self.dec_ff(data)
+        data = self.dec_post_ff(data_ff, data)
+
+        return data, cache_keys, cache_values
+
+    def project_memory(self, F, enc_out: Tensor) -> Tuple[Tensor, Tensor]:
+        """
+        Returns the keys and values of the encoder attention for the output
+        of the encoder, to be passed to `decode_step`.
+        """
+        return self.dec_enc_att.project_memory(F, enc_out)
@@ -113,6 +113,55 @@ class CausalDilatedResidue(nn.HybridBlock):
         )
         return s, output
 
+    def step(self, F, x_prev, x):
+        """
+        Computes the outputs for a single time step, given the input of the
+        step and the input `dilation` steps before. In contrast to calling
+        the block, no input of the steps in between is needed.
+
+        Parameters
+        ----------
+        F
+        x_prev
+            Input `dilation` steps before: (batch_size, n_residue, 1)
+        x
+            Input of the step: (batch_size, n_residue, 1)
+
+        Returns
+        -------
+        Tuple: (Tensor, Tensor)
+            The skip output of shape (batch_size, n_skip, 1), and the output
+            of shape (batch_size, n_residue, 1).
+        """
+        assert self.kernel_size == 2, "Only kernel_size=2 is supported."
+
+        # the dilated convolution only looks at `x_prev` and `x`, so it is
+        # the same as an undilated one on the two of them
+        x_pair = F.concat(x_prev, x, dim=-1)
+        u = F.sigmoid(self._conv_pair(F, self.conv_sigmoid, x_pair)) * F.tanh(
+            self._conv_pair(F, self.conv_tanh, x_pair)
+        )
+        s = self.skip(u)
+        if not self.return_dense_out:
+            return s, F.zeros(shape=(1,))
+        return s, self.residue(u) + x
+
+    def _conv_pair(self, F, conv, x_pair):
+        # use the parameters of `conv` with a dilation of 1, as symbols when
+        # building a graph, and as arrays otherwise
+        if F is mx.sym:
+            weight, bias = conv.weight.var(), conv.bias.var()
+        else:
+            weight = conv.weight.data(x_pair.context)
+            bias = conv.bias.data(x_pair.context)
+        return F.Convolution(
+            data=x_pair,
+            weight=weight,
+            bias=bias,
+            kernel=(2,),
+            num_filter=self.n_residue,
+        )
+
 
 class WaveNet(nn.HybridBlock):
     def __init__(
@@ -340,13 +389,20 @@ class WaveNet(nn.HybridBlock):
                     skip, begin=self.trim_lengths[i], end=None, axis=-1
                 )
             skip_outs.append(skip_trim)
-        y = sum(skip_outs)
-        y = self.output_act(y)
+        unnormalized_output = self.output_net(sum(skip_outs))
+        return unnormalized_output, queues_next
+
+    def output_net(self, skip):
+        """
+        Maps the sum of the skip outputs of all layers, of shape
+        (batch_size, n_skip, sequence_length), to the unnormalized outputs of
+        shape (batch_size, sequence_length, num_bins).
+        """
+        y = self.output_act(skip)
         y = self.conv1(y)
         y = self.output_act(y)
         y = self.conv2(y)
-        unnormalized_output = y.swapaxes(1, 2)
-        return unnormalized_output, queues_next
+        return y.swapaxes(1, 2)
 
 
 class WaveNetTraining(WaveNet):
@@ -489,6 +545,39 @@ class WaveNetSampler(WaveNet):
             queues.append(o_chunk)
         return queues
 
+    def get_initial_conv_rings(self, F, past_target, features):
+        """
+        Collect the inputs of each layer before the first prediction step,
+        which the layers need for the first steps of the prediction.
+
+        Parameters
+        ----------
+        F
+        past_target: (batch_size, receptive_field)
+        features: (batch_size, num_features, receptive_field)
+
+        Returns
+        -------
+        List
+            A list containing a list for each layer, with the inputs of the
+            layer at the last `d` time steps, where `d` is the dilation of
+            the layer. Each input has shape (batch_size, n_residue, 1).
+        """
+        o = self.target_feature_embedding(F, past_target, features)
+
+        rings = []
+        for i, d in enumerate(self.dilations):
+            # the last time step is the first prediction step
+            rings.append(
+                [
+                    F.slice_axis(o, begin=-d - 1 + j, end=-d + j, axis=-1)
+                    for j in range(d)
+                ]
+            )
+            if not self.is_last_layer(i):
+                _, o = self.residuals[i](o)
+        return rings
+
     def hybrid_forward(
         self,
         F,
@@ -541,12 +630,13 @@ class WaveNetSampler(WaveNet):
             scale=scale,
         )
 
-        # To compute queues for the first step, we need features from
-        # -self.pred_length - self.receptive_field + 1 to -self.pred_length + 1
+        # To compute the inputs of the layers before the first step, we need
+        # features from -self.pred_length - self.receptive_field + 1 to
+        # -self.pred_length + 1
         features_end_ix = (
             -self.pred_length + 1 if self.pred_length > 1 else None
         )
-        queues = self.get_initial_conv_queues(
+        rings = self.get_initial_conv_rings(
             F,
             past_target=F.slice_axis(
                 past_target, begin=-self.receptive_field, end=None, axis=-1
@@ -558,30 +648,43 @@ class WaveNetSampler(WaveNet):
                 axis=-1,
             ),
         )
-        queues = [blow_up(queue) for queue in queues]
+        rings = [[blow_up(x) for x in ring] for ring in rings]
 
-        res = F.slice_axis(past_target, begin=-2, end=None, axis=-1)
-        res = blow_up(res)
-        for n in range(self.pred_length):
-            # Generate one-step ahead predictions. The input consists of target and features
-            # corresponding to the last two time steps.
-            current_target = F.slice_axis(res, begin=-2, end=None, axis=-1)
-            current_features = F.slice_axis(
-                full_features,
-                begin=self.receptive_field + n - 1,
-                end=self.receptive_field + n + 1,
-                axis=-1,
+        # (batch_size * num_samples, num_features, pred_length)
+        future_features = blow_up(
+            F.slice_axis(
+                full_features, begin=self.receptive_field, end=None, axis=-1
             )
-            embedding = self.target_feature_embedding(
+        )
+
+        # (batch_size * num_samples, 1)
+        current_target = blow_up(
+            F.slice_axis(past_target, begin=-1, end=None, axis=-1)
+        )
+        future_samples = []
+        for n in range(self.pred_length):
+            # The input of the first layer consists of the last target and
+            # the features of the current time step.
+            x = self.target_feature_embedding(
                 F,
                 target=current_target,
-                features=blow_up(current_features),
+                features=F.slice_axis(
+                    future_features, begin=n, end=n + 1, axis=-1
+                ),
             )
 
+            skip_outs = []
+            for i, d in enumerate(self.dilations):
+                # Slot `n % d` holds the input of the layer `d` steps ago,
+                # which is replaced by the current input.
+                ring = rings[i]
+                x_prev = ring[n % d]
+                ring[n % d] = x
+                skip, x = self.residuals[i].step(F, x_prev, x)
+                skip_outs.append(skip)
+
             # (batch_size, 1, num_bins) where 1 corresponds to the time axis.
-            unnormalized_outputs, queues = self.base_net(
-                F, embedding, one_step_prediction=True, queues=queues
-            )
+            unnormalized_outputs = self.output_net(sum(skip_outs))
             if self.temperature > 0:
                 # (batch_size, 1, num_bins) where 1 corresponds to the time axis.
                 probs = F.softmax(
@@ -592,9 +695,10 @@ class WaveNetSampler(WaveNet):
             else:
                 # (batch_size, 1)
                 y = F.argmax(unnormalized_outputs, axis=-1)
-            y = y.astype("int32")
-            res = F.concat(res, y, num_args=2, dim=-1)
-        samples = F.slice_axis(res, begin=-self.pred_length, end=None, axis=-1)
+            current_target = y.astype("int32")
+            future_samples.append(current_target)
+
+        samples = F.concat(*future_samples, num_args=self.pred_length, dim=-1)
         samples = samples.reshape(
             shape=(-1, self.num_samples, self.pred_length)
         )
@@ -141,6 +141,7 @@ class GluonEstimator(Estimator):
         num_prefetch: Optional[int] = None,
         shuffle_buffer_length: Optional[int] = None,
         cache_data: bool = False,
+        persistent_validation_workers: bool = False,
     ) -> TrainOutput:
         transformation = self.create_transformation()
 
@@ -168,16 +169,25 @@ class GluonEstimator(Estimator):
                 transformed_validation_data
                 if not cache_data
                 else Cached(transformed_validation_data),
-                num_workers=num_workers,
+                # the validation data is only loaded by workers on request,
+                # which are then kept alive between epochs
+                num_workers=num_workers
+                if persistent_validation_workers
+                else None,
+                persistent_workers=persistent_validation_workers,
             )
 
         training_network = self.create_training_network()
 
-        self.trainer(
-            net=training_network,
-            train_iter=training_data_loader,
-            validation_iter=validation_data_loader,
-        )
+        try:
+            self.trainer(
+                net=training_network,
+                train_iter=training_data_loader,
+                validation_iter=validation_data_loader,
+            )
+        finally:
+            if isinstance(validation_data_loader, DataLoader):
+                validation_data_loader.close()
 
         with self.trainer.ctx:
             predictor = self.create_predictor(transformation, training_network)
@@ -196,6 +206,7 @@ class GluonEstimator(Estimator):
         num_prefetch: Optional[int] = None,
         shuffle_buffer_length: Optional[int] = None,
         cache_data: bool = False,
+        persistent_validation_workers: bool = False,
         **kwargs,
     ) -> Predictor:
         return self.train_model(
@@ -205,4 +216,5 @@ class GluonEstimator(Estimator):
             num_prefetch=num_prefetch,
             shuffle_buffer_length=shuffle_buffer_length,
             cache_data=cache_data,
+            persistent_validation_workers=persistent_validation_workers,
         ).predictor
@@ -24,11 +24,13 @@ from gluonts.core.component import DType
 from gluonts.core.serde import dump_json, load_json
 from gluonts.dataset.common import DataEntry, Dataset
 from gluonts.dataset.loader import DataBatch, InferenceDataLoader
-from gluonts.model.forecast import Forecast
+from gluonts.model.forecast import Forecast, ForecastBatch
 from gluonts.model.forecast_generator import (
     ForecastGenerator,
     SampleForecastGenerator,
+    encode_to_state,
     predict_to_numpy,
+    sample_state_to_numpy,
 )
 from gluonts.model.predictor import OutputTransform, Predictor
 from gluonts.mx.batchify import batchify
@@ -50,6 +52,16 @@ def _(prediction_net: mx.gluon.Block, inputs: mx.ndarray) -> np.ndarray:
     return prediction_net(*inputs).asnumpy()
 
 
+@encode_to_state.register(mx.gluon.Block)
+def _(prediction_net: mx.gluon.Block, inputs: mx.ndarray):
+    return prediction_net.encode(*inputs)
+
+
+@sample_state_to_numpy.register(mx.gluon.Block)
+def _(prediction_net: mx.gluon.Block, state, num_samples: int) -> np.ndarray:
+    return prediction_net.sample_from_state(state, num_samples).asnumpy()
+
+
 class GluonPredictor(Predictor):
     """
     Base predictor type for Gluon-based models.
@@ -155,14 +167,8 @@ class GluonPredictor(Predictor):
         num_prefetch: Optional[int] = None,
         **kwargs,
     ) -> Iterator[Forecast]:
-        inference_data_loader = InferenceDataLoader(
-            dataset,
-            transform=self.input_transform,
-            batch_size=self.batch_size,
-            stack_fn=partial(batchify, ctx=self.ctx, dtype=self.dtype),
-            num_workers=num_workers,
-            num_prefetch=num_prefetch,
-            **kwargs,
+        inference_data_loader = self._inference_data_loader(
+            dataset, num_workers, num_prefetch, **kwargs
         )
         with mx.Context(self.ctx):
             yield from self.forecast_generator(
@@ -174,6 +180,44 @@ class GluonPredictor(Predictor):
                 num_samples=num_samples,
             )
 
+    def predict_batches(
+        self,
+        dataset: Dataset,
+        num_samples: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        num_prefetch: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[ForecastBatch]:
+        inference_data_loader = self._inference_data_loader(
+            dataset, num_workers, num_prefetch, **kwargs
+        )
+        with mx.Context(self.ctx):
+            yield from self.forecast_generator.generate_batches(
+                inference_data_loader=inference_data_loader,
+                prediction_net=self.prediction_net,
+                input_names=self.input_names,
+                freq=self.freq,
+                output_transform=self.output_transform,
+                num_samples=num_samples,
+            )
+
+    def _inference_data_loader(
+        self,
+        dataset: Dataset,
+        num_workers: Optional[int],
+        num_prefetch: Optional[int],
+        **kwargs,
+    ) -> InferenceDataLoader:
+        return InferenceDataLoader(
+            dataset,
+            transform=self.input_transform,
+            batch_size=self.batch_size,
+            stack_fn=partial(batchify, ctx=self.ctx, dtype=self.dtype),
+            num_workers=num_workers,
+            num_prefetch=num_prefetch,
+            **kwargs,
+        )
+
     def __eq__(self, that):
         if type(self) != type(that):
             return False
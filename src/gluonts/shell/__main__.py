@@ -65,8 +65,17 @@ def cli() -> None:
         '"forecaster" option is present.'
     ),
 )
+@click.option(
+    "--asgi/--no-asgi",
+    envvar="GLUONTS_ASGI",
+    default=False,
+    help=(
+        "Serves requests with the asynchronous ASGI app using uvicorn, "
+        "instead of the Flask app using gunicorn."
+    ),
+)
 def serve_command(
-    data_path: str, forecaster: Optional[str], force_static: bool
+    data_path: str, forecaster: Optional[str], force_static: bool, asgi: bool
 ) -> None:
     from gluonts.shell import serve
 
@@ -79,10 +88,21 @@ def serve_command(
     else:
         forecaster_type = None
 
+    settings = Settings()
+
+    if asgi:
+        asgi_app = serve.make_asgi_app(
+            env=ServeEnv(Path(data_path)),
+            forecaster_type=forecaster_type,
+            settings=settings,
+        )
+        serve.run_asgi_app(asgi_app, settings)
+        return
+
     gunicorn_app = serve.make_gunicorn_app(
         env=ServeEnv(Path(data_path)),
         forecaster_type=forecaster_type,
-        settings=Settings(),
+        settings=settings,
     )
     gunicorn_app.run()
 
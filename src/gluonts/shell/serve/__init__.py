@@ -11,22 +11,27 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import gc
 import logging
 import multiprocessing
+import time
 from ipaddress import IPv4Address
-from typing import List, Optional, Type, Union
+from typing import Callable, List, Optional, Type, Union
 
+import numpy as np
 from flask import Flask
 from gunicorn.app.base import BaseApplication
 from pydantic import BaseSettings
 
 import gluonts
 from gluonts.core import fqname_for
+from gluonts.dataset.common import ListDataset
 from gluonts.model.estimator import Estimator
 from gluonts.model.predictor import Predictor
 from gluonts.shell.env import ServeEnv
 
 from .app import make_app
+from .asgi import make_async_app, run_asgi_app
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +50,7 @@ class Settings(BaseSettings):
         env_prefix = ""
 
     model_server_workers: Optional[int] = None
+    model_server_threads: Optional[int] = None
     max_content_length: int = 6 * MB
 
     sagemaker_server_address: IPv4Address = IPv4Address("0.0.0.0")
@@ -55,9 +61,25 @@ class Settings(BaseSettings):
     gluonts_batch_fallback_predictor: str = (
         "gluonts.model.trivial.mean.MeanPredictor"
     )
+    # Number of persistent processes which predict batch transform requests
+    # if `gluonts_batch_timeout` is set.
+    gluonts_batch_timeout_workers: int = 1
     gluonts_batch_suppress_errors: bool = False
     gluonts_forward_fields: List[str] = []
 
+    # Dynamic batching of concurrent inference requests: instances of up to
+    # `gluonts_dynamic_batch_size` requests (disabled if 0) are predicted
+    # together, waiting at most `gluonts_dynamic_batch_delay` seconds for a
+    # batch to fill up. Only requests which use the same predictor can be
+    # combined, so this only applies to static mode: in dynamic mode, every
+    # request creates its own predictor.
+    gluonts_dynamic_batch_size: int = 0
+    gluonts_dynamic_batch_delay: float = 0.01
+
+    # Prepare the predictor of static mode once in the master process, so
+    # that the forked workers share it, see `preload_predictor`.
+    gluonts_preload: bool = False
+
     sagemaker_batch: bool = False
     sagemaker_batch_strategy: str = "SINGLE_RECORD"
 
@@ -93,6 +115,17 @@ class Settings(BaseSettings):
             logger.info(f"Using {cpu_count} workers")
             return cpu_count
 
+    @property
+    def number_of_threads(self) -> Optional[int]:
+        if self.model_server_threads:
+            return self.model_server_threads
+
+        # requests can only be batched if a worker serves several at a time
+        if self.gluonts_dynamic_batch_size > 0 and not self.sagemaker_batch:
+            return self.gluonts_dynamic_batch_size
+
+        return None
+
 
 class Application(BaseApplication):
     def __init__(self, app, config) -> None:
@@ -115,11 +148,10 @@ class Application(BaseApplication):
         logger.info("Shutting down GluonTS scoring service")
 
 
-def make_gunicorn_app(
+def make_predictor_factory(
     env: ServeEnv,
     forecaster_type: Optional[Type[Union[Estimator, Predictor]]],
-    settings: Settings,
-) -> Application:
+) -> Callable[[dict], Predictor]:
     if forecaster_type is not None:
         logger.info(f"Using dynamic predictor factory")
 
@@ -146,17 +178,70 @@ def make_gunicorn_app(
     logger.info(f"Using gluonts v{gluonts.__version__}")
     logger.info(f"Using forecaster {forecaster_fq_name} v{forecaster_version}")
 
-    execution_params = {
+    return predictor_factory
+
+
+def preload_predictor(predictor: Predictor) -> None:
+    """
+    Prepare `predictor` to be shared by forked worker processes.
+
+    A prediction is run on a dummy time series, so that lazy initialization
+    such as building the hybridized network of mxnet predictors happens
+    once, before forking, instead of on the first request in each worker.
+    Afterwards, all objects are moved to the permanent generation of the
+    garbage collector: otherwise, collections in the workers write to the
+    headers of all objects, which copies the memory pages holding them, and
+    with them much of the memory which is otherwise shared copy-on-write.
+    Parameters are only read during inference, so their buffers remain
+    shared.
+    """
+    start_time = time.time()
+
+    warm_up_entry = {
+        "start": "2000-01-01 00:00:00",
+        "target": np.zeros(10 * max(predictor.prediction_length, 1)),
+    }
+    try:
+        list(predictor.predict(ListDataset([warm_up_entry], predictor.freq)))
+    except Exception:
+        logger.warning(
+            "Could not warm up predictor, it is initialized in each worker "
+            "on its first request instead.",
+            exc_info=True,
+        )
+
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+    logger.info(f"Preloaded predictor in {time.time() - start_time:.2f}s")
+
+
+def make_execution_params(settings: Settings) -> dict:
+    return {
         "MaxConcurrentTransforms": settings.number_of_workers,
         "BatchStrategy": settings.sagemaker_batch_strategy,
         "MaxPayloadInMB": settings.sagemaker_max_payload_in_mb,
     }
 
+
+def make_gunicorn_app(
+    env: ServeEnv,
+    forecaster_type: Optional[Type[Union[Estimator, Predictor]]],
+    settings: Settings,
+) -> Application:
+    predictor_factory = make_predictor_factory(env, forecaster_type)
+
+    if settings.gluonts_preload and forecaster_type is None:
+        # in static mode, the factory always returns the same predictor
+        preload_predictor(predictor_factory({}))
+
     flask_app = make_app(
         predictor_factory,
-        execution_params,
+        make_execution_params(settings),
         batch_transform_config=env.batch_config,
         settings=settings,
+        static_predictor=forecaster_type is None,
     )
 
     gunicorn_app = Application(
@@ -164,8 +249,33 @@ def make_gunicorn_app(
         config={
             "bind": settings.sagemaker_server_bind,
             "workers": settings.number_of_workers,
+            "threads": settings.number_of_threads,
             "timeout": settings.sagemaker_server_timeout,
         },
     )
 
     return gunicorn_app
+
+
+def make_asgi_app(
+    env: ServeEnv,
+    forecaster_type: Optional[Type[Union[Estimator, Predictor]]],
+    settings: Settings,
+) -> Callable:
+    """
+    Create the scoring service as an ASGI application, which offers the
+    same endpoints as the app created by `make_gunicorn_app`. It can be run
+    with `run_asgi_app` or any other ASGI server.
+    """
+    predictor_factory = make_predictor_factory(env, forecaster_type)
+
+    if settings.gluonts_preload and forecaster_type is None:
+        preload_predictor(predictor_factory({}))
+
+    return make_async_app(
+        predictor_factory,
+        make_execution_params(settings),
+        batch_transform_config=env.batch_config,
+        settings=settings,
+        static_predictor=forecaster_type is None,
+    )
@@ -12,13 +12,19 @@
 # permissions and limitations under the License.
 import json
 import logging
-import multiprocessing as mp
 import os
-import signal
 import time
 import traceback
-from queue import Empty as QueueEmpty
-from typing import Callable, Iterable, List, NamedTuple, Tuple
+from functools import partial
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from flask import Flask, Response, jsonify, request
 from pydantic import BaseModel
@@ -27,7 +33,9 @@ from gluonts.dataset.common import ListDataset
 from gluonts.model.forecast import Config as ForecastConfig
 from gluonts.shell.util import forecaster_type_by_name
 
-from .util import jsonify_floats
+from .batching import RequestBatcher, make_request_batcher
+from .util import encode_json, jsonify_floats
+from .watchdog import WatchdogPool
 
 logger = logging.getLogger("gluonts.serve")
 
@@ -111,44 +119,42 @@ def handle_predictions(predictor, instances, configuration):
     return predictions
 
 
-def inference_invocations(predictor_factory) -> Callable[[], Response]:
+def handle_batched_predictions(
+    batcher: RequestBatcher, predictor, instances, configuration
+):
+    forecasts = batcher.predict(
+        predictor, instances, num_samples=configuration.num_samples
+    )
+    return [forecast.as_json_dict(configuration) for forecast in forecasts]
+
+
+def inference_invocations(
+    predictor_factory, batcher: Optional[RequestBatcher] = None
+) -> Callable[[], Response]:
     def invocations() -> Response:
         predictor = predictor_factory(request.json)
         req = InferenceRequest.parse_obj(request.json)
 
-        predictions = handle_predictions(
-            predictor, req.instances, req.configuration
-        )
+        if batcher is not None:
+            predictions = handle_batched_predictions(
+                batcher, predictor, req.instances, req.configuration
+            )
+        else:
+            predictions = handle_predictions(
+                predictor, req.instances, req.configuration
+            )
         return jsonify(predictions=jsonify_floats(predictions))
 
     return invocations
 
 
-def do(fn, args, queue):
-    queue.put(fn(*args))
-
-
-def with_timeout(fn, args, timeout):
-    queue = mp.Queue()
-    process = mp.Process(target=do, args=(fn, args, queue))
-    process.start()
-
-    try:
-        return queue.get(True, timeout=timeout)
-    except QueueEmpty:
-        os.kill(process.pid, signal.SIGKILL)
-        return None
-
-
-def make_predictions(predictor, dataset, configuration):
+def iter_predictions(predictor, dataset, configuration) -> Iterator[dict]:
     DEBUG = configuration.dict().get("DEBUG")
 
     # we have to take this as the initial start-time since the first
     # forecast is produced before the loop in predictor.predict
     start = time.time()
 
-    predictions = []
-
     forecast_iter = predictor.predict(
         dataset,
         num_samples=configuration.num_samples,
@@ -156,18 +162,70 @@ def make_predictions(predictor, dataset, configuration):
 
     for forecast in forecast_iter:
         end = time.time()
-        prediction = forecast.as_json_dict(configuration)
+        prediction = forecast.as_array_dict(configuration)
 
         if DEBUG:
             prediction["debug"] = {"timing": end - start}
 
-        predictions.append(prediction)
+        yield prediction
 
         start = time.time()
 
+
+def predict_items(predictor, configuration, items) -> Iterator[dict]:
+    return iter_predictions(predictor, items, configuration)
+
+
+def make_timeout_pool(predictor, configuration, settings) -> WatchdogPool:
+    return WatchdogPool(
+        partial(predict_items, predictor, configuration),
+        num_workers=settings.gluonts_batch_timeout_workers,
+    )
+
+
+def make_predictions_with_timeout(
+    pool, predictor, dataset, configuration, settings, request_data
+):
+    items = list(dataset)
+    predictions = pool.map(items, timeout=settings.gluonts_batch_timeout)
+
+    # predictions are None for items, for which the predictor timed out
+    timed_out = [
+        idx for idx, prediction in enumerate(predictions) if prediction is None
+    ]
+
+    if timed_out:
+        lines = request_data.split("\n")
+        logger.warning(
+            f"predictor timed out for {len(timed_out)} of {len(items)} "
+            f"items: {[lines[idx] for idx in timed_out]}"
+        )
+        FallbackPredictor = forecaster_type_by_name(
+            settings.gluonts_batch_fallback_predictor
+        )
+        fallback_predictor = FallbackPredictor(
+            freq=predictor.freq,
+            prediction_length=predictor.prediction_length,
+        )
+
+        fallback_predictions = iter_predictions(
+            fallback_predictor,
+            [items[idx] for idx in timed_out],
+            configuration,
+        )
+        for idx, prediction in zip(timed_out, fallback_predictions):
+            predictions[idx] = prediction
+
     return predictions
 
 
+def forward_fields(predictions, dataset, settings) -> Iterator[dict]:
+    for input_item, prediction in zip(dataset, predictions):
+        for forward_field in settings.gluonts_forward_fields:
+            prediction[forward_field] = input_item.get(forward_field)
+        yield prediction
+
+
 class ScoredInstanceStat(NamedTuple):
     amount: int
     duration: float
@@ -178,6 +236,10 @@ def batch_inference_invocations(
 ) -> Callable[[], Response]:
     predictor = predictor_factory({"configuration": configuration.dict()})
 
+    pool = None
+    if settings.gluonts_batch_timeout > 0:
+        pool = make_timeout_pool(predictor, configuration, settings)
+
     scored_instances: List[ScoredInstanceStat] = []
     last_scored = [time.time()]
 
@@ -211,46 +273,57 @@ def batch_inference_invocations(
 
         start_time = time.time()
 
-        if settings.gluonts_batch_timeout > 0:
-            predictions = with_timeout(
-                make_predictions,
-                args=(predictor, dataset, configuration),
-                timeout=settings.gluonts_batch_timeout,
+        if pool is not None:
+            predictions = make_predictions_with_timeout(
+                pool, predictor, dataset, configuration, settings, request_data
             )
-
-            # predictions are None, when predictor timed out
-            if predictions is None:
-                logger.warning(f"predictor timed out for: {request_data}")
-                FallbackPredictor = forecaster_type_by_name(
-                    settings.gluonts_batch_fallback_predictor
-                )
-                fallback_predictor = FallbackPredictor(
-                    freq=predictor.freq,
-                    prediction_length=predictor.prediction_length,
-                )
-
-                predictions = make_predictions(
-                    fallback_predictor, dataset, configuration
-                )
         else:
-            predictions = make_predictions(predictor, dataset, configuration)
+            predictions = iter_predictions(predictor, dataset, configuration)
 
-        end_time = time.time()
-
-        scored_instances.append(
-            ScoredInstanceStat(
-                amount=len(predictions), duration=end_time - start_time
-            )
+        lines = map(
+            encode_json, forward_fields(predictions, dataset, settings)
         )
 
-        log_scored(when=end_time)
+        # the first prediction is made before responding, such that errors
+        # which happen before anything is sent still result in an error
+        # response
+        first_line = next(lines, None)
+
+        def stream() -> Iterator[bytes]:
+            amount = 0
+            if first_line is not None:
+                yield first_line
+                amount += 1
+
+            # once the response has started, errors can no longer change its
+            # status, so they have to be handled while streaming
+            try:
+                for line in lines:
+                    yield b"\n" + line
+                    amount += 1
+            except Exception:
+                if not settings.gluonts_batch_suppress_errors:
+                    logger.exception(
+                        f"Aborting response after {amount} of "
+                        f"{len(instances)} predictions."
+                    )
+                    raise
+
+                yield b"\n" + json.dumps(
+                    {"error": traceback.format_exc()}
+                ).encode("utf8")
+
+            end_time = time.time()
+
+            scored_instances.append(
+                ScoredInstanceStat(
+                    amount=amount, duration=end_time - start_time
+                )
+            )
 
-        for forward_field in settings.gluonts_forward_fields:
-            for input_item, prediction in zip(dataset, predictions):
-                prediction[forward_field] = input_item.get(forward_field)
+            log_scored(when=end_time)
 
-        lines = list(map(json.dumps, map(jsonify_floats, predictions)))
-        return Response("\n".join(lines), mimetype="application/jsonlines")
+        return Response(stream(), mimetype="application/jsonlines")
 
     def invocations_error_wrapper() -> Response:
         try:
@@ -268,7 +341,11 @@ def batch_inference_invocations(
 
 
 def make_app(
-    predictor_factory, execution_params, batch_transform_config, settings
+    predictor_factory,
+    execution_params,
+    batch_transform_config,
+    settings,
+    static_predictor: bool = True,
 ):
     app = get_base_app(execution_params)
 
@@ -277,7 +354,8 @@ def make_app(
             predictor_factory, batch_transform_config, settings
         )
     else:
-        invocations_fn = inference_invocations(predictor_factory)
+        batcher = make_request_batcher(settings, static_predictor)
+        invocations_fn = inference_invocations(predictor_factory, batcher)
 
     app.route("/invocations", methods=["POST"])(invocations_fn)
     return app
@@ -0,0 +1,355 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""
+Asynchronous scoring service, implemented as a plain ASGI application.
+
+The event loop only parses requests and writes responses, while predictors
+run in a thread pool. Forecasts are encoded and sent as soon as they are
+produced, so that the response is streamed instead of built in memory, and
+concurrent connections are accepted while predictions are running.
+"""
+
+import asyncio
+import json
+import logging
+import traceback
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from gluonts.dataset.common import ListDataset
+
+from .app import (
+    InferenceRequest,
+    forward_fields,
+    iter_predictions,
+    make_predictions_with_timeout,
+    make_timeout_pool,
+)
+from .batching import make_request_batcher
+from .util import encode_json, jsonify_floats
+
+logger = logging.getLogger("gluonts.serve")
+
+USAGE_MESSAGE = """
+Cannot import `uvicorn`.
+
+Running the ASGI scoring service requires an ASGI server such as `uvicorn`,
+which can be installed with
+
+    pip install uvicorn
+"""
+
+
+def _encode(prediction: dict) -> bytes:
+    return json.dumps(jsonify_floats(prediction)).encode("utf-8")
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _respond(
+    send, status: int, body: bytes, content_type: bytes = b"text/plain"
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type)],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+async def _iterate_in_executor(
+    executor: Executor, make_iterator: Callable[[], Iterator[bytes]]
+) -> AsyncIterator[bytes]:
+    """
+    Run the iterator returned by `make_iterator` in `executor`, and yield
+    its elements as they are produced.
+    """
+    # called from a coroutine, this is the running loop
+    loop = asyncio.get_event_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+
+    def produce() -> None:
+        try:
+            for element in make_iterator():
+                loop.call_soon_threadsafe(queue.put_nowait, element)
+        except BaseException as error:
+            loop.call_soon_threadsafe(queue.put_nowait, _Failure(error))
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, end)
+
+    future = loop.run_in_executor(executor, produce)
+
+    while True:
+        element = await queue.get()
+        if element is end:
+            break
+        if isinstance(element, _Failure):
+            raise element.error
+        yield element
+
+    await future
+
+
+async def _stream(
+    send,
+    parts: AsyncIterator[bytes],
+    content_type: bytes,
+    prefix: bytes = b"",
+    separator: bytes = b"",
+    suffix: bytes = b"",
+) -> None:
+    async def start() -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+
+    # wait for the first part before starting the response, so that errors
+    # which occur before any forecast is produced result in an error status
+    parts = parts.__aiter__()
+    try:
+        part = await parts.__anext__()
+    except StopAsyncIteration:
+        await start()
+        await send({"type": "http.response.body", "body": prefix + suffix})
+        return
+
+    await start()
+    body = prefix + part
+    try:
+        async for part in parts:
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+            body = separator + part
+    except Exception:
+        # the status is already sent, all we can do is to cut the response
+        logger.exception("Error while streaming response")
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    await send({"type": "http.response.body", "body": body + suffix})
+
+
+def make_async_app(
+    predictor_factory,
+    execution_params,
+    batch_transform_config,
+    settings,
+    executor: Optional[Executor] = None,
+    static_predictor: bool = True,
+) -> Callable:
+    """
+    Create an ASGI application with the same endpoints and responses as the
+    Flask app created by `make_app`.
+
+    Parameters
+    ----------
+    predictor_factory
+        Function returning the predictor to use for a request.
+    execution_params
+        Response of the `/execution-parameters` endpoint.
+    batch_transform_config
+        Configuration for batch transform, in which case `/invocations`
+        expects JSON lines; `None` for inference requests.
+    settings
+        Serving settings.
+    executor
+        Executor to run predictors in; by default a thread pool with
+        `settings.number_of_threads` threads, or a single thread.
+    static_predictor
+        Whether `predictor_factory` always returns the same predictor;
+        requests are only batched dynamically if it does.
+    """
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=settings.number_of_threads or 1,
+            thread_name_prefix="gluonts-predict",
+        )
+
+    batcher = None
+    if batch_transform_config is None:
+        batcher = make_request_batcher(settings, static_predictor)
+
+    async def inference_invocations(body: bytes, send) -> None:
+        request_json = json.loads(body)
+        predictor = predictor_factory(request_json)
+        req = InferenceRequest.parse_obj(request_json)
+        configuration = req.configuration
+
+        def predictions() -> Iterator[bytes]:
+            if batcher is not None:
+                forecasts = batcher.predict(
+                    predictor,
+                    req.instances,
+                    num_samples=configuration.num_samples,
+                )
+            else:
+                forecasts = predictor.predict(
+                    ListDataset(req.instances, predictor.freq),
+                    num_samples=configuration.num_samples,
+                )
+            for forecast in forecasts:
+                yield _encode(forecast.as_json_dict(configuration))
+
+        await _stream(
+            send,
+            _iterate_in_executor(executor, predictions),
+            content_type=b"application/json",
+            prefix=b'{"predictions": [',
+            separator=b", ",
+            suffix=b"]}",
+        )
+
+    predictor = pool = None
+    if batch_transform_config is not None:
+        predictor = predictor_factory(
+            {"configuration": batch_transform_config.dict()}
+        )
+        if settings.gluonts_batch_timeout > 0:
+            pool = make_timeout_pool(
+                predictor, batch_transform_config, settings
+            )
+
+    async def batch_inference_invocations(body: bytes, send) -> None:
+        configuration = batch_transform_config
+        request_data = body.decode("utf8").strip()
+
+        # request_data can be empty, but .split() will produce a non-empty
+        # list, which then means we try to decode an empty string
+        if request_data:
+            instances = list(map(json.loads, request_data.split("\n")))
+        else:
+            instances = []
+
+        dataset = ListDataset(instances, predictor.freq)
+
+        def predictions() -> Iterator[bytes]:
+            if pool is not None:
+                predictions = make_predictions_with_timeout(
+                    pool,
+                    predictor,
+                    dataset,
+                    configuration,
+                    settings,
+                    request_data,
+                )
+            else:
+                predictions = iter_predictions(
+                    predictor, dataset, configuration
+                )
+
+            for prediction in forward_fields(predictions, dataset, settings):
+                yield encode_json(prediction)
+
+        await _stream(
+            send,
+            _iterate_in_executor(executor, predictions),
+            content_type=b"application/jsonlines",
+            separator=b"\n",
+        )
+
+    async def batch_inference_invocations_error_wrapper(
+        body: bytes, send
+    ) -> None:
+        try:
+            await batch_inference_invocations(body, send)
+        except Exception:
+            await _respond(
+                send,
+                200,
+                json.dumps({"error": traceback.format_exc()}).encode("utf-8"),
+                content_type=b"application/jsonlines",
+            )
+
+    if batch_transform_config is None:
+        invocations = inference_invocations
+    elif settings.gluonts_batch_suppress_errors:
+        invocations = batch_inference_invocations_error_wrapper
+    else:
+        invocations = batch_inference_invocations
+
+    async def lifespan(receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def app(scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await lifespan(receive, send)
+            return
+        assert scope["type"] == "http"
+
+        path, method = scope["path"], scope["method"]
+
+        try:
+            if path == "/ping":
+                await _respond(send, 200, b"")
+            elif path == "/execution-parameters":
+                await _respond(
+                    send,
+                    200,
+                    json.dumps(execution_params).encode("utf-8"),
+                    content_type=b"application/json",
+                )
+            elif path == "/invocations" and method == "POST":
+                await invocations(await _read_body(receive), send)
+            else:
+                await _respond(send, 404, b"Not Found")
+        except Exception:
+            logger.exception("Error while handling request")
+            await _respond(send, 500, traceback.format_exc().encode("utf-8"))
+
+    return app
+
+
+def run_asgi_app(app: Callable, settings) -> None:
+    """
+    Serve an ASGI application with `uvicorn`, on the address and port
+    configured in `settings`.
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        raise ImportError(USAGE_MESSAGE)
+
+    uvicorn.run(
+        app,
+        host=str(settings.sagemaker_server_address),
+        port=settings.sagemaker_server_port,
+        timeout_keep_alive=settings.sagemaker_server_timeout,
+    )
@@ -0,0 +1,220 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from gluonts.dataset.common import ListDataset
+from gluonts.model.forecast import Forecast
+from gluonts.model.predictor import Predictor
+
+logger = logging.getLogger("gluonts.serve")
+
+
+class _PendingRequest:
+    def __init__(
+        self, predictor: Predictor, instances: list, num_samples: Optional[int]
+    ) -> None:
+        self.predictor = predictor
+        self.instances = instances
+        self.num_samples = num_samples
+        self.arrival = time.monotonic()
+        self.done = threading.Event()
+        self.forecasts: Optional[List[Forecast]] = None
+        self.error: Optional[BaseException] = None
+
+    def batches_with(self, other: "_PendingRequest") -> bool:
+        return (
+            self.predictor is other.predictor
+            and self.num_samples == other.num_samples
+        )
+
+
+class RequestBatcher:
+    """
+    Coalesces the instances of concurrent inference requests into batches,
+    so that the predictor runs on larger batches than single requests
+    provide.
+
+    Requests are queued, and a background thread combines requests for the
+    same predictor object and number of samples until either `max_batch_size`
+    instances are collected, or the oldest request has waited for
+    `max_delay` seconds. It then runs a single `predict` call on all of
+    them and hands the forecasts back to the waiting requests. Requests
+    with more than `max_batch_size` instances are predicted on their own.
+
+    Since `predict` is only ever called from the background thread, the
+    predictor is not used concurrently, even if requests are served by
+    multiple threads. Requests are only ever combined if they share the
+    predictor, which is why batching is only useful in static mode, see
+    `make_request_batcher`.
+
+    Parameters
+    ----------
+    max_batch_size
+        Maximal number of instances to predict at once.
+    max_delay
+        Maximal time in seconds that a request waits for others to join its
+        batch.
+    """
+
+    def __init__(self, max_batch_size: int, max_delay: float) -> None:
+        assert max_batch_size > 0, "max_batch_size must be positive"
+        assert max_delay >= 0, "max_delay must not be negative"
+
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._condition = threading.Condition()
+        self._pending: Deque[_PendingRequest] = deque()
+        # the thread is started on first use, since gunicorn creates the
+        # app before forking the workers, which do not inherit threads
+        self._thread_pid: Optional[int] = None
+
+    def predict(
+        self,
+        predictor: Predictor,
+        instances: list,
+        num_samples: Optional[int] = None,
+    ) -> List[Forecast]:
+        """
+        Predict the given instances as part of a batch, blocking until the
+        forecasts are available.
+        """
+        request = _PendingRequest(predictor, instances, num_samples)
+
+        with self._condition:
+            self._ensure_thread()
+            self._pending.append(request)
+            self._condition.notify_all()
+
+        request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        assert request.forecasts is not None
+        return request.forecasts
+
+    def _ensure_thread(self) -> None:
+        if self._thread_pid != os.getpid():
+            # pending requests of a parent process are never answered here
+            self._pending.clear()
+            threading.Thread(target=self._run, daemon=True).start()
+            self._thread_pid = os.getpid()
+
+    def _next_batch(self) -> List[_PendingRequest]:
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+
+            first = self._pending[0]
+            deadline = first.arrival + self.max_delay
+
+            while True:
+                batch = self._collect(first)
+                num_instances = sum(len(req.instances) for req in batch)
+                remaining = deadline - time.monotonic()
+                if num_instances >= self.max_batch_size or remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            for request in batch:
+                self._pending.remove(request)
+
+            return batch
+
+    def _collect(self, first: _PendingRequest) -> List[_PendingRequest]:
+        batch = [first]
+        num_instances = len(first.instances)
+
+        for request in self._pending:
+            if request is first or not first.batches_with(request):
+                continue
+            if num_instances + len(request.instances) > self.max_batch_size:
+                break
+            batch.append(request)
+            num_instances += len(request.instances)
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            self._predict_batch(self._next_batch())
+
+    def _predict_batch(self, batch: List[_PendingRequest]) -> None:
+        first = batch[0]
+        instances = [
+            instance for request in batch for instance in request.instances
+        ]
+
+        start = time.time()
+        try:
+            forecasts = list(
+                first.predictor.predict(
+                    ListDataset(instances, first.predictor.freq),
+                    num_samples=first.num_samples,
+                )
+            )
+            assert len(forecasts) == len(
+                instances
+            ), "Predictor did not return one forecast per instance."
+        except Exception as error:
+            for request in batch:
+                request.error = error
+                request.done.set()
+            return
+
+        logger.info(
+            f"Inference took {time.time() - start:.2f}s for "
+            f"{len(instances)} items from {len(batch)} requests."
+        )
+
+        offset = 0
+        for request in batch:
+            request.forecasts = forecasts[
+                offset : offset + len(request.instances)
+            ]
+            offset += len(request.instances)
+            request.done.set()
+
+
+def make_request_batcher(
+    settings, static_predictor: bool
+) -> Optional[RequestBatcher]:
+    """
+    Create the `RequestBatcher` for inference requests according to
+    `settings`, or return `None` if dynamic batching is disabled.
+
+    In dynamic mode (`static_predictor=False`), a new predictor is created
+    for every request, so requests would never be combined but still wait
+    for `gluonts_dynamic_batch_delay` seconds. Batching is therefore only
+    used with a static predictor.
+    """
+    if settings.gluonts_dynamic_batch_size <= 0:
+        return None
+
+    if not static_predictor:
+        logger.warning(
+            "Ignoring GLUONTS_DYNAMIC_BATCH_SIZE, since requests can only be "
+            "batched with a static predictor."
+        )
+        return None
+
+    return RequestBatcher(
+        max_batch_size=settings.gluonts_dynamic_batch_size,
+        max_delay=settings.gluonts_dynamic_batch_delay,
+    )
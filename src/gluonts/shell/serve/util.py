@@ -11,8 +11,15 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import json
+
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def jsonify_floats(json_object):
     """
@@ -37,3 +44,41 @@ def jsonify_floats(json_object):
             return "-Infinity"
         return json_object
     return json_object
+
+
+def _prepare_for_encoding(json_object):
+    if isinstance(json_object, np.ndarray):
+        # orjson writes non-finite floats as `null`, which is why arrays
+        # containing them take the slow path through `jsonify_floats`
+        if (
+            orjson is not None
+            and json_object.dtype in (np.float32, np.float64)
+            and np.isfinite(json_object).all()
+        ):
+            return np.ascontiguousarray(json_object)
+        return jsonify_floats(json_object.tolist())
+    elif isinstance(json_object, dict):
+        return {k: _prepare_for_encoding(v) for k, v in json_object.items()}
+    elif isinstance(json_object, list):
+        return [_prepare_for_encoding(item) for item in json_object]
+    return jsonify_floats(json_object)
+
+
+def encode_json(json_object) -> bytes:
+    """
+    Encodes a JSON object, which may contain numpy arrays, as JSON.
+
+    Non-finite floats are represented as strings, as done by
+    `jsonify_floats`. If `orjson` is available, float arrays are serialized
+    directly, without converting them to lists first.
+
+    Parameters
+    ----------
+    json_object
+        JSON object
+    """
+    json_object = _prepare_for_encoding(json_object)
+
+    if orjson is not None:
+        return orjson.dumps(json_object, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(json_object).encode("utf-8")
@@ -0,0 +1,183 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import logging
+import multiprocessing as mp
+import os
+import signal
+import threading
+import time
+import traceback
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger("gluonts.serve")
+
+
+def _work(fn: Callable[[list], Iterator], connection: Connection) -> None:
+    while True:
+        try:
+            items = connection.recv()
+        except EOFError:
+            return
+
+        try:
+            for result in fn(items):
+                connection.send(("result", result))
+        except Exception:
+            connection.send(("error", traceback.format_exc()))
+        else:
+            connection.send(("done", None))
+
+
+class _Worker:
+    def __init__(self, fn: Callable[[list], Iterator]) -> None:
+        self.connection, child_connection = mp.Pipe()
+        self.process = mp.Process(
+            target=_work, args=(fn, child_connection), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+
+        # positions of the items the worker is processing, and how many of
+        # them it has returned so far
+        self.indices: Sequence[int] = []
+        self.received = 0
+
+    def submit(self, indices: Sequence[int], items: list) -> None:
+        self.indices = indices
+        self.received = 0
+        self.connection.send(items)
+
+    def kill(self) -> None:
+        os.kill(self.process.pid, signal.SIGKILL)
+        self.process.join()
+        self.connection.close()
+
+
+class WatchdogPool:
+    """
+    Pool of persistent worker processes, which apply a function to lists of
+    items under a deadline.
+
+    In contrast to starting a process per call, the workers (and everything
+    `fn` refers to, such as a predictor) are created once and reused across
+    calls. A worker which does not finish before the deadline is killed and
+    replaced by a new one, and only the items it has not returned yet are
+    reported as missing.
+
+    Workers are started on first use in each process, since gunicorn
+    creates the app before forking its workers. Calls are serialized, so
+    that each call can use all workers.
+
+    Parameters
+    ----------
+    fn
+        Function which is called with a list of items in a worker, and
+        returns an iterator with one result per item. Results need to be
+        picklable.
+    num_workers
+        Number of worker processes, among which the items of a call are
+        split.
+    """
+
+    def __init__(
+        self, fn: Callable[[list], Iterator], num_workers: int = 1
+    ) -> None:
+        assert num_workers > 0, "num_workers must be positive"
+
+        self.fn = fn
+        self.num_workers = num_workers
+
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        self._pid: Optional[int] = None
+
+    def map(self, items: Sequence, timeout: float) -> List[Optional[Any]]:
+        """
+        Apply `fn` to `items` in the workers, and return the results in
+        order. Items for which no result was produced within `timeout`
+        seconds, or which failed, have `None` as result.
+        """
+        with self._lock:
+            self._ensure_workers()
+            return self._map(items, time.monotonic() + timeout)
+
+    def _ensure_workers(self) -> None:
+        if self._pid != os.getpid():
+            # workers of a parent process cannot be used here
+            self._workers = [_Worker(self.fn) for _ in range(self.num_workers)]
+            self._pid = os.getpid()
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        self._workers[self._workers.index(worker)] = _Worker(self.fn)
+
+    def _map(self, items: Sequence, deadline: float) -> List[Optional[Any]]:
+        results: List[Optional[Any]] = [None] * len(items)
+        if not items:
+            return results
+
+        chunk_size = -(-len(items) // self.num_workers)
+        busy: Dict[Connection, _Worker] = {}
+
+        for worker, start in zip(
+            list(self._workers), range(0, len(items), chunk_size)
+        ):
+            indices = range(start, min(start + chunk_size, len(items)))
+            try:
+                worker.submit(indices, [items[idx] for idx in indices])
+            except OSError:
+                logger.warning(
+                    f"Worker pid={worker.process.pid} is not available, "
+                    "restarting it."
+                )
+                self._replace(worker)
+                continue
+            busy[worker.connection] = worker
+
+        while busy:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            for connection in wait(list(busy), remaining):
+                worker = busy[connection]
+                try:
+                    kind, value = connection.recv()
+                except EOFError:
+                    logger.warning(
+                        f"Worker pid={worker.process.pid} died, "
+                        "restarting it."
+                    )
+                    del busy[connection]
+                    self._replace(worker)
+                    continue
+
+                if kind == "result":
+                    results[worker.indices[worker.received]] = value
+                    worker.received += 1
+                else:
+                    if kind == "error":
+                        logger.warning(f"Worker failed with: {value}")
+                    del busy[connection]
+
+        for worker in busy.values():
+            logger.warning(
+                f"Worker pid={worker.process.pid} timed out after returning "
+                f"{worker.received} of {len(worker.indices)} items, "
+                "restarting it."
+            )
+            self._replace(worker)
+
+        return results
@@ -21,11 +21,13 @@ import torch.nn as nn
 from gluonts.core.serde import dump_json, load_json
 from gluonts.dataset.common import DataEntry, Dataset
 from gluonts.dataset.loader import InferenceDataLoader
-from gluonts.model.forecast import Forecast
+from gluonts.model.forecast import Forecast, ForecastBatch
 from gluonts.model.forecast_generator import (
     ForecastGenerator,
     SampleForecastGenerator,
+    encode_to_state,
     predict_to_numpy,
+    sample_state_to_numpy,
 )
 from gluonts.model.predictor import OutputTransform, Predictor
 from gluonts.torch.batchify import batchify
@@ -38,6 +40,16 @@ def _(prediction_net: nn.Module, inputs: torch.Tensor) -> np.ndarray:
     return prediction_net(*inputs).cpu().numpy()
 
 
+@encode_to_state.register(nn.Module)
+def _(prediction_net: nn.Module, inputs: torch.Tensor):
+    return prediction_net.encode(*inputs)
+
+
+@sample_state_to_numpy.register(nn.Module)
+def _(prediction_net: nn.Module, state, num_samples: int) -> np.ndarray:
+    return prediction_net.sample_from_state(state, num_samples).cpu().numpy()
+
+
 class PyTorchPredictor(Predictor):
     def __init__(
         self,
@@ -64,18 +76,11 @@ class PyTorchPredictor(Predictor):
     def predict(
         self, dataset: Dataset, num_samples: Optional[int] = None
     ) -> Iterator[Forecast]:
-        inference_data_loader = InferenceDataLoader(
-            dataset,
-            transform=self.input_transform,
-            batch_size=self.batch_size,
-            stack_fn=lambda data: batchify(data, self.device),
-        )
-
         self.prediction_net.eval()
 
         with torch.no_grad():
             yield from self.forecast_generator(
-                inference_data_loader=inference_data_loader,
+                inference_data_loader=self._inference_data_loader(dataset),
                 prediction_net=self.prediction_net,
                 input_names=self.input_names,
                 freq=self.freq,
@@ -83,6 +88,29 @@ class PyTorchPredictor(Predictor):
                 num_samples=num_samples,
             )
 
+    def predict_batches(
+        self, dataset: Dataset, num_samples: Optional[int] = None
+    ) -> Iterator[ForecastBatch]:
+        self.prediction_net.eval()
+
+        with torch.no_grad():
+            yield from self.forecast_generator.generate_batches(
+                inference_data_loader=self._inference_data_loader(dataset),
+                prediction_net=self.prediction_net,
+                input_names=self.input_names,
+                freq=self.freq,
+                output_transform=self.output_transform,
+                num_samples=num_samples,
+            )
+
+    def _inference_data_loader(self, dataset: Dataset) -> InferenceDataLoader:
+        return InferenceDataLoader(
+            dataset,
+            transform=self.input_transform,
+            batch_size=self.batch_size,
+            stack_fn=lambda data: batchify(data, self.device),
+        )
+
     def __eq__(self, that):
         if type(self) != type(that):
             return False
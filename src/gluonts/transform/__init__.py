@@ -52,6 +52,7 @@ __all__ = [
     "TargetDimIndicator",
     "TransformedDataset",
     "TestSplitSampler",
+    "TimeFeatureTable",
     "ValidationSplitSampler",
     "Transformation",
     "UniformSplitSampler",
@@ -102,6 +103,7 @@ from .feature import (
     MissingValueImputation,
     RollingMeanValueImputation,
     target_transformation_length,
+    TimeFeatureTable,
 )
 from .field import (
     RemoveFields,
@@ -11,17 +11,22 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 
 from gluonts.core.component import DType, validated
+from gluonts.core.exception import GluonTSDataError
+from gluonts.core.serde import dump_json
 from gluonts.dataset.common import DataEntry
 from gluonts.time_feature import TimeFeature
 
 from ._base import MapTransformation, SimpleTransformation
-from .split import shift_timestamp
+from .split import _shift_timestamp_helper, shift_timestamp
 
 
 def target_transformation_length(
@@ -292,6 +297,95 @@ class AddConstFeature(MapTransformation):
         return data
 
 
+class TimeFeatureTable:
+    """
+    Values of time features for all time points of a date range, from which
+    the features of any series within the range can be sliced.
+
+    Time points are located by integer arithmetic on their offset from the
+    epoch in nanoseconds for fixed frequencies, and by a binary search over
+    these offsets otherwise.
+
+    Parameters
+    ----------
+    time_features
+        Time features to compute.
+    date_range
+        Time points for which the features are computed, with a frequency.
+    dtype
+        Data type of the values.
+    """
+
+    def __init__(
+        self,
+        time_features: List[TimeFeature],
+        date_range: pd.DatetimeIndex,
+        dtype: DType = np.float32,
+    ) -> None:
+        self.freq = date_range.freq
+        self.time_features_key = dump_json(time_features)
+        self.timestamps = date_range.asi8
+        self.values = np.vstack(
+            [feat(date_range) for feat in time_features]
+        ).astype(dtype)
+
+    def index_of(self, start: pd.Timestamp) -> Optional[int]:
+        """
+        Returns the position of `start` in the table, or `None` if the table
+        does not contain it.
+        """
+        if len(self.timestamps) == 0:
+            return None
+
+        if isinstance(self.freq, Tick):
+            idx, remainder = divmod(
+                start.value - self.timestamps[0], self.freq.nanos
+            )
+            if remainder != 0:
+                return None
+        else:
+            idx = np.searchsorted(self.timestamps, start.value)
+
+        if 0 <= idx < len(self.timestamps):
+            if self.timestamps[idx] == start.value:
+                return int(idx)
+        return None
+
+    def get(self, start: pd.Timestamp, length: int) -> Optional[np.ndarray]:
+        """
+        Returns the features of the `length` time points beginning with
+        `start`, or `None` if the table does not contain all of them.
+        """
+        i0 = self.index_of(start)
+        if i0 is None or i0 + length > len(self.timestamps):
+            return None
+        return self.values[..., i0 : i0 + length]
+
+    def save(self, path: Path) -> None:
+        np.savez(
+            path,
+            freq=np.array(self.freq.freqstr),
+            time_features=np.array(self.time_features_key),
+            timestamps=self.timestamps,
+            values=self.values,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "TimeFeatureTable":
+        with np.load(path, allow_pickle=False) as arrays:
+            table = cls.__new__(cls)
+            table.freq = to_offset(str(arrays["freq"]))
+            table.time_features_key = str(arrays["time_features"])
+            table.timestamps = arrays["timestamps"]
+            table.values = arrays["values"]
+            return table
+
+
+# tables shared by all `AddTimeFeatures` instances of a process (and of the
+# processes forked from it), by frequency, time features and data type
+_TIME_FEATURE_TABLES: Dict[Tuple[str, str, str], TimeFeatureTable] = {}
+
+
 class AddTimeFeatures(MapTransformation):
     """
     Adds a set of time features.
@@ -299,6 +393,10 @@ class AddTimeFeatures(MapTransformation):
     If `is_train=True` the feature matrix has the same length as the `target` field.
     If `is_train=False` the feature matrix has length len(target) + pred_length
 
+    Features are looked up in the table computed by `precompute` if there is
+    one for the frequency of the time series, otherwise in a table which
+    each instance grows as needed.
+
     Parameters
     ----------
     start_field
@@ -330,9 +428,80 @@ class AddTimeFeatures(MapTransformation):
         self.output_field = output_field
         self._min_time_point: pd.Timestamp = None
         self._max_time_point: pd.Timestamp = None
-        self._full_range_date_features: np.ndarray = None
-        self._date_index: pd.DatetimeIndex = None
+        self._table: Optional[TimeFeatureTable] = None
         self.dtype = dtype
+        self._time_features_key = dump_json(time_features)
+
+    def _table_key(self, freq) -> Tuple[str, str, str]:
+        return (
+            freq.freqstr,
+            self._time_features_key,
+            np.dtype(self.dtype).name,
+        )
+
+    def precompute(
+        self, dataset: Iterable[DataEntry], path: Optional[Path] = None
+    ) -> TimeFeatureTable:
+        """
+        Computes the features for the full date span of `dataset` once, and
+        shares them with all instances with the same time features and data
+        type in this process, and in the data loader workers forked from it.
+
+        If `path` is given and the file exists, the table is loaded from it
+        instead of computing it, after checking that it matches the time
+        features, the frequency and the date span of `dataset`; otherwise,
+        the computed table is saved there. This allows to store the table
+        next to the dataset.
+        """
+        freq = None
+        first, last = None, None
+        for data in dataset:
+            start = data[self.start_field]
+            if freq is None:
+                freq = start.freq
+            end = _shift_timestamp_helper(
+                start,
+                freq,
+                target_transformation_length(
+                    data[self.target_field], self.pred_length, is_train=False
+                ),
+            )
+            first = start if first is None else min(first, start)
+            last = end if last is None else max(last, end)
+
+        if freq is None:
+            raise GluonTSDataError("Cannot precompute for an empty dataset.")
+
+        if path is not None and Path(path).exists():
+            table = TimeFeatureTable.load(path)
+            if table.time_features_key != self._time_features_key:
+                raise GluonTSDataError(
+                    f"The time features stored in {path} differ from the "
+                    f"ones of the transformation."
+                )
+            if table.freq != freq:
+                raise GluonTSDataError(
+                    f"The time features stored in {path} have frequency "
+                    f"{table.freq.freqstr}, but the dataset has frequency "
+                    f"{freq.freqstr}."
+                )
+            if table.index_of(first) is None or table.index_of(last) is None:
+                raise GluonTSDataError(
+                    f"The time features stored in {path} do not cover the "
+                    f"dataset, which spans from {first} to {last}."
+                )
+            table.values = table.values.astype(self.dtype, copy=False)
+        else:
+            table = TimeFeatureTable(
+                self.date_features,
+                pd.date_range(first, last, freq=freq),
+                dtype=self.dtype,
+            )
+            if path is not None:
+                table.save(path)
+
+        _TIME_FEATURE_TABLES[self._table_key(table.freq)] = table
+        return table
 
     def _update_cache(self, start: pd.Timestamp, length: int) -> None:
         end = shift_timestamp(start, length)
@@ -348,33 +517,46 @@ class AddTimeFeatures(MapTransformation):
         self._max_time_point = max(
             shift_timestamp(end, 50), self._max_time_point
         )
-        self.full_date_range = pd.date_range(
-            self._min_time_point, self._max_time_point, freq=start.freq
-        )
-        self._full_range_date_features = (
-            np.vstack(
-                [feat(self.full_date_range) for feat in self.date_features]
-            ).astype(self.dtype)
-            if self.date_features
-            else None
-        )
-        self._date_index = pd.Series(
-            index=self.full_date_range,
-            data=np.arange(len(self.full_date_range)),
+        self._table = TimeFeatureTable(
+            self.date_features,
+            pd.date_range(
+                self._min_time_point, self._max_time_point, freq=start.freq
+            ),
+            dtype=self.dtype,
         )
 
     def map_transform(self, data: DataEntry, is_train: bool) -> DataEntry:
+        if not self.date_features:
+            data[self.output_field] = None
+            return data
+
         start = data[self.start_field]
         length = target_transformation_length(
             data[self.target_field], self.pred_length, is_train=is_train
         )
-        self._update_cache(start, length)
-        i0 = self._date_index[start]
-        features = (
-            self._full_range_date_features[..., i0 : i0 + length]
-            if self.date_features
-            else None
-        )
+
+        features = None
+        for table in [
+            _TIME_FEATURE_TABLES.get(self._table_key(start.freq)),
+            self._table,
+        ]:
+            if table is not None:
+                features = table.get(start, length)
+                if features is not None:
+                    break
+        else:
+            self._update_cache(start, length)
+            features = self._table.get(start, length)
+
+        if features is None:
+            # the start is off the grid of the cached table, e.g. an hourly
+            # series starting at 00:30 after one starting at 00:00
+            features = TimeFeatureTable(
+                self.date_features,
+                pd.date_range(start, periods=length, freq=start.freq),
+                dtype=self.dtype,
+            ).values
+
         data[self.output_field] = features
         return data
 
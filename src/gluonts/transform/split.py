@@ -16,6 +16,7 @@ from typing import Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import as_strided
 
 from gluonts.core.component import validated
 from gluonts.core.exception import GluonTSDateBoundsError
@@ -54,11 +55,29 @@ def _shift_timestamp_helper(
         # this line looks innocent, but can create a date which is out of
         # bounds values over year 9999 raise a ValueError
         # values over 2262-04-11 raise a pandas OutOfBoundsDatetime
-        return ts + offset * ts.freq
+        return ts + offset * freq
     except (ValueError, pd._libs.OutOfBoundsDatetime) as ex:
         raise GluonTSDateBoundsError(ex)
 
 
+def _windows(array: np.ndarray, starts: np.ndarray, length: int) -> np.ndarray:
+    """
+    Returns ``array[..., s : s + length]`` for each ``s`` in ``starts``,
+    stacked along a new first axis. All windows need to lie within `array`.
+
+    The windows are gathered from a strided view of `array`, so that only the
+    result is allocated.
+    """
+    num_windows = max(array.shape[-1] - length + 1, 0)
+    windows = as_strided(
+        array,
+        shape=(num_windows,) + array.shape[:-1] + (length,),
+        strides=(array.strides[-1],) + array.strides,
+        writeable=False,
+    )
+    return windows[starts]
+
+
 class InstanceSplitter(FlatMapTransformation):
     """
     Selects training instances, by slicing the target and other time series
@@ -147,60 +166,97 @@ class InstanceSplitter(FlatMapTransformation):
     def _future(self, col_name):
         return f"future_{col_name}"
 
-    def flatmap_transform(
-        self, data: DataEntry, is_train: bool
-    ) -> Iterator[DataEntry]:
-        pl = self.future_length
+    def split_block(self, data: DataEntry, indices: np.ndarray) -> DataEntry:
+        """
+        Splits `data` at all `indices` at once.
+
+        The result contains the same fields as the instances yielded for
+        these indices, but the values of the `past_` and `future_` fields,
+        `past_is_pad` and the forecast start are stacked along a new first
+        axis, with one entry per index. Future windows which are cut short
+        by the end of a time series are returned as a list of arrays instead,
+        since they cannot be stacked.
+        """
+        indices = np.asarray(indices, dtype=int)
         lt = self.lead_time
-        slice_cols = self.ts_fields + [self.target_field]
-        target = data[self.target_field]
-
-        len_target = target.shape[-1]
-
-        sampled_indices = self.instance_sampler(target)
-
-        for i in sampled_indices:
-            pad_length = max(self.past_length - i, 0)
-            d = data.copy()
-            for ts_field in slice_cols:
-                if i > self.past_length:
-                    # truncate to past_length
-                    past_piece = d[ts_field][..., i - self.past_length : i]
-                elif i < self.past_length:
-                    pad_block = (
-                        np.ones(
-                            d[ts_field].shape[:-1] + (pad_length,),
-                            dtype=d[ts_field].dtype,
-                        )
-                        * self.dummy_value
-                    )
-                    past_piece = np.concatenate(
-                        [pad_block, d[ts_field][..., :i]], axis=-1
-                    )
-                else:
-                    past_piece = d[ts_field][..., :i]
-                d[self._past(ts_field)] = past_piece
-                d[self._future(ts_field)] = d[ts_field][
-                    ..., i + lt : i + lt + pl
+        block = data.copy()
+
+        for ts_field in self.ts_fields + [self.target_field]:
+            ts = block.pop(ts_field)
+
+            # only pad the time series if any past window starts before it
+            if len(indices) > 0 and indices.min() < self.past_length:
+                pad_block = np.full(
+                    ts.shape[:-1] + (self.past_length,),
+                    self.dummy_value,
+                    dtype=ts.dtype,
+                )
+                past = _windows(
+                    np.concatenate([pad_block, ts], axis=-1),
+                    indices,
+                    self.past_length,
+                )
+            else:
+                past = _windows(
+                    ts, indices - self.past_length, self.past_length
+                )
+
+            future_starts = indices + lt
+            if (
+                len(indices) == 0
+                or future_starts.max() + self.future_length <= ts.shape[-1]
+            ):
+                future = _windows(ts, future_starts, self.future_length)
+            else:
+                future = [
+                    ts[..., start : start + self.future_length]
+                    for start in future_starts
                 ]
-                del d[ts_field]
-            pad_indicator = np.zeros(self.past_length, dtype=target.dtype)
-            if pad_length > 0:
-                pad_indicator[:pad_length] = 1
 
             if self.output_NTC:
-                for ts_field in slice_cols:
-                    d[self._past(ts_field)] = d[
-                        self._past(ts_field)
-                    ].transpose()
-                    d[self._future(ts_field)] = d[
-                        self._future(ts_field)
-                    ].transpose()
-
-            d[self._past(self.is_pad_field)] = pad_indicator
-            d[self.forecast_start_field] = shift_timestamp(
-                d[self.start_field], i + lt
-            )
+                # reverse the axes of each instance
+                past = past.transpose(0, *range(past.ndim - 1, 0, -1))
+                future = (
+                    future.transpose(0, *range(future.ndim - 1, 0, -1))
+                    if isinstance(future, np.ndarray)
+                    else [piece.transpose() for piece in future]
+                )
+
+            block[self._past(ts_field)] = past
+            block[self._future(ts_field)] = future
+
+        block[self._past(self.is_pad_field)] = (
+            np.arange(self.past_length)[np.newaxis, :]
+            < (self.past_length - indices)[:, np.newaxis]
+        ).astype(data[self.target_field].dtype)
+        start = data[self.start_field]
+        freq = start.freq
+        block[self.forecast_start_field] = [
+            _shift_timestamp_helper(start, freq, i + lt) for i in indices
+        ]
+        return block
+
+    def flatmap_transform(
+        self, data: DataEntry, is_train: bool
+    ) -> Iterator[DataEntry]:
+        sampled_indices = self.instance_sampler(data[self.target_field])
+        block = self.split_block(data, sampled_indices)
+
+        stacked_fields = [
+            name(ts_field)
+            for ts_field in self.ts_fields + [self.target_field]
+            for name in [self._past, self._future]
+        ] + [self._past(self.is_pad_field), self.forecast_start_field]
+
+        for k in range(len(sampled_indices)):
+            d = block.copy()
+            for field in stacked_fields:
+                value = block[field][k]
+                # rows are copied, since views would keep the whole block
+                # alive as long as any of the instances
+                d[field] = (
+                    value.copy() if isinstance(value, np.ndarray) else value
+                )
             yield d
 
 
@@ -0,0 +1,161 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from gluonts.core.exception import GluonTSDataError
+from gluonts.dataset.common import (
+    FileDataset,
+    MetaData,
+    serialize_data_entry,
+)
+
+pytest.importorskip("pyarrow")
+
+from gluonts.dataset.arrow import ArrowFile, convert_to_arrow, write_arrow
+
+
+def make_entries(num_series: int, multivariate: bool = False):
+    return [
+        {
+            "start": "2020-01-01",
+            "target": np.random.normal(
+                size=(2, 10 + i) if multivariate else 10 + i
+            ),
+            "feat_static_cat": np.array([i, 2 * i]),
+            "feat_dynamic_real": np.random.normal(size=(3, 10 + i)),
+            "item_id": f"item_{i}",
+        }
+        for i in range(num_series)
+    ]
+
+
+def assert_entries_equal(left, right):
+    assert left.keys() == right.keys()
+    for key in left:
+        if isinstance(left[key], np.ndarray):
+            assert left[key].dtype == right[key].dtype
+            np.testing.assert_equal(left[key], right[key])
+        elif key == "source":
+            assert left[key].row == right[key].row
+        else:
+            assert left[key] == right[key]
+
+
+def save(entries, path: Path, name: str = "data.json") -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    with open(path / name, "w") as out_file:
+        for entry in entries:
+            json.dump(serialize_data_entry(entry), out_file)
+            out_file.write("\n")
+
+
+@pytest.mark.parametrize("multivariate", [False, True])
+def test_convert_to_arrow(multivariate):
+    entries = make_entries(25, multivariate)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_path, arrow_path = Path(tmpdir, "json"), Path(tmpdir, "arrow")
+
+        save(entries, json_path / "train")
+        save(entries[:5], json_path / "test")
+        (json_path / "metadata").mkdir()
+        (json_path / "metadata" / "metadata.json").write_text(
+            MetaData(freq="H").json()
+        )
+
+        convert_to_arrow(json_path, arrow_path, chunk_size=10)
+        assert (arrow_path / "train" / "data.arrow").exists()
+        assert (arrow_path / "metadata" / "metadata.json").exists()
+
+        for split in ["train", "test"]:
+            expected, converted = [
+                FileDataset(
+                    path / split, freq="H", one_dim_target=not multivariate
+                )
+                for path in [json_path, arrow_path]
+            ]
+            assert len(expected) == len(converted)
+            for left, right in zip(expected, converted):
+                assert_entries_equal(left, right)
+
+
+def test_convert_to_arrow_file_names():
+    entries = make_entries(6)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_path, arrow_path = Path(tmpdir, "json"), Path(tmpdir, "arrow")
+
+        save(entries[:2], json_path / "train", "part.1.json")
+        save(entries[2:], json_path / "train", "part.2.json")
+        (json_path / "metadata").mkdir()
+        (json_path / "metadata" / "metadata.json").write_text(
+            MetaData(freq="H").json()
+        )
+
+        convert_to_arrow(json_path, arrow_path)
+        assert sorted(
+            path.name for path in (arrow_path / "train").iterdir()
+        ) == ["part.1.arrow", "part.2.arrow"]
+        assert len(FileDataset(arrow_path / "train", freq="H")) == 6
+
+
+def test_write_arrow_missing_fields():
+    entries = make_entries(25)
+    # item_id first occurs in the second entry, and is missing in parts of
+    # the second chunk and in all of the third one
+    for i in [0] + list(range(12, 25)):
+        del entries[i]["item_id"]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "data.arrow")
+        write_arrow(entries, path, chunk_size=10)
+
+        item_ids = [line.content["item_id"] for line in ArrowFile(path)]
+        assert item_ids == [entry.get("item_id") for entry in entries]
+
+        # fields have to occur within the first chunk
+        entries[20]["feat_static_real"] = [1.0]
+        with pytest.raises(GluonTSDataError):
+            write_arrow(entries, path, chunk_size=10)
+
+
+def test_arrow_file_is_zero_copy():
+    entries = make_entries(25)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "data.arrow")
+        write_arrow(entries, path, chunk_size=10)
+
+        arrow_file = ArrowFile(path)
+        assert len(arrow_file) == 25
+
+        for entry, line in zip(entries, arrow_file):
+            target = line.content["target"]
+            assert target.dtype == np.float32
+            assert not target.flags.owndata
+            assert not target.flags.writeable
+            np.testing.assert_allclose(target, entry["target"], rtol=1e-6)
+            assert line.content["feat_dynamic_real"].shape == (3, len(target))
+
+        assert arrow_file[17].content["item_id"] == "item_17"
+        assert arrow_file[17].span.line == 17
+
+        dataset = FileDataset(Path(tmpdir), freq="H")
+        assert len(dataset) == 25
+        assert dataset[3]["target"].base is not None
@@ -12,12 +12,16 @@
 # permissions and limitations under the License.
 
 import gzip
+import multiprocessing as mp
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from gluonts.dataset.common import FileDataset
+from gluonts.dataset.jsonl import JsonLinesFile, line_index_path
+from gluonts.dataset.util import MPWorkerInfo
 
 N = 3
 
@@ -44,3 +48,71 @@ def test_jsonlgz():
 
         assert len(FileDataset(path, freq="D")) == N
         assert len(list(FileDataset(path, freq="D"))) == N
+
+
+def test_jsonl_file_path():
+    with tempfile.TemporaryDirectory() as path:
+        file_path = Path(path, "data.json")
+        with file_path.open("w") as out_file:
+            for line in data:
+                out_file.write(line + "\n")
+
+        dataset = FileDataset(str(file_path), freq="D")
+        assert len(dataset) == N
+        assert len(list(dataset)) == N
+
+
+@pytest.mark.parametrize("suffix", ["json", "json.gz"])
+def test_line_index(suffix):
+    lines = [
+        f'{{"start": "2014-09-07", "target": [{i}, {i}]}}' for i in range(7)
+    ]
+
+    def write(path, lines):
+        with (gzip.open if suffix.endswith("gz") else open)(path, "wt") as f:
+            for line in lines:
+                f.write(line + "\n")
+
+    with tempfile.TemporaryDirectory() as path:
+        file_path = Path(path, f"data.{suffix}")
+        write(file_path, lines)
+
+        dataset = FileDataset(path, freq="D", use_index=True)
+        assert line_index_path(file_path).exists()
+        assert len(dataset) == 7
+        assert [entry["target"][0] for entry in dataset] == list(range(7))
+        assert dataset[3]["target"][0] == 3
+        assert dataset[-1]["target"][0] == 6
+        with pytest.raises(IndexError):
+            dataset[7]
+
+        # each worker reads its own part of the file
+        jsonl_file = JsonLinesFile(file_path, use_index=True)
+        process_name = mp.current_process().name
+        worker_lines = []
+        try:
+            for worker_id in range(3):
+                MPWorkerInfo.set_worker_info(
+                    num_workers=3, worker_id=worker_id
+                )
+                worker_lines.append([line.span.line for line in jsonl_file])
+        finally:
+            MPWorkerInfo.worker_process = False
+            mp.current_process().name = process_name
+        assert worker_lines == [[0, 1], [2, 3], [4, 5, 6]]
+
+        # a changed file invalidates the index
+        write(file_path, lines[:5])
+        os.utime(file_path, ns=(0, 0))
+        assert len(FileDataset(path, freq="D", use_index=True)) == 5
+
+
+def test_random_access_without_index():
+    with tempfile.TemporaryDirectory() as path:
+        with Path(path, "data.json").open("w") as out_file:
+            for line in data:
+                out_file.write(line + "\n")
+
+        dataset = FileDataset(path, freq="D")
+        assert dataset[N - 1]["source"].row == N - 1
+        assert not line_index_path(Path(path, "data.json")).exists()
@@ -13,7 +13,9 @@
 
 import json
 import multiprocessing as mp
+import os
 import random
+import sys
 import tempfile
 import time
 from collections import defaultdict
@@ -27,12 +29,15 @@ import pytest
 from flaky import flaky
 from mxnet.context import current_context
 
+from gluonts.core.exception import GluonTSDataError
 from gluonts.dataset.artificial import ConstantDataset, constant_dataset
 from gluonts.dataset.common import FileDataset, ListDataset
 
 from gluonts.dataset.field_names import FieldName
 from gluonts.dataset.loader import (
+    DataLoader,
     InferenceDataLoader,
+    MultiProcessBatcher,
     TrainDataLoader,
     ValidationDataLoader,
 )
@@ -43,6 +48,7 @@ from gluonts.mx.trainer import Trainer
 from gluonts.transform import (
     InstanceSampler,
     InstanceSplitter,
+    TransformedDataset,
     UniformSplitSampler,
 )
 
@@ -472,6 +478,211 @@ def test_training_loader_soft_constraint_03() -> None:
     ), "One worker should be able to traverse all in one sweep, and should not deplete its iterator."
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="shared_memory requires Python 3.8"
+)
+@pytest.mark.parametrize(
+    "shared_memory_slot_size",
+    [
+        16 * 1024 ** 2,
+        # too small for any batch, which forces the inline fallback
+        64,
+    ],
+)
+def test_shared_memory_transport(shared_memory_slot_size) -> None:
+    (
+        list_dataset,
+        transformation,
+        list_dataset_pred_length,
+        train_data_transformed_original,
+    ) = get_dataset_and_transformation()
+
+    batcher = MultiProcessBatcher(
+        TransformedDataset(list_dataset, transformation, is_train=True),
+        batch_size=BATCH_SIZE,
+        stack_fn=partial(batchify, ctx=current_context()),
+        decode_fn=partial(as_in_context, ctx=current_context()),
+        num_workers=2,
+        transport="shared_memory",
+        shared_memory_slot_size=shared_memory_slot_size,
+    )
+
+    batches = list(batcher)
+
+    assert get_transformation_counts(batches) == get_transformation_counts(
+        train_data_transformed_original
+    ), "The shared memory transport should yield the same batches as the queue transport."
+
+    assert batches[0]["past_target"].context == current_context()
+
+
+def _stack_item_ids(batch):
+    return [entry["item_id"] for entry in batch]
+
+
+def _crash_once_stack_fn(batch, marker: Path):
+    # exit the worker without cleanup the first time item 10 shows up
+    if 10 in _stack_item_ids(batch) and not marker.exists():
+        marker.touch()
+        os._exit(1)
+    return _stack_item_ids(batch)
+
+
+def _slow_stack_fn(batch):
+    time.sleep(2)
+    return _stack_item_ids(batch)
+
+
+def _slow_first_half_stack_fn(batch):
+    # slows down worker 0 when splitting 40 items between two workers
+    if min(_stack_item_ids(batch)) < 20:
+        time.sleep(0.2)
+    return _stack_item_ids(batch)
+
+
+def _item_dataset(num_items: int) -> ListDataset:
+    return ListDataset(
+        [
+            {"start": "2020-01-01", "target": [0.0], "item_id": i}
+            for i in range(num_items)
+        ],
+        freq="H",
+    )
+
+
+@pytest.mark.parametrize("transport", ["queue", "shared_memory"])
+def test_ordered_batches(transport) -> None:
+    if transport == "shared_memory" and sys.version_info < (3, 8):
+        pytest.skip("shared_memory requires Python 3.8")
+
+    def get_batches():
+        return list(
+            MultiProcessBatcher(
+                _item_dataset(40),
+                batch_size=4,
+                stack_fn=_stack_item_ids,
+                num_workers=2,
+                transport=transport,
+                ordered=True,
+            )
+        )
+
+    # workers alternate, starting with worker 0 (items 0-19)
+    expected = [
+        list(range(start, start + 4))
+        for pair in zip(range(0, 20, 4), range(20, 40, 4))
+        for start in pair
+    ]
+
+    assert get_batches() == expected
+    assert get_batches() == expected
+
+
+@pytest.mark.parametrize("transport", ["queue", "shared_memory"])
+def test_ordered_batches_back_pressure(transport) -> None:
+    if transport == "shared_memory" and sys.version_info < (3, 8):
+        pytest.skip("shared_memory requires Python 3.8")
+
+    batcher = MultiProcessBatcher(
+        _item_dataset(40),
+        batch_size=4,
+        stack_fn=_slow_first_half_stack_fn,
+        num_workers=2,
+        max_queue_size=4,
+        transport=transport,
+        ordered=True,
+    )
+
+    num_batches = 0
+    for _ in batcher:
+        num_batches += 1
+        # the fast worker 1 is held back instead of running ahead
+        assert max(map(len, batcher.pending)) <= 2
+
+    assert num_batches == 10
+
+
+@pytest.mark.parametrize("transport", ["queue", "shared_memory"])
+def test_worker_restart(transport) -> None:
+    if transport == "shared_memory" and sys.version_info < (3, 8):
+        pytest.skip("shared_memory requires Python 3.8")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stack_fn = partial(
+            _crash_once_stack_fn, marker=Path(tmpdir) / "crashed"
+        )
+
+        batches = list(
+            MultiProcessBatcher(
+                _item_dataset(40),
+                batch_size=2,
+                stack_fn=stack_fn,
+                num_workers=2,
+                transport=transport,
+                max_worker_restarts=1,
+            )
+        )
+        assert sorted(sum(batches, [])) == list(range(40))
+
+        (Path(tmpdir) / "crashed").unlink()
+
+        with pytest.raises(GluonTSDataError):
+            list(
+                MultiProcessBatcher(
+                    _item_dataset(40),
+                    batch_size=2,
+                    stack_fn=stack_fn,
+                    num_workers=2,
+                    transport=transport,
+                )
+            )
+
+
+def test_timeout() -> None:
+    batcher = MultiProcessBatcher(
+        _item_dataset(8),
+        batch_size=2,
+        stack_fn=_slow_stack_fn,
+        num_workers=1,
+        timeout=0.5,
+    )
+
+    with pytest.raises(GluonTSDataError):
+        next(batcher)
+
+
+@pytest.mark.parametrize("transport", ["queue", "shared_memory"])
+def test_persistent_workers(transport) -> None:
+    if transport == "shared_memory" and sys.version_info < (3, 8):
+        pytest.skip("shared_memory requires Python 3.8")
+
+    data_loader = DataLoader(
+        _item_dataset(40),
+        batch_size=4,
+        stack_fn=_stack_item_ids,
+        num_workers=2,
+        transport=transport,
+        persistent_workers=True,
+    )
+
+    batcher = iter(data_loader)
+    pids = [p.pid for p in batcher.processes]
+    assert sorted(sum(batcher, [])) == list(range(40))
+
+    # leave an epoch unfinished, the next one starts from scratch
+    next(iter(data_loader))
+
+    for _ in range(2):
+        assert sorted(sum(data_loader, [])) == list(range(40))
+
+    assert iter(data_loader) is batcher
+    assert [p.pid for p in batcher.processes] == pids
+    assert all(p.is_alive() for p in batcher.processes)
+
+    data_loader.close()
+    assert not any(p.is_alive() for p in batcher.processes)
+
+
 # This is just a general functionality test, whether the multiprocessing works in practice as expected
 def test_general_functionality() -> None:
     ds_info, train_ds, test_ds = constant_dataset()
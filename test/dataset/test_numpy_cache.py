@@ -0,0 +1,79 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from gluonts.dataset.common import ListDataset
+from gluonts.dataset.numpy_cache import NumpyCacheDataset, write_numpy_cache
+
+
+def make_dataset(num_series: int, multivariate: bool = False):
+    return ListDataset(
+        [
+            {
+                "start": "2020-01-01",
+                "target": np.random.normal(
+                    size=(2, 10 + i) if multivariate else 10 + i
+                ),
+                "feat_static_cat": [i, 2 * i],
+                "item_id": f"item_{i}",
+                # only some entries have dynamic features
+                **(
+                    {"feat_dynamic_real": np.random.normal(size=(3, 10 + i))}
+                    if i % 2
+                    else {}
+                ),
+            }
+            for i in range(num_series)
+        ],
+        freq="H",
+        one_dim_target=not multivariate,
+    )
+
+
+@pytest.mark.parametrize("multivariate", [False, True])
+def test_numpy_cache(multivariate: bool) -> None:
+    dataset = make_dataset(5, multivariate)
+
+    with tempfile.TemporaryDirectory() as path:
+        cache_path = Path(path) / "cache"
+        write_numpy_cache(dataset, cache_path)
+        cached = NumpyCacheDataset(
+            cache_path, freq="H", one_dim_target=not multivariate
+        )
+
+        assert len(cached) == len(dataset)
+        for row, (expected, entry) in enumerate(zip(dataset, cached)):
+            assert entry.keys() == expected.keys()
+            assert entry["start"] == expected["start"]
+            assert entry["item_id"] == expected["item_id"]
+            assert entry["source"].row == row
+            for name in ["target", "feat_static_cat", "feat_dynamic_real"]:
+                if name in expected:
+                    assert entry[name].dtype == expected[name].dtype
+                    np.testing.assert_equal(entry[name], expected[name])
+
+            # arrays are views into the memory-mapped blob
+            assert isinstance(entry["target"].base, np.memmap)
+            assert not entry["target"].flags.writeable
+
+        assert cached[-1]["item_id"] == "item_4"
+        with pytest.raises(IndexError):
+            cached[5]
+
+        # the cache is moved into place only once it is complete
+        assert [p.name for p in Path(path).iterdir()] == ["cache"]
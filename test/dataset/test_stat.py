@@ -11,18 +11,23 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import json
 import unittest
 from typing import cast
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from gluonts.core.exception import GluonTSDataError
-from gluonts.dataset.common import DataEntry, Dataset
+from gluonts.dataset.common import DataEntry, Dataset, FileDataset
 from gluonts.dataset.stat import (
     DatasetStatistics,
+    PartialDatasetStatistics,
     ScaleHistogram,
     calculate_dataset_statistics,
+    calculate_partial_statistics,
+    calculate_sharded_dataset_statistics,
 )
 
 
@@ -358,3 +363,99 @@ class DatasetStatisticsExceptions(unittest.TestCase):
                 ],
             )
         )
+
+
+def make_random_dataset(num_series: int) -> list:
+    dataset = []
+    for i in range(num_series):
+        target = np.random.normal(size=np.random.randint(0, 30))
+        target[np.random.rand(len(target)) < 0.1] = np.nan
+        dataset.append(
+            make_time_series(
+                target=target,
+                feat_static_cat=[i % 3, i % 5],
+                feat_static_real=[float(i % 2), 0.5],
+                num_feat_dynamic_cat=0,
+                num_feat_dynamic_real=0,
+                num_past_feat_dynamic_real=0,
+            )
+        )
+    return dataset
+
+
+def test_scale_histogram_merge() -> None:
+    targets = [np.full(5, 10.0 ** (i % 4)) for i in range(20)] + [[]]
+    left, right, expected = (
+        ScaleHistogram(),
+        ScaleHistogram(),
+        ScaleHistogram(),
+    )
+    for i, target in enumerate(targets):
+        expected.add(target)
+        (left if i % 3 else right).add(target)
+
+    assert left.merge(right) == expected
+    assert right.merge(left) == expected
+    assert len(left.merge(ScaleHistogram())) == len(left)
+
+
+def test_merge_partial_statistics() -> None:
+    dataset = make_random_dataset(30)
+    expected = calculate_dataset_statistics(dataset)
+
+    partials = [
+        calculate_partial_statistics(dataset[:10]),
+        calculate_partial_statistics(dataset[10:25]),
+        calculate_partial_statistics(dataset[25:]),
+    ]
+    assert partials[0].merge(partials[1]).merge(partials[2]).finalize() == (
+        expected
+    )
+    assert partials[0].merge(partials[1].merge(partials[2])).finalize() == (
+        expected
+    )
+    assert (
+        PartialDatasetStatistics().merge(partials[0]).finalize()
+        == partials[0].finalize()
+    )
+
+    shards = [dataset[:7], dataset[7:20], dataset[20:]]
+    for num_workers in [0, 2]:
+        assert (
+            calculate_sharded_dataset_statistics(shards, num_workers)
+            == expected
+        )
+
+
+def test_merge_partial_statistics_errors() -> None:
+    with_feature = calculate_partial_statistics(
+        [make_time_series(num_feat_dynamic_real=1)]
+    )
+    without_feature = calculate_partial_statistics(
+        [make_time_series(num_feat_dynamic_real=0)]
+    )
+
+    with pytest.raises(GluonTSDataError):
+        with_feature.merge(without_feature)
+    with pytest.raises(GluonTSDataError):
+        without_feature.merge(with_feature)
+
+
+def test_sharded_file_dataset_statistics(tmp_path) -> None:
+    for name, first in [("a.json", 0), ("b.json", 20)]:
+        with open(tmp_path / name, "w") as fp:
+            for i in range(first, first + 20):
+                entry = {
+                    "start": "2020-01-01",
+                    "target": list(np.arange(i + 1.0)),
+                    "feat_static_cat": [i],
+                }
+                print(json.dumps(entry), file=fp)
+
+    dataset = FileDataset(tmp_path, freq="D")
+    shards = [FileDataset(path, freq="D") for path in dataset.files()]
+    assert len(shards) == 2
+
+    assert calculate_sharded_dataset_statistics(
+        shards, num_workers=2
+    ) == calculate_dataset_statistics(dataset)
@@ -15,8 +15,17 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from gluonts.evaluation import Evaluator, MultivariateEvaluator
-from gluonts.model.forecast import QuantileForecast, SampleForecast
+from gluonts.evaluation import (
+    ArrayTimeSeries,
+    Evaluator,
+    MetricsAccumulator,
+    MultivariateEvaluator,
+)
+from gluonts.model.forecast import (
+    ForecastBatch,
+    QuantileForecast,
+    SampleForecast,
+)
 
 QUANTILES = [str(q / 10.0) for q in range(1, 10)]
 
@@ -520,6 +529,95 @@ def test_metrics_mp(timeseries, res, has_nans, input_type):
             )
 
 
+@pytest.mark.parametrize(
+    "timeseries, res, has_nans, input_type",
+    zip(TIMESERIES, RES, HAS_NANS, INPUT_TYPE),
+)
+def test_metrics_vectorized(timeseries, res, has_nans, input_type):
+    ts_datastructure = pd.Series
+    evaluator = Evaluator(quantiles=QUANTILES, vectorized=True, chunk_size=2)
+    agg_metrics, item_metrics = calculate_metrics(
+        timeseries,
+        evaluator,
+        ts_datastructure,
+        has_nans=has_nans,
+        input_type=input_type,
+    )
+
+    for metric, score in agg_metrics.items():
+        if metric in res.keys():
+            assert np.isclose(score, res[metric], equal_nan=True), (
+                "Scores for the metric {} do not match: \nexpected: {} "
+                "\nobtained: {}".format(metric, res[metric], score)
+            )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("use_forecast_batch", [False, True])
+def test_vectorized_matches_per_ts(dtype, use_forecast_batch):
+    np.random.seed(0)
+    prediction_length = 5
+    num_series = 11
+
+    time_series = []
+    forecasts = []
+    for i in range(num_series):
+        length = 30 if use_forecast_batch else 20 + i
+        target = np.random.normal(size=length).astype(dtype)
+        if i % 3 == 0:
+            target[-2] = np.nan
+        if i == 4:
+            target[-prediction_length:] = np.nan
+        index = pd.date_range("2020-01-01", periods=length, freq="H")
+        time_series.append(pd.DataFrame(target, index=index))
+        forecasts.append(
+            SampleForecast(
+                samples=np.random.normal(size=(50, prediction_length)).astype(
+                    dtype
+                ),
+                start_date=index[-prediction_length],
+                freq="H",
+                item_id=str(i),
+            )
+        )
+
+    if use_forecast_batch:
+        batch = ForecastBatch(
+            samples=np.stack([forecast.samples for forecast in forecasts[:7]]),
+            start_dates=[forecast.start_date for forecast in forecasts[:7]],
+            freq="H",
+            item_ids=[forecast.item_id for forecast in forecasts[:7]],
+        )
+        vectorized_forecasts = [batch] + forecasts[7:]
+    else:
+        vectorized_forecasts = forecasts
+
+    kwargs = dict(
+        quantiles=QUANTILES,
+        custom_eval_fn={"rmsle": [rmsle, "mean", "median"]},
+        num_workers=None,
+    )
+    agg_metrics, item_metrics = Evaluator(**kwargs)(
+        iter(time_series), iter(forecasts)
+    )
+    agg_metrics_vec, item_metrics_vec = Evaluator(
+        vectorized=True, chunk_size=4, **kwargs
+    )(iter(time_series), iter(vectorized_forecasts))
+
+    assert list(item_metrics.columns) == list(item_metrics_vec.columns)
+    assert (item_metrics["item_id"] == item_metrics_vec["item_id"]).all()
+    for column in item_metrics.columns.drop("item_id"):
+        assert np.allclose(
+            item_metrics[column].astype(float),
+            item_metrics_vec[column].astype(float),
+            equal_nan=True,
+        ), column
+    for metric, score in agg_metrics.items():
+        assert np.isclose(
+            score, agg_metrics_vec[metric], equal_nan=True
+        ), metric
+
+
 TIMESERIES_MULTIVARIATE = [
     np.ones((5, 10, 2), dtype=np.float64),
     np.ones((5, 10, 2), dtype=np.float64),
@@ -1133,3 +1231,156 @@ def test_metrics_multivariate_custom_eval_fn(
                 "Scores for the metric {} do not match: \nexpected: {} "
                 "\nobtained: {}".format(metric, res[metric], score)
             )
+
+
+def _random_evaluation_data(num_series, prediction_length=5):
+    np.random.seed(0)
+    time_series = []
+    forecasts = []
+    for i in range(num_series):
+        target = np.random.normal(size=20 + i % 4)
+        if i % 5 == 0:
+            target[-1] = np.nan
+        index = pd.date_range("2020-01-01", periods=len(target), freq="H")
+        time_series.append(pd.DataFrame(target, index=index))
+        forecasts.append(
+            SampleForecast(
+                samples=np.random.normal(size=(50, prediction_length)),
+                start_date=index[-prediction_length],
+                freq="H",
+                item_id=str(i),
+            )
+        )
+    return time_series, forecasts
+
+
+@pytest.mark.parametrize(
+    "evaluator_kwargs",
+    [
+        dict(num_workers=None),
+        dict(num_workers=2),
+        dict(vectorized=True),
+    ],
+)
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_evaluate_streaming(tmp_path, evaluator_kwargs, suffix):
+    time_series, forecasts = _random_evaluation_data(23)
+    evaluator = Evaluator(
+        quantiles=QUANTILES,
+        custom_eval_fn={"rmsle": [rmsle, "median", "median"]},
+        chunk_size=4,
+        **evaluator_kwargs,
+    )
+
+    agg_metrics, item_metrics = evaluator(
+        iter(time_series), iter(forecasts), num_series=len(forecasts)
+    )
+
+    path = tmp_path / f"item_metrics{suffix}"
+    agg_metrics_streaming = evaluator.evaluate_streaming(
+        iter(time_series),
+        iter(forecasts),
+        num_series=len(forecasts),
+        item_metrics_path=path,
+    )
+
+    assert agg_metrics.keys() == agg_metrics_streaming.keys()
+    for metric, score in agg_metrics.items():
+        assert np.isclose(
+            score, agg_metrics_streaming[metric], equal_nan=True
+        ), metric
+
+    if suffix == ".csv":
+        written = pd.read_csv(path, dtype={"item_id": str})
+    else:
+        written = pd.read_parquet(path)
+    assert list(written.columns) == list(item_metrics.columns)
+    assert (written["item_id"] == item_metrics["item_id"].astype(str)).all()
+    for column in item_metrics.columns.drop("item_id"):
+        assert np.allclose(
+            written[column], item_metrics[column], equal_nan=True
+        ), column
+
+
+def test_metrics_accumulator():
+    time_series, forecasts = _random_evaluation_data(10)
+    evaluator = Evaluator(quantiles=QUANTILES, num_workers=None, chunk_size=3)
+
+    accumulator = MetricsAccumulator(evaluator)
+    for chunk in evaluator.iter_metrics_per_ts(
+        iter(time_series), iter(forecasts)
+    ):
+        accumulator.add(chunk)
+
+        # intermediate results match evaluating the series seen so far
+        num_series = accumulator.num_series
+        agg_metrics, _ = evaluator(
+            iter(time_series[:num_series]), iter(forecasts[:num_series])
+        )
+        intermediate = accumulator.get_aggregate_metrics()
+        for metric, score in agg_metrics.items():
+            assert np.isclose(
+                score, intermediate[metric], equal_nan=True
+            ), metric
+
+    assert accumulator.num_series == len(forecasts)
+
+
+@pytest.mark.parametrize("freq", ["H", "5min", "W", "M", "2D", "B"])
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_array_time_series(freq, vectorized):
+    np.random.seed(0)
+    prediction_length = 4
+
+    time_series = []
+    array_time_series = []
+    forecasts = []
+    for i in range(8):
+        length = 20 + i
+        target = np.random.normal(size=length)
+        index = pd.date_range("2020-01-01", periods=length, freq=freq)
+        time_series.append(pd.Series(target, index=index))
+        array_time_series.append(ArrayTimeSeries(index[0], target))
+        # forecasts do not necessarily cover the end of the target
+        forecasts.append(
+            SampleForecast(
+                samples=np.random.normal(size=(20, prediction_length)),
+                start_date=index[-prediction_length - i % 3],
+                freq=freq,
+            )
+        )
+
+    evaluator = Evaluator(
+        quantiles=QUANTILES, num_workers=None, vectorized=vectorized
+    )
+    agg_metrics, _ = evaluator(iter(time_series), iter(forecasts))
+    agg_metrics_arrays, _ = evaluator(iter(array_time_series), iter(forecasts))
+
+    for metric, score in agg_metrics.items():
+        assert np.isclose(
+            score, agg_metrics_arrays[metric], equal_nan=True
+        ), metric
+
+
+def test_array_time_series_outside_target():
+    target = np.arange(10.0)
+    forecast = SampleForecast(
+        samples=np.ones((5, 3)),
+        start_date=pd.Timestamp("2020-01-01 08:00", freq="H"),
+        freq="H",
+    )
+
+    with pytest.raises(AssertionError):
+        Evaluator.extract_pred_target(
+            ArrayTimeSeries(pd.Timestamp("2020-01-01", freq="H"), target),
+            forecast,
+        )
+
+    assert np.array_equal(
+        Evaluator.extract_pred_target(("2020-01-01 02:00", target), forecast),
+        [6.0, 7.0, 8.0],
+    )
+    assert np.array_equal(
+        Evaluator.extract_past_data(("2020-01-01 02:00", target), forecast),
+        np.arange(6.0),
+    )
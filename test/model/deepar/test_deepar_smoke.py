@@ -114,3 +114,30 @@ def test_deepar_smoke(estimator, datasets, dtype):
     forecasts = list(predictor.predict(dataset_test))
     assert all([forecast.samples.dtype == dtype for forecast in forecasts])
     assert len(forecasts) == len(dataset_test)
+
+
+def test_deepar_sample_from_state():
+    dataset_train, dataset_test = make_dummy_datasets_with_features()
+    estimator = DeepAREstimator(
+        **common_estimator_hps, num_parallel_samples=40
+    )
+    predictor = estimator.train(dataset_train)
+
+    net = predictor.prediction_net
+    encode = net.encode
+    num_encodings = []
+
+    def counting_encode(*args):
+        num_encodings.append(1)
+        return encode(*args)
+
+    net.encode = counting_encode
+
+    num_series = len(list(dataset_test))
+    forecasts = list(predictor.predict(dataset_test, num_samples=100))
+
+    assert len(forecasts) == num_series
+    assert len(num_encodings) == -(-num_series // predictor.batch_size)
+    for forecast in forecasts:
+        assert forecast.samples.shape == (100, 3)
+        assert np.all(np.isfinite(forecast.samples))
@@ -0,0 +1,164 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import mxnet as mx
+import numpy as np
+import pytest
+
+from gluonts.model.deepar._network import DeepARPredictionNetwork, prod
+from gluonts.mx.distribution import StudentTOutput
+from gluonts.mx.util import copy_parameters
+
+batch_size = 3
+history_length = 20
+prediction_length = 8
+num_time_features = 2
+num_samples = 5
+
+
+class ConcatDeepARPredictionNetwork(DeepARPredictionNetwork):
+    """
+    The previous implementation of the sampling loop, which concatenates
+    every sample onto the whole target history, for comparison.
+    """
+
+    def sampling_decoder(
+        self,
+        F,
+        static_feat,
+        past_target,
+        time_feat,
+        scale,
+        begin_states,
+        num_samples=None,
+    ):
+        if num_samples is None:
+            num_samples = self.num_parallel_samples
+
+        repeated_past_target = past_target.repeat(repeats=num_samples, axis=0)
+        repeated_time_feat = time_feat.repeat(repeats=num_samples, axis=0)
+        repeated_static_feat = static_feat.repeat(
+            repeats=num_samples, axis=0
+        ).expand_dims(axis=1)
+        repeated_scale = scale.repeat(repeats=num_samples, axis=0)
+        repeated_states = [
+            s.repeat(repeats=num_samples, axis=0) for s in begin_states
+        ]
+
+        future_samples = []
+        for k in range(self.prediction_length):
+            lags = self.get_lagged_subsequences(
+                F=F,
+                sequence=repeated_past_target,
+                sequence_length=self.history_length + k,
+                indices=self.shifted_lags,
+                subsequences_length=1,
+            )
+            lags_scaled = F.broadcast_div(
+                lags, repeated_scale.expand_dims(axis=-1)
+            )
+            input_lags = F.reshape(
+                data=lags_scaled,
+                shape=(-1, 1, prod(self.target_shape) * len(self.lags_seq)),
+            )
+            decoder_input = F.concat(
+                input_lags,
+                repeated_time_feat.slice_axis(axis=1, begin=k, end=k + 1),
+                repeated_static_feat,
+                dim=-1,
+            )
+            rnn_outputs, repeated_states = self.rnn.unroll(
+                inputs=decoder_input,
+                length=1,
+                begin_state=repeated_states,
+                layout="NTC",
+                merge_outputs=True,
+            )
+            distr = self.distr_output.distribution(
+                self.proj_distr_args(rnn_outputs), scale=repeated_scale
+            )
+            new_samples = distr.sample(dtype=self.dtype)
+            repeated_past_target = F.concat(
+                repeated_past_target, new_samples, dim=1
+            )
+            future_samples.append(new_samples)
+
+        samples = F.concat(*future_samples, dim=1)
+        return samples.reshape(
+            shape=(
+                (-1, num_samples)
+                + (self.prediction_length,)
+                + self.target_shape
+            )
+        )
+
+
+def make_network(cls):
+    network = cls(
+        num_parallel_samples=num_samples,
+        num_layers=2,
+        num_cells=4,
+        cell_type="lstm",
+        history_length=history_length,
+        context_length=history_length - 12,
+        prediction_length=prediction_length,
+        distr_output=StudentTOutput(),
+        dropout_rate=0.0,
+        cardinality=[1],
+        embedding_dimension=[2],
+        lags_seq=[1, 2, 7, 12],
+    )
+    network.initialize()
+    return network
+
+
+def make_inputs():
+    return [
+        mx.nd.zeros((batch_size, 1)),
+        mx.nd.ones((batch_size, 1)),
+        mx.nd.random.normal(
+            shape=(batch_size, history_length, num_time_features)
+        ),
+        mx.nd.random.uniform(shape=(batch_size, history_length)),
+        mx.nd.ones((batch_size, history_length)),
+        mx.nd.random.normal(
+            shape=(batch_size, prediction_length, num_time_features)
+        ),
+    ]
+
+
+@pytest.mark.parametrize("hybridize", [False, True])
+def test_window_matches_concat_sampling(hybridize):
+    mx.random.seed(0)
+    inputs = make_inputs()
+
+    window = make_network(DeepARPredictionNetwork)
+    concat = make_network(ConcatDeepARPredictionNetwork)
+    # initializes the parameters with deferred initialization
+    window(*inputs)
+    copy_parameters(window, concat)
+    if hybridize:
+        window.hybridize()
+        concat.hybridize()
+
+    mx.random.seed(42)
+    window_samples = window(*inputs).asnumpy()
+    mx.random.seed(42)
+    concat_samples = concat(*inputs).asnumpy()
+
+    assert window_samples.shape == (
+        batch_size,
+        num_samples,
+        prediction_length,
+    )
+    assert np.array_equal(window_samples, concat_samples)
@@ -11,6 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import numpy as np
 import pytest
 
 from gluonts.dataset.artificial import constant_dataset
@@ -125,3 +126,45 @@ def test_deepvar(
     )
 
     assert agg_metrics["ND"] < 1.5
+
+
+@pytest.mark.parametrize("hybridize", [True, False])
+def test_deepvar_sample_from_state(hybridize):
+    estimator = DeepVAREstimator(
+        num_cells=20,
+        num_layers=1,
+        pick_incomplete=True,
+        target_dim=target_dim,
+        prediction_length=metadata.prediction_length,
+        freq=metadata.freq,
+        num_parallel_samples=40,
+        use_marginal_transformation=True,
+        trainer=Trainer(
+            epochs=1,
+            batch_size=8,
+            num_batches_per_epoch=2,
+            hybridize=hybridize,
+        ),
+    )
+    predictor = estimator.train(training_data=dataset.train)
+
+    net = predictor.prediction_net
+    encode = net.encode
+    num_encodings = []
+
+    def counting_encode(*args):
+        num_encodings.append(1)
+        return encode(*args)
+
+    net.encode = counting_encode
+
+    forecasts = list(predictor.predict(dataset.test, num_samples=100))
+
+    assert len(num_encodings) == 1
+    for forecast in forecasts:
+        assert forecast.samples.shape == (
+            100,
+            metadata.prediction_length,
+            target_dim,
+        )
+        assert np.all(np.isfinite(forecast.samples))
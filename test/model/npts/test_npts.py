@@ -20,6 +20,7 @@ import pytest
 from gluonts.core.exception import GluonTSDataError
 from gluonts.dataset.common import DataEntry, Dataset, ListDataset
 from gluonts.model.npts import KernelType, NPTSPredictor
+from gluonts.model.npts._model import NPTS
 from gluonts.model.npts._weighted_sampler import WeightedSampler
 
 
@@ -658,3 +659,109 @@ def test_weighted_sampler(frac_zero_weights: float) -> None:
         assert all(
             probs_ix[zeros_ix] == 0.0
         ), "Indices with sampling weight zero are sampled!"
+
+
+@pytest.mark.parametrize(
+    "kernel, do_exp",
+    [
+        (NPTS.log_distance_kernel(1.0), True),
+        (NPTS.log_weighted_distance_kernel([1.0, 10.0]), True),
+        (NPTS.uniform_kernel(), False),
+    ],
+)
+@pytest.mark.parametrize("frac_nans", [0.0, 0.3, 1.0])
+def test_compute_weight_matrix(kernel, do_exp: bool, frac_nans: float) -> None:
+    train_length, prediction_length = 50, 10
+    train_features = np.random.randint(3, size=(2, train_length))
+    pred_features = np.random.randint(3, size=(2, prediction_length))
+    target_isnan_positions = np.argwhere(
+        np.random.random(train_length) < frac_nans
+    )
+
+    weight_matrix = NPTS.compute_weight_matrix(
+        train_features, pred_features, target_isnan_positions, kernel, do_exp
+    )
+    assert weight_matrix.shape == (
+        prediction_length,
+        train_length + prediction_length,
+    )
+
+    for t, weights in enumerate(
+        NPTS.compute_weights(
+            train_features,
+            pred_features,
+            target_isnan_positions,
+            kernel,
+            do_exp,
+        )
+    ):
+        np.testing.assert_allclose(weight_matrix[t, : len(weights)], weights)
+        assert (weight_matrix[t, len(weights) :] == 0.0).all()
+
+
+@pytest.mark.parametrize("frac_zero_weights", [0.0, 0.25, 0.99, 1.0])
+def test_weighted_sampler_batched(frac_zero_weights: float) -> None:
+    num_rows, num_weights = 3, 100
+    weights = np.random.random((num_rows, num_weights))
+    weights[np.random.random(weights.shape) < frac_zero_weights] = 0.0
+    if frac_zero_weights == 1.0:
+        weights[:] = 0.0
+
+    num_samples = 100_000
+    samples_ix = WeightedSampler.sample_batched(weights, num_samples)
+    assert samples_ix.shape == (num_samples, num_rows)
+
+    for row in range(num_rows):
+        counts_ix = np.bincount(samples_ix[:, row], minlength=num_weights)
+        probs_ix = counts_ix / num_samples
+
+        true_prob_ix = (
+            weights[row] / weights[row].sum()
+            if weights[row].sum() > 0.0
+            else np.ones(num_weights) / num_weights
+        )
+
+        np.testing.assert_almost_equal(
+            probs_ix,
+            true_prob_ix,
+            2,
+            "Empirical distribution does not match sampling distribution",
+        )
+
+        if weights[row].sum() > 0.0:
+            assert all(
+                probs_ix[weights[row] == 0.0] == 0.0
+            ), "Indices with sampling weight zero are sampled!"
+
+
+def test_npts_batches() -> None:
+    """
+    Forecasts must not depend on the other time series in the same batch.
+    """
+    freq = "H"
+    dataset = ListDataset(
+        [
+            {
+                "start": "2020-01-01",
+                "target": np.arange(length, dtype=float),
+                "item_id": str(length),
+            }
+            for length in [20, 50, 30]
+        ],
+        freq=freq,
+    )
+    predictor = NPTSPredictor(
+        freq=freq,
+        prediction_length=5,
+        kernel_type=KernelType.uniform,
+        use_seasonal_model=False,
+        batch_size=2,
+    )
+
+    forecasts = list(predictor.predict(dataset, num_samples=500))
+
+    assert [forecast.item_id for forecast in forecasts] == ["20", "50", "30"]
+    for forecast, data in zip(forecasts, dataset):
+        assert forecast.samples.shape == (500, 5)
+        # the uniform kernel samples only past values of the series itself
+        assert set(np.unique(forecast.samples)) <= set(data["target"])
@@ -15,20 +15,27 @@ import logging
 import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 import gluonts
 from gluonts.core.component import equals
 from gluonts.core.serde import dump_code, load_code
 from gluonts.dataset.artificial import constant_dataset
+from gluonts.dataset.common import ListDataset
 from gluonts.dataset.stat import ScaleHistogram  # noqa
 from gluonts.dataset.stat import (
     DatasetStatistics,
     calculate_dataset_statistics,
 )
-from gluonts.evaluation import backtest_metrics, Evaluator
+from gluonts.evaluation import (
+    backtest_metrics,
+    Evaluator,
+    make_evaluation_arrays,
+    make_evaluation_predictions,
+)
 from gluonts.evaluation.backtest import BacktestInformation
-from gluonts.model.trivial.mean import MeanEstimator
+from gluonts.model.trivial.mean import MeanEstimator, MeanPredictor
 
 root = logging.getLogger()
 root.setLevel(logging.DEBUG)
@@ -70,6 +77,53 @@ def test_forecast_parser():
     assert agg_metrics == load_code(dump_code(agg_metrics))
 
 
+class CountingDataset:
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.num_passes = 0
+
+    def __iter__(self):
+        self.num_passes += 1
+        yield from self.dataset
+
+    def __len__(self):
+        return len(self.dataset)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_make_evaluation_arrays(vectorized):
+    np.random.seed(0)
+    dataset = ListDataset(
+        [
+            {"start": "2020-01-01", "target": np.random.normal(size=30 + i)}
+            for i in range(10)
+        ],
+        freq="H",
+    )
+    predictor = MeanPredictor(prediction_length=5, freq="H", num_samples=5)
+    evaluator = Evaluator(
+        quantiles=[0.1, 0.5, 0.9], num_workers=None, vectorized=vectorized
+    )
+
+    np.random.seed(1)
+    forecast_it, ts_it = make_evaluation_predictions(dataset, predictor)
+    agg_metrics, item_metrics = evaluator(ts_it, forecast_it)
+
+    np.random.seed(1)
+    counting_dataset = CountingDataset(dataset)
+    forecast_it, target_it = make_evaluation_arrays(
+        counting_dataset, predictor
+    )
+    agg_metrics_arrays, item_metrics_arrays = evaluator(target_it, forecast_it)
+
+    assert counting_dataset.num_passes == 1
+    assert len(item_metrics_arrays) == len(dataset)
+    for metric, score in agg_metrics.items():
+        assert np.isclose(
+            score, agg_metrics_arrays[metric], equal_nan=True
+        ), metric
+
+
 @pytest.mark.skip()
 def test_benchmark(caplog):
     # makes sure that information logged can be reconstructed from previous
@@ -17,7 +17,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from gluonts.core import serde
 from gluonts.model.forecast import (
+    ForecastBatch,
     QuantileForecast,
     SampleForecast,
 )
@@ -129,3 +131,108 @@ def test_DistributionForecast():
 def test_forecast_multivariate(forecast, exp_index):
     assert forecast.prediction_length == len(exp_index)
     assert np.all(forecast.index == exp_index)
+
+
+def test_sample_forecast_from_arrays():
+    samples = np.random.normal(size=(100, 24))
+    start_date = pd.Timestamp("2020-01-01", freq="H")
+
+    forecast = SampleForecast(
+        samples=samples, start_date=start_date, freq="H", item_id="1"
+    )
+    fast_forecast = SampleForecast.from_arrays(
+        samples, start_date=start_date, freq="H", item_id=1
+    )
+
+    assert fast_forecast.__init_args__ == forecast.__init_args__
+    assert (fast_forecast.index == forecast.index).all()
+    np.testing.assert_equal(
+        fast_forecast.quantile(0.3), forecast.quantile(0.3)
+    )
+
+    decoded = serde.decode(serde.encode(fast_forecast))
+    assert isinstance(decoded, SampleForecast)
+    assert decoded.item_id == "1"
+    np.testing.assert_equal(decoded.samples, samples)
+
+
+def test_quantile_forecast_from_arrays():
+    forecast_keys = ["0.1", "0.5", "mean"]
+    forecast_arrays = np.random.normal(size=(3, 24))
+    start_date = pd.Timestamp("2020-01-01", freq="H")
+
+    forecast = QuantileForecast(
+        forecast_arrays,
+        start_date=start_date,
+        freq="H",
+        forecast_keys=forecast_keys,
+    )
+    fast_forecast = QuantileForecast.from_arrays(
+        forecast_arrays,
+        start_date=start_date,
+        freq="H",
+        forecast_keys=QuantileForecast.normalize_keys(forecast_keys),
+    )
+
+    assert fast_forecast.forecast_keys == forecast.forecast_keys
+    assert (fast_forecast.index == forecast.index).all()
+    for key in forecast_keys:
+        np.testing.assert_equal(
+            fast_forecast.quantile(key)
+            if key != "mean"
+            else fast_forecast.mean,
+            forecast.quantile(key) if key != "mean" else forecast.mean,
+        )
+
+
+@pytest.mark.parametrize("target_dim", [None, 2])
+def test_forecast_batch(target_dim):
+    batch_size, num_samples, prediction_length = 4, 50, 6
+    shape = (batch_size, num_samples, prediction_length)
+    samples = np.random.normal(
+        size=shape if target_dim is None else shape + (target_dim,)
+    )
+    start_dates = list(
+        pd.date_range("2020-01-01", periods=batch_size, freq="H")
+    )
+    item_ids = [str(i) for i in range(batch_size)]
+
+    forecast_batch = ForecastBatch(
+        samples, start_dates=start_dates, freq="H", item_ids=item_ids
+    )
+    forecasts = [
+        SampleForecast(
+            samples=samples[i],
+            start_date=start_dates[i],
+            freq="H",
+            item_id=item_ids[i],
+        )
+        for i in range(batch_size)
+    ]
+
+    assert len(forecast_batch) == batch_size
+    for i, forecast in enumerate(forecast_batch):
+        assert forecast.item_id == item_ids[i]
+        assert (forecast.index == forecasts[i].index).all()
+        np.testing.assert_equal(forecast.samples, samples[i])
+
+    for q in [0.1, "0.5", "p90"]:
+        np.testing.assert_equal(
+            forecast_batch.quantile(q),
+            np.stack([forecast.quantile(q) for forecast in forecasts]),
+        )
+    np.testing.assert_allclose(
+        forecast_batch.mean,
+        np.stack([forecast.mean for forecast in forecasts]),
+    )
+
+    quantiles = [0.1, 0.5, 0.9]
+    for quantile_forecast, forecast in zip(
+        forecast_batch.to_quantile_forecast(quantiles), forecasts
+    ):
+        expected = forecast.to_quantile_forecast(quantiles)
+        assert quantile_forecast.forecast_keys == expected.forecast_keys
+        assert quantile_forecast.item_id == expected.item_id
+        np.testing.assert_equal(
+            quantile_forecast.forecast_array, expected.forecast_array
+        )
@@ -11,13 +11,16 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import mxnet as mx
 import numpy as np
 
 from gluonts.dataset.common import ListDataset
 from gluonts.evaluation import backtest_metrics
+from gluonts.model.deepar import DeepAREstimator
 from gluonts.model.predictor import Localizer, ParallelizedPredictor
 from gluonts.model.trivial.identity import IdentityPredictor
 from gluonts.model.trivial.mean import MeanEstimator
+from gluonts.mx.trainer import Trainer
 
 
 def test_parallelized_predictor():
@@ -66,3 +69,37 @@ def test_localizer():
     agg_metrics, _ = backtest_metrics(
         test_dataset=dataset, predictor=local_pred
     )
+
+
+def test_predict_batches():
+    dataset = ListDataset(
+        data_iter=[
+            {"start": "2012-01-01", "target": np.random.normal(size=50)}
+            for _ in range(10)
+        ],
+        freq="1H",
+    )
+
+    predictor = DeepAREstimator(
+        freq="1H",
+        prediction_length=5,
+        batch_size=4,
+        num_parallel_samples=20,
+        trainer=Trainer(epochs=1, num_batches_per_epoch=1),
+    ).train(dataset)
+
+    mx.random.seed(0)
+    forecasts = list(predictor.predict(dataset))
+    mx.random.seed(0)
+    forecast_batches = list(predictor.predict_batches(dataset))
+
+    assert [len(batch) for batch in forecast_batches] == [4, 4, 2]
+    assert forecast_batches[0].samples.shape == (4, 20, 5)
+
+    batched_forecasts = [
+        forecast for batch in forecast_batches for forecast in batch
+    ]
+    assert len(batched_forecasts) == len(forecasts)
+    for forecast, batched_forecast in zip(forecasts, batched_forecasts):
+        assert forecast.start_date == batched_forecast.start_date
+        np.testing.assert_equal(forecast.samples, batched_forecast.samples)
@@ -11,9 +11,13 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import mxnet as mx
+import numpy as np
 import pytest
 
 from gluonts.model.transformer import TransformerEstimator
+from gluonts.model.transformer._network import TransformerNetwork
+from gluonts.model.transformer.layers import MultiHeadSelfAttention
 
 
 @pytest.fixture()
@@ -45,3 +49,32 @@ def test_repr(repr_test, hyperparameters):
 
 def test_serialize(serialize_test, hyperparameters):
     serialize_test(TransformerEstimator, hyperparameters)
+
+
+def test_self_attention_decode_step():
+    attention = MultiHeadSelfAttention(att_dim_in=8, heads=2, att_dim_out=8)
+    attention.initialize()
+
+    length = 5
+    inputs = mx.nd.random.normal(shape=(3, length, 8))
+    mask = TransformerNetwork.upper_triangular_mask(mx.nd, length)
+
+    expected, _ = attention(inputs, mask)
+
+    cache_keys = cache_values = None
+    outputs = []
+    for k in range(length):
+        output, cache_keys, cache_values = attention.decode_step(
+            mx.nd,
+            inputs.slice_axis(axis=1, begin=k, end=k + 1),
+            cache_keys,
+            cache_values,
+        )
+        assert cache_keys.shape == (3 * 2, k + 1, 4)
+        outputs.append(output)
+
+    np.testing.assert_allclose(
+        mx.nd.concat(*outputs, dim=1).asnumpy(),
+        expected.asnumpy(),
+        atol=1e-5,
+    )
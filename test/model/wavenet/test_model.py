@@ -13,9 +13,12 @@
 
 import sys
 
+import mxnet as mx
+import numpy as np
 import pytest
 
 from gluonts.model.wavenet import WaveNetEstimator
+from gluonts.model.wavenet._network import WaveNetSampler
 
 
 @pytest.fixture()
@@ -48,3 +51,73 @@ def test_repr(repr_test, hyperparameters):
 
 def test_serialize(serialize_test, hyperparameters):
     serialize_test(WaveNetEstimator, hyperparameters)
+
+
+@pytest.mark.parametrize("hybridize", [True, False])
+@pytest.mark.parametrize("pred_length", [1, 5])
+def test_sampler_matches_full_forward(hybridize, pred_length):
+    num_bins = 16
+    network = WaveNetSampler(
+        bin_values=list(range(num_bins)),
+        num_samples=2,
+        temperature=0.0,
+        n_residue=4,
+        n_skip=3,
+        dilation_depth=3,
+        n_stacks=2,
+        act_type="elu",
+        cardinality=[1],
+        embedding_dimension=2,
+        pred_length=pred_length,
+    )
+    network.initialize()
+
+    batch_size = 3
+    receptive_field = network.receptive_field
+    feat_static_cat = mx.nd.zeros((batch_size, 1))
+    past_target = mx.nd.random.randint(
+        0, num_bins, shape=(batch_size, receptive_field)
+    ).astype("float32")
+    past_observed_values = mx.nd.ones((batch_size, receptive_field))
+    past_time_feat = mx.nd.random.normal(
+        shape=(batch_size, 2, receptive_field)
+    )
+    future_time_feat = mx.nd.random.normal(shape=(batch_size, 2, pred_length))
+    scale = mx.nd.ones((batch_size, 1))
+
+    if hybridize:
+        network.hybridize()
+
+    # (batch_size, num_samples, pred_length)
+    samples = network(
+        feat_static_cat,
+        past_target,
+        past_observed_values,
+        past_time_feat,
+        future_time_feat,
+        scale,
+    )
+    samples = samples.slice_axis(axis=1, begin=0, end=1).squeeze(axis=1)
+
+    # with a temperature of 0, each sample is the most likely value given
+    # the previous ones, which is what a forward pass over all of them gives
+    full_features = network.get_full_features(
+        mx.nd,
+        feat_static_cat=feat_static_cat,
+        past_observed_values=past_observed_values,
+        past_time_feat=past_time_feat,
+        future_time_feat=future_time_feat,
+        future_observed_values=None,
+        scale=scale,
+    )
+    full_target = mx.nd.concat(past_target, samples, dim=-1)
+    embedding = network.target_feature_embedding(
+        mx.nd,
+        full_target.slice_axis(axis=-1, begin=0, end=-1),
+        full_features.slice_axis(axis=-1, begin=1, end=None),
+    )
+    unnormalized_output, _ = network.base_net(mx.nd, embedding)
+
+    np.testing.assert_array_equal(
+        unnormalized_output.argmax(axis=-1).asnumpy(), samples.asnumpy()
+    )
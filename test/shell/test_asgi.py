@@ -0,0 +1,133 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import asyncio
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from gluonts.model.forecast import Config as ForecastConfig
+from gluonts.model.trivial.mean import MeanPredictor
+
+try:
+    from gluonts.shell.serve import Settings
+    from gluonts.shell.serve.asgi import make_async_app
+except ImportError:
+    if sys.platform != "win32":
+        raise
+
+    pytestmark = pytest.mark.skip
+
+
+prediction_length = 3
+
+execution_params = {
+    "MaxConcurrentTransforms": 1,
+    "BatchStrategy": "SINGLE_RECORD",
+    "MaxPayloadInMB": 6,
+}
+
+instances = [
+    {"start": "2020-01-01", "target": [float(i)] * 10, "foo": i}
+    for i in range(5)
+]
+
+
+def predictor_factory(request) -> MeanPredictor:
+    return MeanPredictor(
+        prediction_length=prediction_length, freq="H", num_samples=2
+    )
+
+
+def call(app, method: str, path: str, body: bytes = b""):
+    async def run():
+        messages = [
+            {"type": "http.request", "body": body[:10], "more_body": True},
+            {"type": "http.request", "body": body[10:], "more_body": False},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await app(
+            {"type": "http", "method": method, "path": path}, receive, send
+        )
+        return sent
+
+    loop = asyncio.new_event_loop()
+    try:
+        sent = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert sent[0]["type"] == "http.response.start"
+    assert not sent[-1].get("more_body", False)
+    return sent[0]["status"], b"".join(message["body"] for message in sent[1:])
+
+
+def test_asgi_app():
+    app = make_async_app(predictor_factory, execution_params, None, Settings())
+
+    assert call(app, "GET", "/ping") == (200, b"")
+
+    status, body = call(app, "GET", "/execution-parameters")
+    assert status == 200
+    assert json.loads(body) == execution_params
+
+    request = {
+        "instances": instances,
+        "configuration": {"output_types": ["mean"], "quantiles": []},
+    }
+    status, body = call(
+        app, "POST", "/invocations", json.dumps(request).encode()
+    )
+    assert status == 200
+
+    predictions = json.loads(body)["predictions"]
+    assert len(predictions) == len(instances)
+    for instance, prediction in zip(instances, predictions):
+        assert np.allclose(prediction["mean"], instance["target"][0])
+
+    request["instances"] = []
+    status, body = call(
+        app, "POST", "/invocations", json.dumps(request).encode()
+    )
+    assert (status, json.loads(body)) == (200, {"predictions": []})
+
+    status, _ = call(app, "POST", "/invocations", b"{}")
+    assert status == 500
+
+
+def test_asgi_app_batch_transform():
+    config = ForecastConfig(output_types=["mean"], quantiles=[])
+    app = make_async_app(
+        predictor_factory,
+        execution_params,
+        config,
+        Settings(gluonts_forward_fields=["foo"]),
+    )
+
+    body = "\n".join(map(json.dumps, instances)).encode()
+    status, response = call(app, "POST", "/invocations", body)
+    assert status == 200
+
+    predictions = list(map(json.loads, response.decode().splitlines()))
+    assert len(predictions) == len(instances)
+    for instance, prediction in zip(instances, predictions):
+        assert prediction["foo"] == instance["foo"]
+        assert np.allclose(prediction["mean"], instance["target"][0])
@@ -11,8 +11,11 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import gc
 import json
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from distutils.util import strtobool
 from typing import ContextManager
 
@@ -21,14 +24,20 @@ import pytest
 
 from gluonts.core.component import equals
 from gluonts.dataset.common import FileDataset, ListDataset
+from gluonts.model.forecast import Config as ForecastConfig
 from gluonts.model.seq2seq import MQCNNEstimator
 from gluonts.model.trivial.mean import MeanPredictor
 from gluonts.shell.env import ServeEnv, TrainEnv
 from gluonts.shell.train import run_train_and_test
 
 try:
-    from gluonts.shell.serve import Settings
-    from gluonts.shell.serve.util import jsonify_floats
+    from gluonts.shell.serve import Settings, preload_predictor
+    from gluonts.shell.serve.app import make_app
+    from gluonts.shell.serve.batching import (
+        RequestBatcher,
+        make_request_batcher,
+    )
+    from gluonts.shell.serve.util import encode_json, jsonify_floats
     from gluonts.testutil import shell as testutil
 except ImportError:
     if sys.platform != "win32":
@@ -74,6 +83,41 @@ def static_server(
         yield server
 
 
+@pytest.fixture(scope="function")  # type: ignore
+def preload_server(
+    train_env: TrainEnv,
+) -> ContextManager["testutil.ServerFacade"]:
+    predictor = MeanPredictor.from_hyperparameters(**train_env.hyperparameters)
+    predictor.serialize(train_env.path.model)
+
+    serve_env = ServeEnv(train_env.path.base)
+    settings = Settings(
+        sagemaker_server_port=testutil.free_port(),
+        model_server_workers=2,
+        gluonts_preload=True,
+    )
+    with testutil.temporary_server(serve_env, None, settings) as server:
+        yield server
+
+
+@pytest.fixture(scope="function")  # type: ignore
+def batching_server(
+    train_env: TrainEnv,
+) -> ContextManager["testutil.ServerFacade"]:
+    predictor = MeanPredictor.from_hyperparameters(**train_env.hyperparameters)
+    predictor.serialize(train_env.path.model)
+
+    serve_env = ServeEnv(train_env.path.base)
+    settings = Settings(
+        sagemaker_server_port=testutil.free_port(),
+        model_server_workers=1,
+        gluonts_dynamic_batch_size=4,
+        gluonts_dynamic_batch_delay=0.1,
+    )
+    with testutil.temporary_server(serve_env, None, settings) as server:
+        yield server
+
+
 @pytest.fixture(scope="function")  # type: ignore
 def dynamic_server(
     train_env: TrainEnv,
@@ -174,6 +218,191 @@ def test_server_shell(
         assert equals(exp_samples, act_samples)
 
 
+@pytest.mark.parametrize("listify_dataset", ["yes"])
+def test_batching_server_shell(
+    train_env: TrainEnv, batching_server: "testutil.ServerFacade"
+) -> None:
+    configuration = {
+        "num_samples": 1,
+        "output_types": ["mean"],
+        "quantiles": [],
+    }
+    entries = list(train_env.datasets["train"])
+
+    with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+        forecasts = list(
+            executor.map(
+                lambda entry: batching_server.invocations(
+                    [entry], configuration
+                )[0],
+                entries,
+            )
+        )
+
+    for entry, forecast in zip(entries, forecasts):
+        assert equals(
+            np.array(forecast["mean"]),
+            np.mean(entry["target"]) * np.ones(shape=(prediction_length,)),
+        )
+
+
+@pytest.mark.parametrize("listify_dataset", ["yes"])
+def test_preload_server_shell(
+    train_env: TrainEnv, preload_server: "testutil.ServerFacade"
+) -> None:
+    configuration = {
+        "num_samples": 1,
+        "output_types": ["mean"],
+        "quantiles": [],
+    }
+
+    for entry in train_env.datasets["train"]:
+        forecast = preload_server.invocations([entry], configuration)[0]
+        assert equals(
+            np.array(forecast["mean"]),
+            np.mean(entry["target"]) * np.ones(shape=(prediction_length,)),
+        )
+
+
+def test_preload_predictor(caplog):
+    class FailingPredictor:
+        freq = "H"
+        prediction_length = 3
+
+        def predict(self, dataset, **kwargs):
+            raise ValueError("failed")
+
+    try:
+        predictor = RecordingPredictor(
+            MeanPredictor(prediction_length=3, freq="H")
+        )
+        predictor.prediction_length = 3
+        preload_predictor(predictor)
+        assert predictor.batch_sizes == [1]
+
+        with caplog.at_level(logging.WARNING):
+            preload_predictor(FailingPredictor())
+        assert "Could not warm up predictor" in caplog.text
+    finally:
+        gc.unfreeze()
+
+
+class RecordingPredictor:
+    def __init__(self, predictor) -> None:
+        self.predictor = predictor
+        self.freq = predictor.freq
+        self.batch_sizes = []
+
+    def predict(self, dataset, **kwargs):
+        self.batch_sizes.append(len(dataset))
+        return self.predictor.predict(dataset, **kwargs)
+
+
+def test_request_batcher():
+    predictor = RecordingPredictor(
+        MeanPredictor(prediction_length=3, freq="H", num_samples=2)
+    )
+    batcher = RequestBatcher(max_batch_size=4, max_delay=0.5)
+
+    requests = [
+        [
+            {"start": "2020-01-01", "target": [float(i)] * 5}
+            for _ in range(1 + i % 2)
+        ]
+        for i in range(6)
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        results = list(
+            executor.map(
+                lambda instances: batcher.predict(predictor, instances),
+                requests,
+            )
+        )
+
+    # every request gets the forecasts of its own instances
+    for i, (instances, forecasts) in enumerate(zip(requests, results)):
+        assert len(forecasts) == len(instances)
+        for forecast in forecasts:
+            assert np.allclose(forecast.mean, float(i))
+
+    assert sum(predictor.batch_sizes) == sum(map(len, requests))
+    assert max(predictor.batch_sizes) <= 4
+    assert len(predictor.batch_sizes) < len(requests)
+
+
+def test_request_batcher_error():
+    class FailingPredictor:
+        freq = "H"
+
+        def predict(self, dataset, **kwargs):
+            raise ValueError("failed")
+
+    batcher = RequestBatcher(max_batch_size=4, max_delay=0.0)
+    with pytest.raises(ValueError):
+        batcher.predict(
+            FailingPredictor(), [{"start": "2020-01-01", "target": [1.0]}]
+        )
+
+
+def test_make_request_batcher(caplog):
+    settings = Settings(gluonts_dynamic_batch_size=4)
+
+    assert isinstance(
+        make_request_batcher(settings, static_predictor=True), RequestBatcher
+    )
+    assert make_request_batcher(Settings(), static_predictor=True) is None
+
+    # a dynamic predictor factory creates a predictor per request, such
+    # that requests could never be combined
+    with caplog.at_level(logging.WARNING):
+        assert make_request_batcher(settings, static_predictor=False) is None
+    assert "GLUONTS_DYNAMIC_BATCH_SIZE" in caplog.text
+
+
+class FailingAfterFirstPredictor:
+    def __init__(self, predictor) -> None:
+        self.predictor = predictor
+        self.freq = predictor.freq
+        self.prediction_length = predictor.prediction_length
+
+    def predict(self, dataset, **kwargs):
+        forecasts = self.predictor.predict(dataset, **kwargs)
+        yield next(forecasts)
+        raise ValueError("failed")
+
+
+@pytest.mark.parametrize("suppress_errors", [True, False])
+def test_batch_invocations_later_error(suppress_errors):
+    predictor = FailingAfterFirstPredictor(
+        MeanPredictor(prediction_length=3, freq="H", num_samples=2)
+    )
+    app = make_app(
+        lambda request: predictor,
+        execution_params={},
+        batch_transform_config=ForecastConfig(output_types=["mean"]),
+        settings=Settings(gluonts_batch_suppress_errors=suppress_errors),
+    )
+    data = "\n".join(
+        json.dumps({"start": "2020-01-01", "target": [float(i)] * 5})
+        for i in range(3)
+    )
+
+    with app.test_client() as client:
+        if not suppress_errors:
+            # the error aborts the response instead of truncating it
+            with pytest.raises(ValueError):
+                client.post("/invocations", data=data).get_data()
+            return
+
+        response = client.post("/invocations", data=data)
+        lines = response.get_data(as_text=True).split("\n")
+
+    assert len(lines) == 2
+    assert json.loads(lines[0])["mean"] == [0.0] * 3
+    assert "ValueError: failed" in json.loads(lines[1])["error"]
+
+
 @pytest.mark.parametrize("listify_dataset", ["yes", "no"])
 def test_dynamic_shell(
     train_env: TrainEnv, dynamic_server: "testutil.ServerFacade", caplog
@@ -277,3 +506,21 @@ def test_as_json_dict_outputs_valid_json():
 
     output_json = jsonify_floats(non_compliant_json)
     json.dumps(output_json, allow_nan=False)
+
+
+def test_encode_json():
+    prediction = {
+        "mean": np.array([1.5, 2.5], dtype=np.float32),
+        "quantiles": {"0.5": np.array([np.nan, np.inf, 1.0])},
+        "samples": np.arange(6.0).reshape(2, 3),
+        "item_id": "a",
+        "foo": float("nan"),
+    }
+
+    assert json.loads(encode_json(prediction)) == {
+        "mean": [1.5, 2.5],
+        "quantiles": {"0.5": ["NaN", "Infinity", 1.0]},
+        "samples": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]],
+        "item_id": "a",
+        "foo": "NaN",
+    }
@@ -0,0 +1,114 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from gluonts.core.component import validated
+from gluonts.dataset.common import ListDataset
+from gluonts.model.forecast import Config as ForecastConfig
+from gluonts.model.forecast import SampleForecast
+from gluonts.model.predictor import RepresentablePredictor
+from gluonts.support.pandas import forecast_start
+
+try:
+    from gluonts.shell.serve import Settings
+    from gluonts.shell.serve.app import (
+        make_predictions_with_timeout,
+        make_timeout_pool,
+    )
+    from gluonts.shell.serve.watchdog import WatchdogPool
+except ImportError:
+    if sys.platform != "win32":
+        raise
+
+    pytestmark = pytest.mark.skip
+
+
+def slow_square(items):
+    for item in items:
+        if item < 0:
+            time.sleep(60)
+        elif item == 0:
+            raise ValueError("zero")
+        yield os.getpid(), item ** 2
+
+
+def test_watchdog_pool():
+    pool = WatchdogPool(slow_square, num_workers=2)
+
+    results = pool.map([1, 2, 3, 4], timeout=30)
+    assert [square for _, square in results] == [1, 4, 9, 16]
+    pids = {pid for pid, _ in results}
+    assert len(pids) == 2
+
+    # the first worker fails, the second one times out on its second item
+    start = time.time()
+    results = pool.map([1, 0, 3, -1], timeout=1)
+    assert time.time() - start < 10
+    assert results[1] is None and results[3] is None
+    assert [results[0][1], results[2][1]] == [1, 9]
+
+    # the worker which timed out was replaced, the one that failed is reused
+    results = pool.map([1, 2, 3, 4], timeout=30)
+    assert [square for _, square in results] == [1, 4, 9, 16]
+    assert results[0][0] in pids
+    assert results[2][0] not in pids
+
+    assert pool.map([], timeout=1) == []
+
+
+class SlowPredictor(RepresentablePredictor):
+    @validated()
+    def __init__(self, prediction_length: int, freq: str) -> None:
+        super().__init__(prediction_length=prediction_length, freq=freq)
+
+    def predict_item(self, item):
+        last = item["target"][-1]
+        if last < 0:
+            time.sleep(60)
+        return SampleForecast(
+            samples=np.full((1, self.prediction_length), last),
+            start_date=forecast_start(item),
+            freq=self.freq,
+        )
+
+
+def test_make_predictions_with_timeout():
+    settings = Settings(
+        gluonts_batch_timeout=2, gluonts_batch_timeout_workers=3
+    )
+    configuration = ForecastConfig(output_types=["mean"], quantiles=[])
+    predictor = SlowPredictor(prediction_length=2, freq="H")
+    pool = make_timeout_pool(predictor, configuration, settings)
+
+    instances = [
+        {"start": "2020-01-01", "target": [1.0, 1.0, last]}
+        for last in [2.0, -1.0, 3.0]
+    ]
+    request_data = "\n".join(map(json.dumps, instances))
+    dataset = ListDataset(instances, freq="H")
+
+    predictions = make_predictions_with_timeout(
+        pool, predictor, dataset, configuration, settings, request_data
+    )
+
+    # only the item which timed out is predicted by the fallback predictor
+    assert np.allclose(predictions[0]["mean"], 2.0)
+    assert np.allclose(predictions[1]["mean"], 1.0 / 3, atol=0.5)
+    assert np.allclose(predictions[2]["mean"], 3.0)
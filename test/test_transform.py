@@ -11,6 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import itertools
 from typing import Tuple, List
 
 import mxnet as mx
@@ -23,6 +24,7 @@ import gluonts
 import gluonts.mx.component
 from gluonts import time_feature, transform
 from gluonts.core import fqname_for
+from gluonts.core.exception import GluonTSDataError
 from gluonts.core.serde import dump_code, dump_json, load_code, load_json
 from gluonts.dataset.common import DataEntry, ListDataset, ProcessStartField
 from gluonts.dataset.field_names import FieldName
@@ -161,6 +163,98 @@ def test_AddTimeFeatures(start, target, is_train: bool):
     assert np.alltrue(mat[1] == time_feature.DayOfMonth()(tmp_idx))
 
 
+@pytest.mark.parametrize("freq", ["H", "2H", "D", "W", "M", "B"])
+def test_AddTimeFeatures_precompute(monkeypatch, tmp_path, freq: str):
+    monkeypatch.setattr(transform.feature, "_TIME_FEATURE_TABLES", {})
+
+    def make_transformation():
+        return transform.AddTimeFeatures(
+            start_field=FieldName.START,
+            target_field=FieldName.TARGET,
+            output_field="myout",
+            pred_length=5,
+            time_features=time_feature.time_features_from_frequency_str(freq),
+        )
+
+    first = pd.Timestamp(
+        pd.date_range("2015-01-01", periods=1, freq=freq)[0], freq=freq
+    )
+    data = [
+        {"start": first + k * first.freq, "target": np.ones(10 * k + 1)}
+        for k in [3, 0, 7]
+    ]
+    path = tmp_path / "time_features.npz"
+
+    table = make_transformation().precompute(data, path)
+    assert path.exists()
+    assert len(table.timestamps) == 7 + 71 + 5 + 1
+
+    # another instance, e.g. in a forked worker, uses the same table
+    t = make_transformation()
+    for entry, is_train in itertools.product(data, [True, False]):
+        expected_length = len(entry["target"]) + (0 if is_train else 5)
+        res = t.map_transform(entry.copy(), is_train=is_train)
+        expected = np.vstack(
+            [
+                feat(
+                    pd.date_range(
+                        entry["start"], periods=expected_length, freq=freq
+                    )
+                )
+                for feat in t.date_features
+            ]
+        ).astype(np.float32)
+        np.testing.assert_array_equal(res["myout"], expected)
+        assert np.shares_memory(res["myout"], table.values)
+    assert t._table is None
+
+    # series outside of the table fall back to the instance's own table
+    late = {"start": first + 100 * first.freq, "target": np.ones(3)}
+    res = t.map_transform(late, is_train=True)
+    assert res["myout"].shape[-1] == 3
+    assert t._table is not None
+
+    # series starting off the grid of both tables get their own features
+    off_grid = pd.Timestamp(
+        late["start"] + pd.Timedelta(minutes=30), freq=first.freq
+    )
+    res = t.map_transform(
+        {"start": off_grid, "target": np.ones(3)}, is_train=True
+    )
+    expected = np.vstack(
+        [
+            feat(pd.date_range(off_grid, periods=3, freq=freq))
+            for feat in t.date_features
+        ]
+    ).astype(np.float32)
+    np.testing.assert_array_equal(res["myout"], expected)
+
+    # the stored table is loaded if it matches the data
+    monkeypatch.setattr(transform.feature, "_TIME_FEATURE_TABLES", {})
+    loaded = make_transformation().precompute(data[1:], path)
+    np.testing.assert_array_equal(loaded.values, table.values)
+    np.testing.assert_array_equal(loaded.timestamps, table.timestamps)
+    assert loaded.freq == table.freq
+
+    # stale tables are rejected
+    other_freq = "3D" if freq != "3D" else "H"
+    for stale_data in [
+        [],
+        data + [late],
+        [
+            {
+                "start": pd.Timestamp(first, freq=other_freq),
+                "target": np.ones(3),
+            }
+        ],
+    ]:
+        with pytest.raises(GluonTSDataError):
+            make_transformation().precompute(stale_data, path)
+    assert transform.feature._TIME_FEATURE_TABLES.keys() == {
+        make_transformation()._table_key(table.freq)
+    }
+
+
 @pytest.mark.parametrize("is_train", TEST_VALUES["is_train"])
 @pytest.mark.parametrize("target", TEST_VALUES["target"])
 @pytest.mark.parametrize("start", TEST_VALUES["start"])
@@ -290,6 +384,77 @@ def test_InstanceSplitter(
     # assert np.alltrue(out['age'] == np.log10(2.0 + np.arange(expected_length)))
 
 
+@pytest.mark.parametrize("output_NTC", [True, False])
+def test_InstanceSplitter_split_block(output_NTC: bool):
+    t = transform.InstanceSplitter(
+        target_field=FieldName.TARGET,
+        is_pad_field=FieldName.IS_PAD,
+        start_field=FieldName.START,
+        forecast_start_field=FieldName.FORECAST_START,
+        instance_sampler=transform.UniformSplitSampler(p=1.0),
+        past_length=3,
+        future_length=2,
+        lead_time=1,
+        output_NTC=output_NTC,
+        time_series_fields=["some_time_feature"],
+        dummy_value=-1.0,
+    )
+
+    start = pd.Timestamp("2020-01-01", freq="D")
+    target = np.arange(20.0).reshape(2, 10)
+    data = {
+        "start": start,
+        "target": target,
+        "some_time_feature": np.arange(12.0),
+        "some_other_col": "ABC",
+    }
+
+    block = t.split_block(data, np.array([1, 5, 8]))
+
+    assert "target" not in block and "some_time_feature" not in block
+    assert block["some_other_col"] == "ABC"
+
+    past_target = block["past_target"]
+    if output_NTC:
+        past_target = past_target.transpose(0, 2, 1)
+    np.testing.assert_array_equal(
+        past_target,
+        [
+            [[-1, -1, 0], [-1, -1, 10]],
+            [[2, 3, 4], [12, 13, 14]],
+            [[5, 6, 7], [15, 16, 17]],
+        ],
+    )
+    np.testing.assert_array_equal(
+        block["future_some_time_feature"], [[2, 3], [6, 7], [9, 10]]
+    )
+    np.testing.assert_array_equal(
+        block["past_is_pad"], [[1, 1, 0], [0, 0, 0], [0, 0, 0]]
+    )
+    assert block["forecast_start"] == [
+        start + 2 * start.freq,
+        start + 6 * start.freq,
+        start + 9 * start.freq,
+    ]
+
+    # the last future window is cut short by the end of the target
+    assert [
+        piece.shape[-1 if not output_NTC else 0]
+        for piece in block["future_target"]
+    ] == [2, 2, 1]
+
+    # the instances are the rows of the block
+    instances = list(t.flatmap_transform(data, is_train=True))
+    assert len(instances) == 11
+    for i, instance in enumerate(instances):
+        row = t.split_block(data, np.array([i]))
+        for field in ["past_target", "future_target", "past_is_pad"]:
+            np.testing.assert_array_equal(instance[field], row[field][0])
+        # instances don't hold on to the block
+        assert instance["past_target"].base is None
+        assert instance["past_is_pad"].base is None
+
+
 @pytest.mark.parametrize("is_train", TEST_VALUES["is_train"])
 @pytest.mark.parametrize("target", TEST_VALUES["target"])
 @pytest.mark.parametrize("start", TEST_VALUES["start"])